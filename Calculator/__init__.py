@@ -2,24 +2,98 @@
 
 # calculator 패키지에서 사용될 클래스 및 함수들을 정의하고 외부로 노출하는 초기화 파일입니다.
 
-# 각 모듈에서 필요한 클래스와 함수들을 import하여 패키지 사용자들이 쉽게 접근할 수 있도록 설정합니다.
+# 각 모듈의 클래스와 함수들은 패키지를 import할 때 한꺼번에 가져오지 않고, 처음 사용할 때 가져옵니다 (지연 로딩).
+# 예를 들어 `from calculator import Calculator`는 basic 모듈(과 utils 모듈)만 가져오므로,
+# 짧게 실행되는 명령행 도구나 서버리스 호출에서 사용하지 않는 모듈의 import 비용을 내지 않습니다.
+# NumPy 같은 선택적 가속 백엔드도 배열 연산을 처음 호출할 때 가져옵니다 (utils.get_numpy).
 
-from .basic import Calculator
-# basic 모듈에서 Calculator 클래스를 가져옵니다.
-# 이 클래스는 기본적인 산술 연산을 수행하는 계산기 기능을 제공합니다.
+import importlib
 
-from .engineering import EngineeringCalculator
-# engineering 모듈에서 EngineeringCalculator 클래스를 가져옵니다.
-# 이 클래스는 Calculator 클래스를 상속받아 추가적인 공학 계산 기능(삼각함수, 로그 등)을 제공합니다.
+# typing 모듈을 가져오는 비용도 줄이기 위해 직접 정의합니다 (타입 검사기는 이 이름을 True로 취급).
+TYPE_CHECKING = False
 
-from .complex_cal import ComplexCalculator
-# complex_cal 모듈에서 ComplexCalculator 클래스를 가져옵니다.
-# 이 클래스는 복소수 연산을 처리하는 기능을 제공합니다.
+# 외부로 노출하는 이름 -> 정의된 하위 모듈
+_LAZY_ATTRIBUTES = {
+    # basic 모듈의 Calculator 클래스: 기본적인 산술 연산을 수행하는 계산기 기능을 제공합니다.
+    'Calculator': 'basic',
+    # engineering 모듈의 EngineeringCalculator 클래스: Calculator 클래스를 상속받아
+    # 추가적인 공학 계산 기능(삼각함수, 로그 등)을 제공합니다.
+    'EngineeringCalculator': 'engineering',
+    # complex_cal 모듈의 ComplexCalculator 클래스: 복소수 연산을 처리하는 기능을 제공합니다.
+    'ComplexCalculator': 'complex_cal',
+    # complex_vector 모듈의 ComplexVector 클래스: NumPy 없이 실수부/허수부를 array('d')에 저장하여
+    # 복소수 여러 개를 원소별로 한 번에 계산합니다.
+    'ComplexVector': 'complex_vector',
+    # utils 모듈의 round_result 함수는 계산 결과를 지정된 소수점 자릿수로 반올림하는 기능을 제공하며,
+    # convert_to_radians 함수는 각도를 라디안으로 변환하는 유틸리티 함수입니다.
+    'round_result': 'utils',
+    'convert_to_radians': 'utils',
+    # expression 모듈의 ExpressionEngine은 "sin(x, degree) * log(y)" 같은 수식 문자열을 한 번 컴파일하여
+    # LRU 캐시에 보관하고, CompiledExpression은 컴파일된 수식을 스칼라 또는 배열(batch) 변수 값으로 평가합니다.
+    'ExpressionEngine': 'expression',
+    'CompiledExpression': 'expression',
+    # trig_table 모듈의 DegreeTrigTable 클래스: degree 단위 삼각함수를 미리 계산된 표로 빠르게 계산합니다
+    # (EngineeringCalculator.enable_trig_table).
+    'DegreeTrigTable': 'trig_table',
+    # frozen 모듈의 FrozenCalculator 클래스: precision, return_float, 각도 단위를 고정하여
+    # 호출마다의 설정 확인 없이 계산합니다 (EngineeringCalculator.freeze).
+    'FrozenCalculator': 'frozen',
+    # registry 모듈의 OperationRegistry 클래스: 연산 이름('add', 'sin' 등)으로 계산기 메서드를
+    # 미리 찾아 둔 함수로 바로 호출합니다 (evaluate, evaluate_many).
+    'OperationRegistry': 'registry',
+    # lazy 모듈의 LazyCalculator 클래스: 메서드와 연산자로 지연 계산 그래프를 만들고, 공통 부분식을 한 번만 계산하며
+    # 반올림은 마지막에 한 번만 적용합니다 (EngineeringCalculator.lazy).
+    'LazyCalculator': 'lazy',
+    # polynomial 모듈의 Polynomial 클래스: 실수/복소수 계수 다항식을 여러 점에서 한 번에 계산합니다
+    # (Horner, 차수가 높으면 Estrin 방식).
+    'Polynomial': 'polynomial',
+    # window 모듈의 SlidingWindow 클래스: 최근 N개 값의 합, 곱, 평균, 분산을 값을 넣고 뺄 때마다 O(1)로 갱신합니다.
+    'SlidingWindow': 'window',
+    # persistent_cache 모듈의 PersistentCache 클래스: 계산 결과를 SQLite 파일에 저장하여 여러 프로세스와
+    # 다시 시작한 프로세스가 재사용하는 결과 캐시입니다 (enable_cache의 path 인자).
+    'PersistentCache': 'persistent_cache',
+    # roots 모듈의 RootFinder 클래스: 서로 독립인 방정식 여러 개를 Newton, 할선, 이분법, Brent 방식으로
+    # 배열 연산을 사용해 한 번에 풀고 원소별 수렴 상태를 반환합니다.
+    'RootFinder': 'roots',
+}
+
+# 정적 분석 도구(타입 검사기, IDE 자동 완성)를 위한 import. 실행 시에는 가져오지 않습니다.
+if TYPE_CHECKING:
+    from .basic import Calculator
+    from .engineering import EngineeringCalculator
+    from .complex_cal import ComplexCalculator
+    from .complex_vector import ComplexVector
+    from .utils import round_result, convert_to_radians
+    from .expression import ExpressionEngine, CompiledExpression
+    from .trig_table import DegreeTrigTable
+    from .frozen import FrozenCalculator
+    from .registry import OperationRegistry
+    from .lazy import LazyCalculator
+    from .polynomial import Polynomial
+    from .window import SlidingWindow
+    from .persistent_cache import PersistentCache
+    from .roots import RootFinder
+
+
+def __getattr__(name: str):
+    """
+    패키지에 아직 없는 이름을 처음 조회할 때 호출되는 함수 (PEP 562).
+    이름이 정의된 하위 모듈을 가져와 값을 패키지에 저장하므로, 다음 조회부터는 이 함수를 거치지 않습니다.
+
+    Raises:
+        AttributeError: 노출하는 이름이 아닐 경우 발생.
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
-from .utils import round_result, convert_to_radians
-# utils 모듈에서 round_result 함수와 convert_to_radians 함수를 가져옵니다.
-# round_result 함수는 계산 결과를 지정된 소수점 자릿수로 반올림하는 기능을 제공하며,
-# convert_to_radians 함수는 각도를 라디안으로 변환하는 유틸리티 함수입니다.
 
 # __all__ 변수를 정의하여 패키지 외부에서 import * 를 사용할 때 노출될 이름들을 명시합니다.
 # 즉, 사용자가 `from calculator import *` 구문을 사용할 때 아래에 정의된 클래스와 함수들만 노출됩니다.
@@ -28,6 +102,17 @@ __all__ = [
     'Calculator',  # 기본적인 계산기 클래스
     'EngineeringCalculator',  # 공학용 계산기 클래스
     'ComplexCalculator',  # 복소수 계산기 클래스
+    'ComplexVector',  # 표준 라이브러리 복소수 벡터 클래스
     'round_result',  # 계산 결과를 반올림하는 유틸리티 함수
-    'convert_to_radians'  # 각도를 라디안으로 변환하는 유틸리티 함수
+    'convert_to_radians',  # 각도를 라디안으로 변환하는 유틸리티 함수
+    'ExpressionEngine',  # 수식 문자열을 컴파일하고 평가하는 클래스
+    'CompiledExpression',  # 컴파일된 수식 클래스
+    'DegreeTrigTable',  # degree 삼각함수 표 클래스
+    'FrozenCalculator',  # 설정이 고정된 계산기 클래스
+    'OperationRegistry',  # 연산 이름 기반 호출 레지스트리 클래스
+    'LazyCalculator',  # 지연 계산 그래프 계산기 클래스
+    'Polynomial',  # 다항식 계산 클래스
+    'SlidingWindow',  # 슬라이딩 윈도우 누적 계산 클래스
+    'PersistentCache',  # 프로세스 간 공유 파일 결과 캐시 클래스
+    'RootFinder'  # 배열 단위 방정식 근 찾기 클래스
 ]
@@ -0,0 +1,10 @@
+# calculator/__main__.py
+
+# python -m calculator 로 실행할 때의 진입점입니다.
+# CSV/JSONL 연산 파일 또는 표준 입력을 묶음 단위로 계산하는 명령행 도구(cli.main)를 실행합니다.
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
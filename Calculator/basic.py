@@ -1,7 +1,103 @@
 # calculator/basic.py
 
-from typing import Optional, Union
-from .utils import round_result
+import math
+import operator
+from functools import reduce
+from itertools import chain
+from typing import Iterable, Iterator, Optional, Sequence, Union
+from .utils import round_result, round_array, get_numpy
+
+# 스트리밍 덧셈에서 사용할 수 있는 합산 방식
+SUM_METHODS = ('neumaier', 'fsum', 'naive')
+
+def _stream_values(iterable: Iterable, chunked: bool) -> Iterator:
+    """
+    스트리밍 연산 메서드들이 공유하는 내부 함수.
+    chunked가 True이면 묶음(list, tuple, NumPy 배열 등)들을 하나씩 펼쳐서 값 하나씩 돌려줍니다.
+    한 번에 묶음 하나만 메모리에 유지되며, NumPy 배열은 tolist()로 Python 숫자로 바꿉니다.
+    """
+    if not chunked:
+        return iter(iterable)
+    return chain.from_iterable(chunk.tolist() if hasattr(chunk, 'tolist') else chunk for chunk in iterable)
+
+def _neumaier_sum(values: Iterator) -> Union[int, float]:
+    """
+    Neumaier 보정 합산을 수행하는 내부 함수.
+    정수는 별도로 정확하게 더하므로, 모든 값이 정수이면 정확한 int를 반환합니다.
+    실수 합이 inf/nan이 되면 보정값은 의미가 없으므로 add와 같이 보정 없는 합을 반환합니다.
+    """
+    integer = 0  # 정수 값들의 정확한 합
+    total = 0.0  # 실수 값들의 합
+    compensation = 0.0  # 실수 합에서 잃어버린 하위 자릿수
+    has_float = False
+    for value in values:
+        if type(value) is int:
+            integer += value
+            continue
+        has_float = True
+        t = total + value
+        if abs(total) >= abs(value):
+            compensation += (total - t) + value
+        else:
+            compensation += (value - t) + total
+        total = t
+    if not has_float:
+        return integer
+    if not math.isfinite(total):
+        return integer + total
+    return math.fsum((integer, total, compensation))
+
+def _stream_sum(values: Iterator, method: str) -> Union[int, float]:
+    """
+    method에 따라 스트리밍 합을 계산하는 내부 함수.
+    """
+    if method == 'neumaier':
+        return _neumaier_sum(values)
+    if method == 'fsum':
+        return math.fsum(values)  # 정확히 반올림된 합 (항상 float)
+    if method == 'naive':
+        return sum(values)
+    raise ValueError(f"Unknown sum method: {method!r}. Use one of {SUM_METHODS}.")
+
+def _first(values: Iterator, name: str) -> Union[int, float]:
+    """
+    스트림의 첫 번째 값을 꺼내는 내부 함수. 값이 없으면 ValueError를 발생시킵니다.
+    """
+    for value in values:
+        return value
+    raise ValueError(f"{name} requires at least one value.")
+
+def _reduce_arrays(ufunc, arrays: tuple, axis: Optional[int]):
+    """
+    배열 연산 메서드들이 공유하는 내부 함수.
+    axis가 None이면 여러 배열을 원소별(element-wise)로 차례대로 연산하고,
+    axis가 지정되면 하나의 배열을 해당 축을 따라(row-wise 등) 한 번에 축약합니다.
+    """
+    np = get_numpy()
+    if not arrays:
+        raise TypeError("At least one array is required.")
+    if axis is not None:
+        if len(arrays) != 1:
+            raise TypeError("axis can only be used with a single array.")
+        return ufunc.reduce(np.asarray(arrays[0]), axis=axis)
+    result = np.asarray(arrays[0])
+    for array in arrays[1:]:
+        result = ufunc(result, np.asarray(array))  # 배열 단위로 한 번에 연산
+    return result
+
+def _zero_division_mask(arrays: tuple, axis: Optional[int], shape: tuple):
+    """
+    배열 나눗셈에서 0으로 나눈 원소의 위치를 결과 배열과 같은 모양의 boolean 배열로 반환하는 내부 함수.
+    원소별 나눗셈은 두 번째 이후 배열 중 하나라도 0인 위치, axis 나눗셈은 축을 따라 두 번째 이후 값 중 0이 있는 위치입니다.
+    """
+    np = get_numpy()
+    if axis is not None:
+        divisors = np.moveaxis(np.asarray(arrays[0]), axis, 0)[1:]
+        return np.broadcast_to((divisors == 0).any(axis=0), shape).copy()
+    mask = np.zeros(shape, dtype=bool)
+    for divisor in arrays[1:]:
+        np.logical_or(mask, np.asarray(divisor) == 0, out=mask)
+    return mask
 
 class Calculator:
     """
@@ -79,3 +175,175 @@ class Calculator:
             return round_result(result, precision)  # precision에 맞춰 결과를 반올림하여 반환
         except ZeroDivisionError:
             return "Error: Division by zero is not allowed."  # 0으로 나누는 경우 에러 메시지 반환
+
+    # ---- 배열(batch) 연산 ----
+    # 아래 메서드들은 NumPy 배열이나 일반 시퀀스를 받아 Python 반복문 없이 한 번에 연산합니다.
+    # 정수 배열은 정수 dtype을 유지하며(가능한 경우 int), precision은 마지막에 한 번만 적용됩니다.
+
+    def add_array(self, *arrays: Sequence, axis: Optional[int] = None, precision: Optional[int] = None):
+        """
+        배열 덧셈 연산을 수행하는 메서드.
+
+        Args:
+            *arrays (Sequence): 원소별로 더할 배열들. axis를 지정하면 배열 하나만 받습니다.
+            axis (Optional[int], optional): 지정하면 해당 축을 따라 합을 계산 (예: axis=1은 행별 합).
+            precision (Optional[int], optional): 소수점 자릿수를 지정할 수 있는 옵션. 기본값은 None.
+
+        Returns:
+            numpy.ndarray: 덧셈 결과 배열.
+        """
+        result = _reduce_arrays(get_numpy().add, arrays, axis)
+        return round_array(result, precision)
+
+    def subtract_array(self, *arrays: Sequence, axis: Optional[int] = None, precision: Optional[int] = None):
+        """
+        배열 뺄셈 연산을 수행하는 메서드.
+
+        Args:
+            *arrays (Sequence): 첫 번째 배열에서 나머지 배열들을 원소별로 차례대로 뺍니다.
+                                axis를 지정하면 배열 하나만 받습니다.
+            axis (Optional[int], optional): 지정하면 해당 축을 따라 차례대로 뺄셈 (예: axis=1은 행별 연산).
+            precision (Optional[int], optional): 소수점 자릿수를 지정할 수 있는 옵션. 기본값은 None.
+
+        Returns:
+            numpy.ndarray: 뺄셈 결과 배열.
+        """
+        result = _reduce_arrays(get_numpy().subtract, arrays, axis)
+        return round_array(result, precision)
+
+    def multiply_array(self, *arrays: Sequence, axis: Optional[int] = None, precision: Optional[int] = None):
+        """
+        배열 곱셈 연산을 수행하는 메서드.
+
+        Args:
+            *arrays (Sequence): 원소별로 곱할 배열들. axis를 지정하면 배열 하나만 받습니다.
+            axis (Optional[int], optional): 지정하면 해당 축을 따라 곱을 계산 (예: axis=1은 행별 곱).
+            precision (Optional[int], optional): 소수점 자릿수를 지정할 수 있는 옵션. 기본값은 None.
+
+        Returns:
+            numpy.ndarray: 곱셈 결과 배열.
+        """
+        result = _reduce_arrays(get_numpy().multiply, arrays, axis)
+        return round_array(result, precision)
+
+    def divide_array(self, *arrays: Sequence, axis: Optional[int] = None, precision: Optional[int] = None,
+                     fill: Optional[float] = None, return_mask: bool = False):
+        """
+        배열 나눗셈 연산을 수행하는 메서드.
+        0으로 나누는 원소는 예외 대신 IEEE 754 규칙에 따라 inf 또는 nan이 됩니다.
+        divide 메서드처럼 원소마다 에러 메시지 문자열을 만들지 않으므로 결과는 항상 숫자 배열이며,
+        0으로 나눈 위치는 fill 값으로 바꾸거나 return_mask로 따로 받을 수 있습니다 (원소별 예외 처리나 분기 없음).
+
+        Args:
+            *arrays (Sequence): 첫 번째 배열을 나머지 배열들로 원소별로 차례대로 나눕니다.
+                                axis를 지정하면 배열 하나만 받습니다.
+            axis (Optional[int], optional): 지정하면 해당 축을 따라 차례대로 나눗셈 (예: axis=1은 행별 연산).
+            precision (Optional[int], optional): 소수점 자릿수를 지정할 수 있는 옵션. 기본값은 None.
+            fill (Optional[float], optional): 0으로 나눈 원소에 넣을 값 (예: 0.0, nan). None이면 inf/nan을 그대로 둡니다.
+            return_mask (bool, optional): True이면 0으로 나눈 위치를 나타내는 boolean 배열을 함께 반환합니다.
+
+        Returns:
+            numpy.ndarray: 나눗셈 결과 배열 (항상 float).
+                return_mask=True이면 (결과 배열, 0으로 나눈 위치의 boolean 배열).
+        """
+        np = get_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = round_array(_reduce_arrays(np.true_divide, arrays, axis), precision)
+        if fill is None and not return_mask:
+            return result
+        mask = _zero_division_mask(arrays, axis, result.shape)
+        if fill is not None:
+            result = np.where(mask, fill, result)
+        return (result, mask) if return_mask else result
+
+    # ---- 스트리밍(iterable) 연산 ----
+    # 아래 메서드들은 값을 가변 인자로 풀지 않고 iterable(제너레이터 포함)에서 하나씩 읽어 일정한 메모리로 계산합니다.
+    # chunked=True이면 iterable이 묶음(list, NumPy 배열 등)을 돌려준다고 보고 묶음 단위로 읽습니다.
+    # precision은 마지막 결과에 한 번만 적용됩니다.
+
+    def add_stream(self, iterable: Iterable, precision: Optional[int] = None, method: str = 'neumaier',
+                   chunked: bool = False) -> Union[int, float]:
+        """
+        스트리밍 덧셈 연산을 수행하는 메서드.
+
+        Args:
+            iterable (Iterable): 더할 숫자들 (chunked=True이면 숫자 묶음들).
+            precision (Optional[int], optional): 소수점 자릿수를 지정할 수 있는 옵션. 기본값은 None.
+            method (str, optional): 합산 방식. 기본값은 'neumaier'.
+                - 'neumaier': Neumaier 보정 합산. 모든 값이 정수이면 정확한 int를 반환.
+                - 'fsum': math.fsum으로 정확히 반올림된 합을 계산 (항상 float, 가장 빠르고 정확).
+                - 'naive': 보정 없이 차례대로 더함 (add와 같은 결과).
+            chunked (bool, optional): iterable이 숫자 묶음들을 돌려주는지 여부. 기본값은 False.
+
+        Returns:
+            Union[int, float]: 덧셈 결과.
+        """
+        result = _stream_sum(_stream_values(iterable, chunked), method)
+        return round_result(result, precision)
+
+    def subtract_stream(self, iterable: Iterable, precision: Optional[int] = None, method: str = 'neumaier',
+                        chunked: bool = False) -> Union[int, float]:
+        """
+        스트리밍 뺄셈 연산을 수행하는 메서드. 첫 번째 값에서 나머지 값들의 (보정) 합을 뺍니다.
+
+        Args:
+            iterable (Iterable): 첫 번째 값과 뺄 숫자들 (chunked=True이면 숫자 묶음들).
+            precision (Optional[int], optional): 소수점 자릿수를 지정할 수 있는 옵션. 기본값은 None.
+            method (str, optional): 나머지 값들의 합산 방식 (add_stream 참고). 기본값은 'neumaier'.
+            chunked (bool, optional): iterable이 숫자 묶음들을 돌려주는지 여부. 기본값은 False.
+
+        Returns:
+            Union[int, float]: 뺄셈 결과.
+
+        Raises:
+            ValueError: iterable이 비어 있을 경우 발생.
+        """
+        values = _stream_values(iterable, chunked)
+        first = _first(values, 'subtract_stream')
+        result = first - _stream_sum(values, method)
+        return round_result(result, precision)
+
+    def multiply_stream(self, iterable: Iterable, precision: Optional[int] = None,
+                        chunked: bool = False) -> Union[int, float]:
+        """
+        스트리밍 곱셈 연산을 수행하는 메서드. math.prod로 왼쪽부터 차례대로 곱합니다.
+
+        Args:
+            iterable (Iterable): 곱할 숫자들 (chunked=True이면 숫자 묶음들).
+            precision (Optional[int], optional): 소수점 자릿수를 지정할 수 있는 옵션. 기본값은 None.
+            chunked (bool, optional): iterable이 숫자 묶음들을 돌려주는지 여부. 기본값은 False.
+
+        Returns:
+            Union[int, float]: 곱셈 결과.
+
+        Raises:
+            ValueError: iterable이 비어 있을 경우 발생.
+        """
+        values = _stream_values(iterable, chunked)
+        first = _first(values, 'multiply_stream')
+        result = math.prod(values, start=first)
+        return round_result(result, precision)
+
+    def divide_stream(self, iterable: Iterable, precision: Optional[int] = None,
+                      chunked: bool = False) -> Union[int, float, str]:
+        """
+        스트리밍 나눗셈 연산을 수행하는 메서드. divide와 같이 첫 번째 값을 나머지 값들로 차례대로 나눕니다.
+
+        Args:
+            iterable (Iterable): 첫 번째 값과 나눌 숫자들 (chunked=True이면 숫자 묶음들).
+            precision (Optional[int], optional): 소수점 자릿수를 지정할 수 있는 옵션. 기본값은 None.
+            chunked (bool, optional): iterable이 숫자 묶음들을 돌려주는지 여부. 기본값은 False.
+
+        Returns:
+            Union[int, float, str]: 나눗셈 결과. 0으로 나누는 경우 에러 메시지를 반환합니다.
+
+        Raises:
+            ValueError: iterable이 비어 있을 경우 발생.
+        """
+        values = _stream_values(iterable, chunked)
+        first = _first(values, 'divide_stream')
+        try:
+            result = reduce(operator.truediv, values, first)  # 차례대로 나눗셈 연산 (C 수준 반복)
+        except ZeroDivisionError:
+            return "Error: Division by zero is not allowed."
+        return round_result(result, precision)
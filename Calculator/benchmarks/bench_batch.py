@@ -0,0 +1,51 @@
+# benchmarks/bench_batch.py
+# Calculator의 스칼라 메서드 반복 호출과 배열(batch) 메서드의 처리량을 비교하는 벤치마크입니다.
+# 실행: python benchmarks/bench_batch.py [행 수]
+
+import sys
+import time
+
+import numpy as np
+
+from calculator import Calculator
+
+
+def main(rows: int = 1_000_000) -> None:
+    calc = Calculator()
+    rng = np.random.default_rng(0)
+    a = rng.random(rows)
+    b = rng.random(rows) + 1.0
+    a_list, b_list = a.tolist(), b.tolist()
+
+    for name in ('add', 'subtract', 'multiply', 'divide'):
+        scalar = getattr(calc, name)
+        batch = getattr(calc, name + '_array')
+
+        start = time.perf_counter()
+        [scalar(x, y, precision=6) for x, y in zip(a_list, b_list)]
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch(a, b, precision=6)
+        batch_time = time.perf_counter() - start
+
+        print(f"{name:>8}: loop {rows / loop_time:>14,.0f} rows/s | "
+              f"batch {rows / batch_time:>14,.0f} rows/s | x{loop_time / batch_time:,.1f}")
+
+    # 0이 섞인 연속 나눗셈: 스칼라 결과의 에러 메시지 확인과 배열 나눗셈의 에러 mask 비교
+    c = np.where(rng.random(rows) < 0.01, 0.0, b)
+    c_list = c.tolist()
+    start = time.perf_counter()
+    results = [calc.divide(x, y, z) for x, y, z in zip(a_list, b_list, c_list)]
+    [isinstance(result, str) for result in results]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    calc.divide_array(a, b, c, fill=0.0, return_mask=True)
+    batch_time = time.perf_counter() - start
+    print(f"{'divide3+mask':>8}: loop {rows / loop_time:>14,.0f} rows/s | "
+          f"batch {rows / batch_time:>14,.0f} rows/s | x{loop_time / batch_time:,.1f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
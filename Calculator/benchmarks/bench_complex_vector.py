@@ -0,0 +1,53 @@
+# benchmarks/bench_complex_vector.py
+# Python complex 리스트에 ComplexCalculator 스칼라 메서드를 반복 적용하는 방식과 ComplexVector의
+# 원소별 연산을 메모리 사용량과 원소 한 개당 시간으로 비교하는 벤치마크입니다 (NumPy 불필요).
+# 실행: python benchmarks/bench_complex_vector.py [원소 수]
+
+import random
+import sys
+import timeit
+import tracemalloc
+
+from calculator import ComplexCalculator, ComplexVector
+
+
+def _allocated(build) -> int:
+    # build가 만든 객체가 차지하는 메모리(바이트)
+    tracemalloc.start()
+    value = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del value
+    return size
+
+
+def _best(func, count: int) -> float:
+    # 여러 번 측정한 값 중 최솟값 (원소 한 개당 ns)
+    return min(timeit.repeat(func, number=1, repeat=5)) / count * 1e9
+
+
+def main(count: int = 200_000) -> None:
+    rng = random.Random(0)
+    a = [complex(rng.uniform(-1, 1), rng.uniform(-1, 1)) for _ in range(count)]
+    b = [complex(rng.uniform(-1, 1), rng.uniform(-1, 1)) for _ in range(count)]
+    va, vb = ComplexVector.from_complex(a), ComplexVector.from_complex(b)
+    calc = ComplexCalculator()
+
+    list_bytes = _allocated(lambda: [complex(x.real, x.imag) for x in a])
+    vector_bytes = _allocated(lambda: ComplexVector(va.real, va.imag))
+    print(f"{count} elements")
+    print(f"memory: list[complex] {list_bytes / count:.1f} B/element, ComplexVector {vector_bytes / count:.1f} B/element")
+    print(f"{'operation':<12} {'scalar loop ns':>15} {'ComplexVector ns':>17}")
+    for name in ('add', 'subtract', 'multiply', 'divide', 'magnitude', 'argument'):
+        method = getattr(calc, name)
+        if name in ('magnitude', 'argument'):
+            loop = _best(lambda: [method(x) for x in a], count)
+            vector = _best(getattr(va, name), count)
+        else:
+            loop = _best(lambda: [method(x, y) for x, y in zip(a, b)], count)
+            vector = _best(lambda: getattr(va, name)(vb), count)
+        print(f"{name:<12} {loop:15.1f} {vector:17.1f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,36 @@
+# benchmarks/bench_frozen.py
+# EngineeringCalculator 메서드와 freeze로 설정을 고정한 FrozenCalculator의 호출 한 번당 시간을 비교하는 벤치마크입니다.
+# 실행: python benchmarks/bench_frozen.py [호출 수]
+
+import sys
+import timeit
+
+from calculator import EngineeringCalculator
+
+
+def _best(stmt: str, namespace: dict, count: int, repeat: int = 5) -> float:
+    # 다른 프로세스의 영향을 줄이기 위해 여러 번 측정한 값 중 최솟값을 사용 (호출 한 번당 ns)
+    return min(timeit.repeat(stmt, globals=namespace, number=count, repeat=repeat)) / count * 1e9
+
+
+def main(count: int = 1_000_000) -> None:
+    cases = [
+        # (설명, precision, 고정 단위, 일반 호출, 고정 호출)
+        ('sin radian', None, 'radian', "calc.sin(0.5)", "frozen.sin(0.5)"),
+        ('sin degree', None, 'degree', "calc.sin(30.5, unit='degree')", "frozen.sin(30.5)"),
+        ('sin degree p=6', 6, 'degree', "calc.sin(30.5, unit='degree')", "frozen.sin(30.5)"),
+        ('square_root p=6', 6, 'radian', "calc.square_root(2.5)", "frozen.square_root(2.5)"),
+        ('log p=6', 6, 'radian', "calc.log(123.4)", "frozen.log(123.4)"),
+        ('power', None, 'radian', "calc.power(1.5, 3.2)", "frozen.power(1.5, 3.2)"),
+    ]
+    for label, precision, unit, generic, fast in cases:
+        calc = EngineeringCalculator(precision=precision)
+        namespace = {'calc': calc, 'frozen': calc.freeze(unit)}
+        generic_ns = _best(generic, namespace, count)
+        frozen_ns = _best(fast, namespace, count)
+        print(f"{label:>16}: generic {generic_ns:8.1f} ns | frozen {frozen_ns:8.1f} ns | "
+              f"saved {generic_ns - frozen_ns:7.1f} ns/call (x{generic_ns / frozen_ns:.1f})")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
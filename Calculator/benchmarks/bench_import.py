@@ -0,0 +1,58 @@
+# benchmarks/bench_import.py
+# 새 Python 프로세스에서 패키지 import에 걸리는 시간(cold start)을 측정하고, 시간 예산과 불러온 모듈을 검사하는 벤치마크입니다.
+# 예산을 넘거나 불러오면 안 되는 모듈(NumPy 등)을 불러오면 종료 코드 1을 반환합니다.
+# 실행: python benchmarks/bench_import.py [반복 수] [--scale 배율]
+#   --scale: 느린 환경(CI 등)에서 모든 시간 예산에 곱할 배율. 기본값은 1.0.
+
+import argparse
+import json
+import subprocess
+import sys
+
+# (import 문, 시간 예산(ms), 불러오면 안 되는 모듈)
+CASES = [
+    ("import calculator", 5, ('calculator.basic', 'calculator.engineering', 'numpy', 'typing')),
+    ("from calculator import Calculator", 20,
+     ('calculator.engineering', 'calculator.complex_cal', 'calculator.expression', 'numpy')),
+    ("from calculator import EngineeringCalculator", 25,
+     ('calculator.trig_table', 'calculator.cache', 'calculator.frozen', 'calculator.expression', 'numpy')),
+    ("from calculator import ComplexCalculator", 20, ('calculator.basic', 'calculator.engineering', 'numpy')),
+    ("from calculator import *", 60, ('numpy',)),
+]
+
+# 자식 프로세스에서 실행할 코드: import 시간(초)과 불러온 모듈 목록을 JSON으로 출력
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'modules': sorted(sys.modules)}}))
+"""
+
+
+def probe(statement: str) -> dict:
+    output = subprocess.run([sys.executable, '-c', _PROBE.format(statement=statement)],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def main(repeat: int = 10, scale: float = 1.0) -> int:
+    failures = 0
+    for statement, budget_ms, forbidden in CASES:
+        runs = [probe(statement) for _ in range(repeat)]
+        best_ms = min(run['seconds'] for run in runs) * 1000  # 디스크 캐시 등의 영향을 줄이기 위해 최솟값 사용
+        loaded = [name for name in forbidden if name in runs[0]['modules']]
+        budget = budget_ms * scale
+        ok = best_ms <= budget and not loaded
+        failures += not ok
+        note = f" | unexpectedly loaded: {', '.join(loaded)}" if loaded else ''
+        print(f"{'ok  ' if ok else 'FAIL'} {statement:<45} {best_ms:7.2f} ms (budget {budget:.0f} ms){note}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure cold import time of the calculator package.")
+    parser.add_argument('repeat', nargs='?', type=int, default=10)
+    parser.add_argument('--scale', type=float, default=1.0)
+    args = parser.parse_args()
+    sys.exit(main(args.repeat, args.scale))
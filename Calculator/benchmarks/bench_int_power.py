@@ -0,0 +1,61 @@
+# benchmarks/bench_int_power.py
+# 큰 지수의 거듭제곱과 큰 정수의 제곱근에서 float 경로(math.pow, math.sqrt)와 정수 경로(int_power, int_sqrt)를 비교하는 벤치마크입니다.
+# float 경로는 결과가 float 범위를 넘으면 OverflowError가 발생하고, 범위 안에서도 결과가 근삿값입니다.
+# 실행: python benchmarks/bench_int_power.py [반복 수]
+
+import math
+import sys
+import timeit
+
+from calculator import EngineeringCalculator
+
+MODULUS = 1_000_000_007
+
+
+def _best_us(func, count: int, repeat: int = 5) -> float:
+    # 다른 프로세스의 영향을 줄이기 위해 여러 번 측정한 값 중 최솟값을 사용 (호출 한 번당 us)
+    return min(timeit.repeat(func, number=count, repeat=repeat)) / count * 1e6
+
+
+def _float_route(func, count: int) -> str:
+    try:
+        func()
+    except OverflowError:
+        return f"{'OverflowError':>12}"
+    return f"{_best_us(func, count):9.2f} us"
+
+
+def main(count: int = 1000) -> None:
+    calc = EngineeringCalculator()
+
+    print("power: 3 ** exponent")
+    for exponent in (30, 600, 10_000, 100_000):
+        float_time = _float_route(lambda: calc.power(3, exponent), count)
+        try:
+            exact_note = 'float exact' if int(math.pow(3, exponent)) == calc.int_power(3, exponent) else 'float inexact'
+        except OverflowError:
+            exact_note = 'float overflow'
+        int_time = _best_us(lambda: calc.int_power(3, exponent), max(count // 10, 1))
+        print(f"  e={exponent:>7}: float {float_time} | int_power {int_time:9.2f} us ({exact_note})")
+
+    print(f"modular power: (3 ** exponent) % {MODULUS}")
+    for exponent in (10_000, 100_000, 10 ** 18):
+        modular = _best_us(lambda: calc.int_power(3, exponent, MODULUS), count)
+        if exponent <= 100_000:
+            naive = f"{_best_us(lambda: calc.int_power(3, exponent) % MODULUS, max(count // 10, 1)):9.2f} us"
+        else:
+            naive = f"{'(too large)':>12}"
+        print(f"  e={exponent:>19}: (x ** e) % m {naive} | int_power(x, e, m) {modular:9.2f} us")
+
+    print("square root of (10 ** digits + 7) ** 2")
+    for digits in (10, 100, 1000):
+        n = (10 ** digits + 7) ** 2
+        float_time = _float_route(lambda: calc.square_root(n), count)  # float 범위 밖은 isqrt로 대신 계산
+        int_time = _best_us(lambda: calc.int_sqrt(n, exact=True), count)
+        check_time = _best_us(lambda: calc.is_perfect_square(n + 1), count)
+        print(f"  digits={digits:>5}: square_root {float_time} | int_sqrt(exact) {int_time:9.2f} us | "
+              f"is_perfect_square(non-square) {check_time:9.2f} us")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,47 @@
+# benchmarks/bench_lazy.py
+# sin(x, degree)² + cos(x, degree)² + sin(x, degree)·log(y) 를 EngineeringCalculator 메서드를 이어서 호출하는 방식
+# (중간마다 계산/반올림, 같은 부분식 재계산)과 LazyCalculator 그래프로 계산하는 방식의 시간을 비교하는 벤치마크입니다.
+# 실행: python benchmarks/bench_lazy.py [배열 크기]
+
+import sys
+import timeit
+
+from calculator import EngineeringCalculator
+from calculator.utils import get_numpy
+
+
+def _best(func, number: int) -> float:
+    # 여러 번 측정한 값 중 최솟값 (호출 한 번당 µs)
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main(size: int = 1_000_000) -> None:
+    calc = EngineeringCalculator(precision=6)
+    lazy = calc.lazy()
+    x, y = lazy.var('x'), lazy.var('y')
+    s, c = lazy.sin(x, 'degree'), lazy.cos(x, 'degree')
+    expr = s * s + c * c + s * lazy.log(y)
+
+    def eager(a, b):
+        sin_a, cos_a = calc.sin(a, 'degree'), calc.cos(a, 'degree')
+        return calc.add(calc.multiply(sin_a, sin_a), calc.multiply(cos_a, cos_a),
+                        calc.multiply(calc.sin(a, 'degree'), calc.log(b)), precision=6)
+
+    print(f"scalar  eager {_best(lambda: eager(30.5, 100.0), 20_000):8.2f} µs | "
+          f"lazy {_best(lambda: expr.evaluate(x=30.5, y=100.0), 20_000):8.2f} µs")
+
+    np = get_numpy()
+    rng = np.random.default_rng(0)
+    a, b = rng.uniform(0, 360, size), rng.uniform(1, 1000, size)
+
+    def eager_array(a, b):
+        sin_a, cos_a = calc.sin_array(a, 'degree'), calc.cos_array(a, 'degree')
+        return calc.add_array(calc.multiply_array(sin_a, sin_a), calc.multiply_array(cos_a, cos_a),
+                              calc.multiply_array(calc.sin_array(a, 'degree'), calc.log_array(b)), precision=6)
+
+    print(f"batch   eager {_best(lambda: eager_array(a, b), 3) / 1e3:8.2f} ms | "
+          f"lazy {_best(lambda: expr.evaluate(x=a, y=b), 3) / 1e3:8.2f} ms  ({size} rows)")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
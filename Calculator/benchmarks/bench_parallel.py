@@ -0,0 +1,34 @@
+# benchmarks/bench_parallel.py
+# ParallelEvaluator.map_arrays의 프로세스 수별 처리량을 측정하는 벤치마크입니다.
+# 실행: python benchmarks/bench_parallel.py [원소 수]
+
+import os
+import sys
+import time
+
+import numpy as np
+
+from calculator import EngineeringCalculator
+from calculator.parallel import ParallelEvaluator
+
+
+def main(count: int = 20_000_000) -> None:
+    angles = np.random.default_rng(0).uniform(0, 360, count)
+    start = time.perf_counter()
+    EngineeringCalculator(precision=6).sin_array(angles, unit='degree')
+    base = time.perf_counter() - start
+    print(f"single process : {count / base:>14,.0f} elements/s")
+
+    processes = 1
+    while processes <= (os.cpu_count() or 1):
+        with ParallelEvaluator(processes=processes, chunk_size=max(count // (processes * 4), 1)) as evaluator:
+            evaluator.map_arrays('sin', angles[:processes], unit='degree')  # 작업 프로세스 미리 시작
+            start = time.perf_counter()
+            evaluator.map_arrays('sin', angles, precision=6, unit='degree')
+            elapsed = time.perf_counter() - start
+        print(f"{processes:>2} processes   : {count / elapsed:>14,.0f} elements/s | x{base / elapsed:.2f}")
+        processes *= 2
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000_000)
@@ -0,0 +1,50 @@
+# benchmarks/bench_persistent_cache.py
+# 프로세스를 다시 시작한 상황에서 같은 호출을 반복할 때, 캐시 없이 다시 계산하는 경우와 PersistentCache를 사용하는 경우의
+# 호출 한 개당 시간을 비교하는 벤치마크입니다. 첫 실행(파일 기록)과 재시작 후(미리 읽기 + 파일 조회)를 측정합니다.
+# 실행: python benchmarks/bench_persistent_cache.py [인자 쌍 수]
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from calculator import EngineeringCalculator
+
+
+def _per_call(calc: EngineeringCalculator, work: list) -> float:
+    # 호출 한 개당 시간 (µs)
+    start = time.perf_counter()
+    for x, y in work:
+        calc.power(x, y)
+        calc.log(x)
+        calc.sin(x, unit='degree')
+    return (time.perf_counter() - start) / (len(work) * 3) * 1e6
+
+
+def main(count: int = 20_000) -> None:
+    rng = random.Random(0)
+    work = [(rng.uniform(1, 100), rng.uniform(-3, 3)) for _ in range(count)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'results.sqlite')
+        print(f"{count * 3} distinct calls")
+        print(f"{'no cache':>22}: {_per_call(EngineeringCalculator(precision=6), work):8.2f} µs/call")
+
+        first = EngineeringCalculator(precision=6)
+        first.enable_cache(maxsize=count * 3, path=path)
+        print(f"{'first run (write)':>22}: {_per_call(first, work):8.2f} µs/call")
+        first.disable_cache()
+
+        # 다시 시작한 프로세스: enable_cache가 최근 결과를 미리 읽음 (memory_size 4096개까지)
+        restarted = EngineeringCalculator(precision=6)
+        start = time.perf_counter()
+        restarted.enable_cache(maxsize=count * 3, path=path)
+        preload = time.perf_counter() - start
+        print(f"{'restart (preloaded)':>22}: {_per_call(restarted, work):8.2f} µs/call  (enable_cache {preload * 1e3:.1f} ms)")
+        info = restarted.cache_info()
+        print(f"{'':>22}  preloaded {info['preloaded']}, hit rate {info['hit_rate']:.2f}")
+        restarted.disable_cache()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,38 @@
+# benchmarks/bench_polynomial.py
+# Polynomial의 Horner/Estrin 방식과 점마다 스칼라로 계산하는 반복문, numpy.polyval의 시간을 비교하는 벤치마크입니다.
+# 실행: python benchmarks/bench_polynomial.py [최대 점의 수]
+
+import sys
+import timeit
+
+from calculator import Polynomial
+from calculator.utils import get_numpy
+
+
+def _best(func, repeat: int = 5) -> float:
+    # 다른 프로세스의 영향을 줄이기 위해 여러 번 측정한 값 중 최솟값을 사용 (호출 한 번당 µs)
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def main(max_points: int = 1_000_000) -> None:
+    np = get_numpy()
+    rng = np.random.default_rng(0)
+    print(f"{'points':>9} {'degree':>6} {'loop µs':>12} {'horner µs':>12} {'estrin µs':>12} {'polyval µs':>12}")
+    points = 10
+    while points <= max_points:
+        x = rng.uniform(-1, 1, points)
+        for degree in (4, 32, 128):
+            p = Polynomial(rng.standard_normal(degree + 1))
+            # 스칼라 반복문은 점이 많으면 오래 걸리므로 1만 개 이하에서만 측정
+            loop = f"{_best(lambda: [p(value) for value in x.tolist()], 3):12.1f}" if points <= 10_000 else f"{'-':>12}"
+            horner = _best(lambda: p(x, method='horner'), 3)
+            estrin = _best(lambda: p(x, method='estrin'), 3)
+            polyval = _best(lambda: np.polyval(p.coefficients, x), 3)
+            print(f"{points:>9} {degree:>6} {loop} {horner:12.1f} {estrin:12.1f} {polyval:12.1f}")
+        points *= 100
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
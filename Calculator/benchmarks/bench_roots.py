@@ -0,0 +1,61 @@
+# benchmarks/bench_roots.py
+# 원소마다 c가 다른 방정식 x + log10(x) = c 여러 개를 푸는 시간을 비교하는 벤치마크입니다.
+#   - scalar newton: 방정식마다 EngineeringCalculator.log로 Python Newton 반복
+#   - RootFinder: newton, secant, bisect, brent 메서드로 모든 방정식을 배열 연산으로 한 번에 계산
+# 실행: python benchmarks/bench_roots.py [방정식 수]
+
+import math
+import sys
+import time
+
+import numpy as np
+
+from calculator import EngineeringCalculator, RootFinder
+
+LN10 = math.log(10)
+
+
+def _scalar_newton(calc: EngineeringCalculator, targets, tol: float = 2e-12, maxiter: int = 100) -> list:
+    roots = []
+    for c in targets:
+        x = c
+        for _ in range(maxiter):
+            step = (x + calc.log(x) - c) / (1 + 1 / (x * LN10))
+            x -= step
+            if abs(step) <= tol:
+                break
+        roots.append(x)
+    return roots
+
+
+def main(count: int = 200_000) -> None:
+    calc = EngineeringCalculator()
+    targets = np.linspace(1.0, 50.0, count)
+
+    def f(x, c):
+        return x + calc.log_array(x) - c
+
+    def fprime(x, c):
+        return 1 + 1 / (x * LN10)
+
+    finder = RootFinder()
+    print(f"{count} equations")
+    scalar_count = min(count, 20_000)  # Python 반복은 느리므로 일부만 측정하여 환산
+    start = time.perf_counter()
+    _scalar_newton(calc, targets[:scalar_count].tolist())
+    scalar = (time.perf_counter() - start) / scalar_count * count
+    print(f"{'scalar newton':>14}: {scalar * 1e3:10.1f} ms")
+    for name, solve in (('newton', lambda: finder.newton(f, targets, fprime, args=(targets,))),
+                        ('secant', lambda: finder.secant(f, targets, args=(targets,))),
+                        ('bisect', lambda: finder.bisect(f, 0.5, 60.0, args=(targets,))),
+                        ('brent', lambda: finder.brent(f, 0.5, 60.0, args=(targets,)))):
+        start = time.perf_counter()
+        roots, status, iterations = solve()
+        elapsed = time.perf_counter() - start
+        converged = np.count_nonzero(status == 0)
+        print(f"{name:>14}: {elapsed * 1e3:10.1f} ms  ({scalar / elapsed:5.1f}x, converged {converged}/{count}, "
+              f"mean iterations {iterations.mean():.1f}, max |f| {np.abs(f(roots, targets)).max():.1e})")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,55 @@
+# benchmarks/bench_settings.py
+# 요청마다 precision이 다른 계산을 스레드 풀에서 처리할 때의 처리량을 비교하는 벤치마크입니다.
+#   - per-request: 요청마다 EngineeringCalculator를 새로 생성
+#   - locked: 인스턴스 하나를 공유하고 setter 변경과 계산을 잠금으로 보호
+#   - settings: 인스턴스 하나를 공유하고 context별 settings 블록 사용 (잠금 없음)
+# 실행: python benchmarks/bench_settings.py [요청 수] [스레드 수]
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from calculator import EngineeringCalculator
+
+# 요청 하나에서 계산하는 연산 수
+CALLS_PER_REQUEST = 8
+
+
+def _per_request(precision: int, angle: float) -> float:
+    calc = EngineeringCalculator(precision=precision)
+    return sum(calc.sin(angle + i, 'degree') + calc.log(angle + i) for i in range(CALLS_PER_REQUEST))
+
+
+_shared_locked = EngineeringCalculator()
+_lock = threading.Lock()
+
+
+def _locked(precision: int, angle: float) -> float:
+    with _lock:
+        _shared_locked.precision = precision
+        return sum(_shared_locked.sin(angle + i, 'degree') + _shared_locked.log(angle + i)
+                   for i in range(CALLS_PER_REQUEST))
+
+
+_shared = EngineeringCalculator()
+
+
+def _settings(precision: int, angle: float) -> float:
+    with _shared.settings(precision=precision, unit='degree'):
+        return sum(_shared.sin(angle + i) + _shared.log(angle + i) for i in range(CALLS_PER_REQUEST))
+
+
+def main(requests: int = 50_000, workers: int = 8) -> None:
+    work = [(i % 10, 1.0 + i % 360) for i in range(requests)]
+    print(f"{requests} requests, {workers} threads, {CALLS_PER_REQUEST * 2} calls/request")
+    for name, handler in (('per-request', _per_request), ('locked', _locked), ('settings', _settings)):
+        with ThreadPoolExecutor(workers) as pool:
+            start = time.perf_counter()
+            list(pool.map(handler, *zip(*work), chunksize=256))
+            elapsed = time.perf_counter() - start
+        print(f"{name:>12}: {requests / elapsed:>12,.0f} requests/s")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000, int(sys.argv[2]) if len(sys.argv) > 2 else 8)
@@ -0,0 +1,317 @@
+# benchmarks/bench_suite.py
+# Calculator, EngineeringCalculator, ComplexCalculator의 모든 공개 메서드와 utils 함수의 실행 시간을 측정하여
+# JSON 기준값(baseline)으로 저장하고, 두 결과를 비교하여 성능 저하(regression)를 찾는 벤치마크 모음입니다.
+# 각 메서드는 스칼라 입력과 큰 입력(LARGE개 원소)으로, precision이 있는 메서드는 precision 유무 모두로 측정합니다.
+#
+# 실행:
+#   python benchmarks/bench_suite.py run -o baseline.json            # 측정 결과를 JSON으로 저장
+#   python benchmarks/bench_suite.py run -o current.json -k Engineering  # 이름에 'Engineering'이 들어간 항목만 측정
+#   python benchmarks/bench_suite.py compare baseline.json current.json --threshold 0.10
+#     -> 기준값보다 10% 넘게 느려진 항목을 출력하고, 하나라도 있으면 종료 코드 1을 반환
+#   python benchmarks/bench_suite.py run -o instrumented.json --instrument
+#   python benchmarks/bench_suite.py compare baseline.json instrumented.json  # 계측(instrumentation) 비용 확인
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import timeit
+from typing import Callable, List, Optional, Tuple
+
+from calculator import Calculator, EngineeringCalculator, ComplexCalculator, OperationRegistry
+from calculator import instrumentation, utils
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 배열 메서드 항목은 건너뜀
+    np = None
+
+LARGE = 100_000  # 큰 입력의 원소 수
+PRECISION = 6
+FORMAT_VERSION = 1
+
+Case = Tuple[str, Callable[[], object]]
+
+
+def _basic_cases(values: List[float], divisors: List[float]) -> List[Case]:
+    calc = Calculator()
+    cases = []
+    for name in ('add', 'subtract', 'multiply', 'divide'):
+        scalar = getattr(calc, name)
+        stream = getattr(calc, name + '_stream')
+        large = divisors if name in ('multiply', 'divide') else values  # 곱셈/나눗셈은 1 근처 값으로 overflow 방지
+        for precision, suffix in ((None, ''), (PRECISION, ',precision')):
+            cases += [
+                (f"Calculator.{name}[scalar{suffix}]", lambda f=scalar, p=precision: f(7.25, 2.5, precision=p)),
+                (f"Calculator.{name}[large{suffix}]", lambda f=scalar, v=large, p=precision: f(*v, precision=p)),
+                (f"Calculator.{name}_stream[large{suffix}]", lambda f=stream, v=large, p=precision: f(v, precision=p)),
+            ]
+    for method in ('neumaier', 'fsum', 'naive'):
+        cases.append((f"Calculator.add_stream[large,{method}]", lambda v=values, m=method: calc.add_stream(v, method=m)))
+    return cases
+
+
+def _engineering_cases(values: List[float]) -> List[Case]:
+    cases = []
+    for precision, suffix in ((None, ''), (PRECISION, ',precision')):
+        calc = EngineeringCalculator(precision=precision)
+        calls = {
+            'square_root': ((2.5,), {}),
+            'power': ((1.5, 3.2), {}),
+            'log': ((123.4,), {}),
+            'sin': ((30.5,), {'unit': 'degree'}),
+            'cos': ((0.75,), {}),
+            'tan': ((0.75,), {}),
+        }
+        for name, (args, kwargs) in calls.items():
+            method = getattr(calc, name)
+            cases += [
+                (f"EngineeringCalculator.{name}[scalar{suffix}]", lambda f=method, a=args, k=kwargs: f(*a, **k)),
+                (f"EngineeringCalculator.{name}[large{suffix}]",
+                 lambda f=method, a=args[1:], k=kwargs: [f(x, *a, **k) for x in values]),
+            ]
+    return cases
+
+
+def _complex_cases(values: List[float]) -> List[Case]:
+    calc = ComplexCalculator()
+    numbers = [complex(x, 1 - x) for x in values]
+    a, b = 3 + 4j, 1 - 2j
+    calls = {
+        'add': (a, b), 'subtract': (a, b), 'multiply': (a, b), 'divide': (a, b),
+        'magnitude': (a,), 'argument': (a,), 'to_polar': (a,), 'to_rectangular': (5.0, 0.9273),
+    }
+    cases = []
+    for name, args in calls.items():
+        method = getattr(calc, name)
+        if name == 'to_rectangular':
+            large = lambda f=method: [f(abs(z), x) for z, x in zip(numbers, values)]
+        else:
+            large = lambda f=method, rest=args[1:]: [f(z, *rest) for z in numbers]
+        cases += [
+            (f"ComplexCalculator.{name}[scalar]", lambda f=method, a=args: f(*a)),
+            (f"ComplexCalculator.{name}[large]", large),
+        ]
+    return cases
+
+
+def _utils_cases(values: List[float]) -> List[Case]:
+    cases = []
+    for precision, suffix in ((None, ''), (PRECISION, ',precision')):
+        cases += [
+            (f"utils.round_result[scalar{suffix}]", lambda p=precision: utils.round_result(3.14159265, p)),
+            (f"utils.round_result[large{suffix}]", lambda p=precision: [utils.round_result(x, p) for x in values]),
+        ]
+    for unit in ('radian', 'degree'):
+        cases += [
+            (f"utils.convert_to_radians[scalar,{unit}]", lambda u=unit: utils.convert_to_radians(30.0, u)),
+            (f"utils.convert_to_radians[large,{unit}]",
+             lambda u=unit: [utils.convert_to_radians(x, u) for x in values]),
+        ]
+    return cases
+
+
+def _registry_cases(values: List[float]) -> List[Case]:
+    cases = []
+    for precision, suffix in ((None, ''), (PRECISION, ',precision')):
+        registry = OperationRegistry(precision)
+        rows = [(x,) for x in values]
+        ops = [('sqrt', 'log', 'sin')[i % 3] for i in range(len(values))]
+        cases += [
+            (f"OperationRegistry.evaluate[scalar{suffix}]", lambda r=registry: r.evaluate('add', 7.25, 2.5)),
+            (f"OperationRegistry.evaluate_many[large{suffix}]", lambda r=registry: r.evaluate_many('sqrt', rows)),
+            (f"OperationRegistry.evaluate_many[large,mixed{suffix}]", lambda r=registry: r.evaluate_many(ops, rows)),
+        ]
+    return cases
+
+
+def _array_cases(values: List[float], divisors: List[float]) -> List[Case]:
+    a, b = np.array(values), np.array(divisors)
+    z = a + 1j * b
+    basic, complex_calc = Calculator(), ComplexCalculator()
+    cases = []
+    for precision, suffix in ((None, ''), (PRECISION, ',precision')):
+        engineering = EngineeringCalculator(precision=precision)
+        for name in ('add', 'subtract', 'multiply', 'divide'):
+            cases.append((f"Calculator.{name}_array[large{suffix}]",
+                          lambda f=getattr(basic, name + '_array'), p=precision: f(a, b, precision=p)))
+        cases += [
+            (f"EngineeringCalculator.square_root_array[large{suffix}]", lambda e=engineering: e.square_root_array(a)),
+            (f"EngineeringCalculator.power_array[large{suffix}]", lambda e=engineering: e.power_array(b, 3.2)),
+            (f"EngineeringCalculator.log_array[large{suffix}]", lambda e=engineering: e.log_array(b)),
+            (f"EngineeringCalculator.sin_array[large{suffix}]", lambda e=engineering: e.sin_array(a, unit='degree')),
+            (f"EngineeringCalculator.cos_array[large{suffix}]", lambda e=engineering: e.cos_array(a)),
+            (f"EngineeringCalculator.tan_array[large{suffix}]", lambda e=engineering: e.tan_array(a)),
+            (f"utils.round_array[large{suffix}]", lambda p=precision: utils.round_array(a, p)),
+        ]
+    for name in ('add', 'subtract', 'multiply', 'divide'):
+        cases.append((f"ComplexCalculator.{name}_array[large]",
+                      lambda f=getattr(complex_calc, name + '_array'): f(z, z + 1)))
+    cases += [
+        ("ComplexCalculator.complex_array[large]", lambda: complex_calc.complex_array(a, b)),
+        ("ComplexCalculator.magnitude_array[large]", lambda: complex_calc.magnitude_array(z)),
+        ("ComplexCalculator.argument_array[large]", lambda: complex_calc.argument_array(z)),
+        ("ComplexCalculator.to_polar_array[large]", lambda: complex_calc.to_polar_array(z)),
+        ("ComplexCalculator.from_parts_to_polar[large]", lambda: complex_calc.from_parts_to_polar(a, b)),
+        ("ComplexCalculator.to_rectangular_array[large]", lambda: complex_calc.to_rectangular_array(a, b)),
+    ]
+    for unit in ('radian', 'degree'):
+        cases.append((f"utils.convert_to_radians_array[large,{unit}]",
+                      lambda u=unit: utils.convert_to_radians_array(a, u)))
+    return cases
+
+
+def build_cases(size: int = LARGE) -> List[Case]:
+    """
+    측정할 (이름, 함수) 목록을 만드는 함수. 이름은 '클래스.메서드[입력 종류,옵션]' 형식입니다.
+    """
+    values = [(i % 1000) / 10 + 0.5 for i in range(size)]  # 0.5 ~ 100.4
+    divisors = [1 + ((i % 7) - 3) * 1e-6 for i in range(size)]  # 1 근처 값 (곱셈/나눗셈 overflow 방지)
+    cases = _basic_cases(values, divisors) + _engineering_cases(values) + _complex_cases(values) + _utils_cases(values)
+    cases += _registry_cases(values)
+    if np is not None:
+        cases += _array_cases(values, divisors)
+    return sorted(cases, key=lambda case: case[0])
+
+
+def measure(func: Callable[[], object], repeat: int = 5, min_time: float = 0.05) -> Tuple[float, int]:
+    """
+    함수 한 번 호출의 실행 시간(초)을 측정하는 함수.
+    한 번 측정이 min_time 이상 걸리도록 호출 횟수를 정하고, repeat번 측정한 값 중 최솟값을 사용합니다.
+
+    Returns:
+        Tuple[float, int]: (호출 한 번의 시간, 측정 한 번의 호출 횟수)
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time or number >= 1_000_000:
+            break
+        number *= 10
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number, number
+
+
+def run(pattern: Optional[str] = None, size: int = LARGE, repeat: int = 5, min_time: float = 0.05,
+        instrument: bool = False) -> dict:
+    """
+    벤치마크를 실행하여 JSON으로 저장할 결과를 만드는 함수.
+
+    Args:
+        pattern (Optional[str]): 이름에 이 문자열이 들어간 항목만 측정. None이면 전체.
+        size (int): 큰 입력의 원소 수.
+        repeat (int): 항목별 반복 측정 횟수.
+        min_time (float): 측정 한 번의 최소 시간(초).
+        instrument (bool): 계측을 켠 상태로 측정할지 여부. 켜지 않은 결과와 비교하면 계측 비용을 알 수 있습니다.
+    """
+    results = {}
+    if instrument:
+        instrumentation.enable()  # 메서드를 가져오기 전에 켜야 계측된 메서드가 측정됨
+    try:
+        for name, func in build_cases(size):
+            if pattern and pattern not in name:
+                continue
+            seconds, number = measure(func, repeat, min_time)
+            results[name] = {'seconds': seconds, 'number': number, 'repeat': repeat}
+            print(f"{name:<60} {_format_time(seconds):>12}", file=sys.stderr)
+    finally:
+        if instrument:
+            instrumentation.disable()
+    return {
+        'version': FORMAT_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'numpy': None if np is None else np.__version__,
+        'platform': platform.platform(),
+        'size': size,
+        'instrumented': instrument,
+        'results': results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.10) -> Tuple[List[tuple], List[tuple]]:
+    """
+    두 실행 결과를 비교하는 함수. 양쪽에 모두 있는 항목만 비교합니다.
+
+    Args:
+        baseline (dict): 기준 결과 (run의 반환값).
+        current (dict): 비교할 결과.
+        threshold (float): 허용하는 속도 저하 비율 (0.10이면 10%).
+
+    Returns:
+        Tuple[List[tuple], List[tuple]]: (모든 항목, 성능 저하 항목). 각 항목은 (이름, 기준 시간, 현재 시간, 비율).
+    """
+    rows = []
+    for name in sorted(baseline['results'].keys() & current['results'].keys()):
+        before = baseline['results'][name]['seconds']
+        after = current['results'][name]['seconds']
+        rows.append((name, before, after, after / before if before > 0 else math.inf))
+    regressions = [row for row in rows if row[3] > 1 + threshold]
+    return rows, regressions
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def _load(path: str) -> dict:
+    with open(path, encoding='utf-8') as handle:
+        data = json.load(handle)
+    if data.get('version') != FORMAT_VERSION:
+        raise SystemExit(f"{path}: unsupported benchmark format version {data.get('version')!r}")
+    return data
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark every calculator operation and compare against baselines.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="measure and write JSON results")
+    run_parser.add_argument('-o', '--output', help="JSON file to write (default: stdout)")
+    run_parser.add_argument('-k', '--filter', help="only run cases whose name contains this string")
+    run_parser.add_argument('--size', type=int, default=LARGE, help=f"elements in large inputs (default: {LARGE})")
+    run_parser.add_argument('--repeat', type=int, default=5)
+    run_parser.add_argument('--min-time', type=float, default=0.05, help="minimum seconds per measurement")
+    run_parser.add_argument('--instrument', action='store_true', help="measure with calculator instrumentation enabled")
+
+    compare_parser = commands.add_parser('compare', help="compare two JSON results")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help="allowed slowdown ratio before flagging a regression (default: 0.10)")
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        data = run(args.filter, args.size, args.repeat, args.min_time, args.instrument)
+        text = json.dumps(data, indent=2, sort_keys=True) + '\n'
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as handle:
+                handle.write(text)
+        else:
+            sys.stdout.write(text)
+        return 0
+
+    baseline, current = _load(args.baseline), _load(args.current)
+    if baseline.get('size') != current.get('size'):
+        print(f"warning: input sizes differ ({baseline.get('size')} vs {current.get('size')})", file=sys.stderr)
+    if baseline.get('instrumented') != current.get('instrumented'):
+        print("note: comparing instrumented and uninstrumented runs (ratios show instrumentation overhead)",
+              file=sys.stderr)
+    rows, regressions = compare(baseline, current, args.threshold)
+    for name, before, after, ratio in rows:
+        flag = '  REGRESSION' if ratio > 1 + args.threshold else ''
+        print(f"{name:<60} {_format_time(before):>12} -> {_format_time(after):>12}  x{ratio:.2f}{flag}")
+    missing = sorted(baseline['results'].keys() - current['results'].keys())
+    if missing:
+        print(f"{len(missing)} baseline case(s) not measured (e.g. {missing[0]})", file=sys.stderr)
+    print(f"{len(regressions)} regression(s) over {args.threshold:.0%} in {len(rows)} compared case(s)")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
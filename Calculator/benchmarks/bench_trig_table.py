@@ -0,0 +1,49 @@
+# benchmarks/bench_trig_table.py
+# degree 단위 sin 계산에서 기존 경로(convert_to_radians + math.sin)와 표 조회 경로의 속도를 비교하는 벤치마크입니다.
+# 실행: python benchmarks/bench_trig_table.py [호출 수]
+
+import random
+import sys
+import timeit
+
+import numpy as np
+
+from calculator import EngineeringCalculator
+
+
+def _best(func, repeat: int = 5) -> float:
+    # 다른 프로세스의 영향을 줄이기 위해 여러 번 측정한 값 중 최솟값을 사용
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def _rate(count: int, seconds: float) -> str:
+    return f"{count / seconds:>14,.0f}/s"
+
+
+def main(count: int = 1_000_000) -> None:
+    rng = random.Random(0)
+    grid = [rng.randrange(3600) / 10 for _ in range(count)]  # 0.1° 격자 위 각도
+    off_grid = [rng.uniform(0, 360) for _ in range(count)]  # 격자 밖 각도
+
+    plain = EngineeringCalculator()
+    exact = EngineeringCalculator()
+    exact.enable_trig_table(step=0.1)
+    interpolated = EngineeringCalculator()
+    interpolated.enable_trig_table(step=0.1, interpolate=True)
+
+    for label, angles, calculator in (('scalar grid', grid, exact), ('scalar off-grid (interpolated)', off_grid, interpolated)):
+        base = _best(lambda: [plain.sin(a, DEGREE) for a in angles])
+        table = _best(lambda: [calculator.sin(a, DEGREE) for a in angles])
+        print(f"{label:<32}: math {_rate(count, base)} | table {_rate(count, table)} | x{base / table:.2f}")
+
+    for label, angles, calculator in (('batch grid', grid, exact), ('batch off-grid (interpolated)', off_grid, interpolated)):
+        angles = np.array(angles)
+        base = _best(lambda: plain.sin_array(angles, DEGREE))
+        table = _best(lambda: calculator.sin_array(angles, DEGREE))
+        print(f"{label:<32}: ufunc {_rate(count, base)} | table {_rate(count, table)} | x{base / table:.2f}")
+
+
+DEGREE = 'degree'
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
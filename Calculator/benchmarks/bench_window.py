@@ -0,0 +1,45 @@
+# benchmarks/bench_window.py
+# 새 샘플마다 Calculator.add(*window), multiply(*window)를 다시 계산하는 방식과
+# SlidingWindow로 합/곱/평균/분산을 갱신하는 방식의 샘플 한 개당 시간을 비교하는 벤치마크입니다.
+# 실행: python benchmarks/bench_window.py [창 크기]
+
+import random
+import sys
+import time
+from collections import deque
+
+from calculator import Calculator, SlidingWindow
+
+
+def main(capacity: int = 10_000) -> None:
+    rng = random.Random(0)
+    samples = [rng.uniform(0.999, 1.001) for _ in range(capacity + 2_000)]
+    calc = Calculator()
+
+    recent = deque(samples[:capacity], maxlen=capacity)
+    start = time.perf_counter()
+    for value in samples[capacity:]:
+        recent.append(value)
+        calc.add(*recent)
+        calc.multiply(*recent)
+    recompute = (time.perf_counter() - start) / (len(samples) - capacity)
+
+    window = SlidingWindow(capacity)
+    window.extend(samples[:capacity])
+    start = time.perf_counter()
+    for value in samples[capacity:]:
+        window.push(value)
+        window.sum()
+        window.product()
+        window.mean()
+        window.variance()
+    incremental = (time.perf_counter() - start) / (len(samples) - capacity)
+
+    print(f"window={capacity}")
+    print(f"recompute add/multiply: {recompute * 1e6:10.2f} µs/sample")
+    print(f"SlidingWindow (sum, product, mean, variance): {incremental * 1e6:10.2f} µs/sample")
+    print(f"speedup: {recompute / incremental:.1f}x")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
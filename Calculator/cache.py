@@ -0,0 +1,123 @@
+# calculator/cache.py
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+# 캐시에 값이 없음을 나타내는 객체 (None도 캐시할 수 있도록 별도 객체를 사용)
+MISSING = object()
+
+class LRUCache:
+    """
+    크기가 제한된 LRU(Least Recently Used) 캐시 클래스.
+    가장 오래 사용되지 않은 항목부터 제거하며, 적중(hit)/실패(miss)/제거(eviction) 횟수를 기록합니다.
+    get/put은 순서(OrderedDict)와 통계를 함께 바꾸므로 잠금으로 보호하여 여러 스레드에서 같은 캐시를 사용할 수 있습니다.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        클래스 초기화 함수.
+
+        Args:
+            maxsize (int): 캐시에 보관할 최대 항목 수.
+
+        Raises:
+            ValueError: maxsize가 1보다 작을 경우 발생.
+        """
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError("maxsize must be a positive integer.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()  # 순서와 통계를 스레드 사이에서 보호
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable) -> Any:
+        """
+        캐시에서 값을 찾는 함수. 찾은 항목은 가장 최근에 사용된 것으로 표시됩니다.
+
+        Args:
+            key (Hashable): 찾을 키.
+
+        Returns:
+            Any: 저장된 값. 없으면 MISSING 객체를 반환.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return MISSING
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        캐시에 값을 저장하는 함수. 최대 크기를 넘으면 가장 오래된 항목을 제거합니다.
+
+        Args:
+            key (Hashable): 저장할 키.
+            value (Any): 저장할 값.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """
+        캐시 항목을 무효화(삭제)하는 함수. 통계는 유지됩니다.
+
+        Args:
+            predicate (Optional[Callable[[Hashable], bool]]): 키를 받아 삭제 여부를 반환하는 함수.
+                                                              None이면 모든 항목을 삭제.
+
+        Returns:
+            int: 삭제된 항목 수.
+        """
+        if predicate is None:
+            with self._lock:
+                removed = len(self._data)
+                self._data.clear()
+            return removed
+        with self._lock:
+            keys = list(self._data)
+        # predicate는 잠금 밖에서 호출 (predicate 안에서 캐시를 사용해도 교착 상태가 되지 않도록)
+        keys = [key for key in keys if predicate(key)]
+        removed = 0
+        with self._lock:
+            for key in keys:
+                if self._data.pop(key, MISSING) is not MISSING:
+                    removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """
+        캐시의 모든 항목과 통계를 초기화하는 함수.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self) -> dict:
+        """
+        캐시 상태를 딕셔너리로 반환하는 함수.
+
+        Returns:
+            dict: hits, misses, evictions, size, maxsize 값을 담은 딕셔너리.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                    'size': len(self._data), 'maxsize': self.maxsize}
@@ -106,7 +106,14 @@ class EngineeringCalculator(Calculator):
         Returns:
             Union[int, float, str]: 계산된 제곱근 값.
         '''
-        result = x ** 0.5
+        try:
+            result = x ** 0.5
+        except OverflowError:
+            # float 범위를 넘는 큰 정수는 math.isqrt로 계산 (완전제곱수이면 정확한 정수 제곱근을 반환)
+            if not isinstance(x, int):
+                raise
+            root = math.isqrt(x)
+            result = root if root * root == x else float(root)
         return round_result(result, **kwargs)
 
     def power(self, x: Union[int, float], y: Union[int, float], **kwargs: Optional[dict]) -> Union[int, float, str]:
@@ -211,21 +218,11 @@ __all__ = ['Calculator', 'EngineeringCalculator']
 
 if __name__ == '__main__':
     '''
-    모듈을 직접 실행할 때 간단한 데모를 실행합니다.
+    모듈을 직접 실행하면 CSV/JSONL 연산 파일을 묶음 단위로 계산하는 명령행 도구를 실행합니다.
+    예: python -m calculator.calculator_module ops.csv -o results.csv -e errors.csv
+    자세한 옵션은 cli 모듈(python -m calculator --help)을 참고하세요.
     '''
-    
-    calc = Calculator()
-    eng_calc = EngineeringCalculator()
-    
-    # 기본 계산기 사용 예시
-    print("기본 계산기 사용 예시")
-    print(f"더하기: {calc.add(1, 2, 3)}")
-    print(f"곱하기: {calc.multiply(2, 4, 6)}")
-    print(f"반올림 자릿수를 지정한 나누기: {calc.divide(100, 2, 5, precision=3)}")
-
-    # 공학용 계산기 사용 예시
-    print("\n공학용 계산기 사용 예시")
-    print(f"제곱근: {eng_calc.square_root(16)}")
-    print(f"n의 몇승: {eng_calc.power(6, 3)}")
-    print(f"상용로그: {eng_calc.log(100)}")
-    print(f"삼각함수-사인: {eng_calc.sin(30, angle_unit='degree')}")
+    import sys
+    from .cli import main
+
+    sys.exit(main())
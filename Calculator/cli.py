@@ -0,0 +1,297 @@
+# calculator/cli.py
+
+import argparse
+import csv
+import io
+import json
+import math
+import sys
+import time
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from .basic import Calculator
+from .complex_cal import ComplexCalculator
+from .engineering import EngineeringCalculator
+from .registry import OPERATIONS, OperationRegistry
+
+# 입력 한 행: (줄 번호, 연산 이름, 인자 목록, precision)
+Row = Tuple[int, str, list, Optional[int]]
+
+FORMATS = ('csv', 'jsonl')
+
+
+def parse_value(text: str) -> Any:
+    """
+    CSV 필드 문자열을 int, float, complex 순서로 해석하는 함수. 숫자가 아니면 문자열 그대로 반환합니다 (예: 'degree').
+    """
+    text = text.strip()
+    for convert in (int, float, complex):
+        try:
+            return convert(text)
+        except ValueError:
+            continue
+    return text
+
+
+def read_rows(stream: TextIO, fmt: str) -> Iterator[Row]:
+    """
+    입력 스트림에서 연산 행을 하나씩 읽는 제너레이터. 전체 입력을 메모리에 올리지 않습니다.
+
+    - csv: op,arg1,arg2,...,precision (마지막 필드는 precision이며 비워 두면 None). '#'로 시작하는 줄은 무시.
+    - jsonl: {"op": "add", "args": [1, 2], "precision": 2} (precision은 생략 가능)
+
+    잘못된 행은 (줄 번호, None, [에러 메시지], None)으로 돌려주어 에러 출력으로 보내도록 합니다.
+    """
+    if fmt == 'csv':
+        for line_no, fields in enumerate(csv.reader(stream), start=1):
+            if not fields or fields[0].lstrip().startswith('#'):
+                continue
+            if len(fields) < 2:
+                yield line_no, None, ["Row must be 'op,arg1,...,precision'."], None
+                continue
+            precision = fields[-1].strip()
+            try:
+                precision = int(precision) if precision else None
+            except ValueError:
+                yield line_no, None, [f"Invalid precision: {precision!r}"], None
+                continue
+            yield line_no, fields[0].strip(), [parse_value(field) for field in fields[1:-1]], precision
+    elif fmt == 'jsonl':
+        for line_no, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                yield line_no, record['op'], list(record.get('args', [])), record.get('precision')
+            except (ValueError, KeyError, TypeError) as exc:
+                yield line_no, None, [f"Invalid JSON row: {exc}"], None
+    else:
+        raise ValueError(f"Unknown format: {fmt!r}. Use one of {FORMATS}.")
+
+
+def chunked(rows: Iterable[Row], size: int) -> Iterator[List[Row]]:
+    """
+    행들을 최대 size개씩 묶어서 돌려주는 제너레이터.
+    """
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class BulkEvaluator:
+    """
+    연산 이름과 인자로 기존 계산기 클래스의 메서드를 호출하는 클래스.
+    스칼라 연산은 precision 값마다 하나씩 만들어 둔 OperationRegistry로, 배열 연산은 계산기 인스턴스로 계산합니다.
+    """
+
+    def __init__(self):
+        self._basic = Calculator()
+        self._complex = ComplexCalculator()
+        self._engineering = {}  # precision -> EngineeringCalculator
+        self._registries = {}  # precision -> OperationRegistry
+
+    def _engineering_calculator(self, precision: Optional[int]) -> EngineeringCalculator:
+        calculator = self._engineering.get(precision)
+        if calculator is None:
+            calculator = self._engineering[precision] = EngineeringCalculator(precision=precision)
+        return calculator
+
+    def evaluate(self, op: str, args: list, precision: Optional[int] = None) -> Any:
+        """
+        연산 하나를 계산하는 함수.
+
+        Raises:
+            ValueError: 알 수 없는 연산이거나 계산기가 에러 메시지를 반환한 경우 발생.
+        """
+        registry = self._registries.get(precision)
+        if registry is None:
+            registry = self._registries[precision] = OperationRegistry(precision)
+        result = registry.evaluate(op, *args)
+        if isinstance(result, str):
+            raise ValueError(result)  # 0으로 나누기 등 에러 메시지는 에러 출력으로 보냄
+        return result
+
+    def evaluate_array(self, op: str, arrays: list, precision: Optional[int] = None, **kwargs: Any) -> Any:
+        """
+        연산 하나를 배열 단위로 계산하는 함수. 각 계산기의 *_array 메서드를 호출합니다.
+
+        Args:
+            op (str): 연산 이름 (OPERATIONS의 키).
+            arrays (list): 연산에 전달할 배열들.
+            precision (Optional[int]): 소수점 자릿수 (복소수 연산에는 적용되지 않음).
+            **kwargs: unit, base 등 메서드에 그대로 전달할 키워드 인자.
+
+        Raises:
+            ValueError: 알 수 없는 연산이거나 배열 버전이 없는 연산(int_power 등)인 경우 발생.
+        """
+        try:
+            kind, method = OPERATIONS[op]
+        except KeyError:
+            raise ValueError(f"Unknown operation: {op!r}") from None
+        if kind == 'basic':
+            return getattr(self._basic, method + '_array')(*arrays, precision=precision, **kwargs)
+        if kind == 'engineering':
+            return getattr(self._engineering_calculator(precision), method + '_array')(*arrays, **kwargs)
+        if kind == 'complex':
+            return getattr(self._complex, method + '_array')(*arrays, **kwargs)
+        raise ValueError(f"Operation {op!r} has no array version.")
+
+    def array_result_dtype(self, op: str, arrays: list, precision: Optional[int] = None, **kwargs: Any) -> Any:
+        """
+        배열 연산 결과의 dtype을 구하는 함수. 각 배열의 첫 원소만 계산하므로 결과 배열을 미리 만들 때 사용합니다.
+
+        Raises:
+            ValueError: 결과가 배열 하나가 아닌 연산(to_polar 등)인 경우 발생.
+        """
+        samples = [array[:1] if hasattr(array, 'shape') and array.shape else array for array in arrays]
+        sample = self.evaluate_array(op, samples, precision, **kwargs)
+        if isinstance(sample, tuple):
+            raise ValueError(f"Operation {op!r} returns multiple arrays.")
+        dtype = getattr(sample, 'dtype', None)
+        return dtype if dtype is not None else type(sample)
+
+
+def encode_result(result: Any) -> Any:
+    """
+    결과를 출력 형식에 맞게 바꾸는 함수. 복소수는 문자열로, 튜플은 리스트로 바꿉니다.
+    nan/inf는 JSON 숫자로 쓸 수 없으므로 parse_value로 다시 읽을 수 있는 문자열('nan', 'inf', '-inf')로 바꿉니다.
+    """
+    if isinstance(result, complex) or (isinstance(result, float) and not math.isfinite(result)):
+        return str(result)
+    if isinstance(result, tuple):
+        return [encode_result(value) for value in result]
+    return result
+
+
+class _Writer:
+    """
+    결과/에러 행을 csv 또는 jsonl 형식으로 쓰는 내부 클래스.
+    행은 계산 직후 encode로 한 줄 문자열로 만들어 두므로, 쓸 수 없는 값(문자열 변환 제한을 넘는 큰 정수 등)은
+    그 행의 에러가 되고 실행 전체가 멈추지 않습니다.
+    """
+
+    def __init__(self, stream: TextIO, fmt: str):
+        self.stream = stream
+        self.fmt = fmt
+        self._buffer = io.StringIO() if fmt == 'csv' else None
+        self._csv = csv.writer(self._buffer, lineterminator='\n') if fmt == 'csv' else None
+
+    def encode(self, line_no: int, key: str, value: Any) -> str:
+        """
+        행 하나를 출력할 한 줄 문자열로 만드는 함수.
+
+        Raises:
+            ValueError: 값을 출력 형식으로 쓸 수 없는 경우 발생 (예: 4300자리를 넘는 정수).
+        """
+        if self._csv is None:
+            # allow_nan=False: 표준 JSON이 아닌 NaN/Infinity를 쓰지 않음 (encode_result가 문자열로 바꿈)
+            return json.dumps({'line': line_no, key: value}, allow_nan=False) + '\n'
+        buffer = self._buffer
+        try:
+            self._csv.writerow([line_no, *(value if isinstance(value, list) else [value])])
+            return buffer.getvalue()
+        finally:
+            buffer.seek(0)
+            buffer.truncate()
+
+    def write(self, lines: List[str]) -> None:
+        self.stream.writelines(lines)
+
+
+def run(source: TextIO, output: TextIO, errors: TextIO, fmt: str = 'csv', output_format: Optional[str] = None,
+        chunk_size: int = 10000) -> dict:
+    """
+    입력 스트림의 연산들을 chunk_size개씩 계산하여 결과를 출력 스트림에 쓰는 함수.
+    한 번에 묶음 하나만 메모리에 유지되며, 실패한 행은 실행을 멈추지 않고 errors 스트림에 기록됩니다.
+
+    Args:
+        source (TextIO): 입력 스트림.
+        output (TextIO): 결과를 쓸 스트림. 각 행은 (줄 번호, 결과)입니다.
+        errors (TextIO): 에러를 쓸 스트림. 각 행은 (줄 번호, 에러 메시지)입니다.
+        fmt (str): 입력 형식 ('csv' 또는 'jsonl').
+        output_format (Optional[str]): 출력 형식. None이면 입력 형식과 같습니다.
+        chunk_size (int): 한 번에 계산할 행 수.
+
+    Returns:
+        dict: rows(처리한 행 수), errors(에러 행 수), seconds(걸린 시간), rows_per_second 값.
+    """
+    evaluator = BulkEvaluator()
+    output_format = output_format or fmt
+    result_writer = _Writer(output, output_format)
+    error_writer = _Writer(errors, output_format)
+    total = failed = 0
+    start = time.perf_counter()
+    for chunk in chunked(read_rows(source, fmt), chunk_size):
+        results, failures = [], []
+        for line_no, op, args, precision in chunk:
+            if op is None:
+                failures.append(error_writer.encode(line_no, 'error', args[0]))
+                continue
+            try:
+                result = encode_result(evaluator.evaluate(op, args, precision))
+                results.append(result_writer.encode(line_no, 'result', result))
+            except (ArithmeticError, ValueError, TypeError) as exc:
+                failures.append(error_writer.encode(line_no, 'error', f"{type(exc).__name__}: {exc}"))
+        result_writer.write(results)
+        error_writer.write(failures)
+        total += len(chunk)
+        failed += len(failures)
+    seconds = time.perf_counter() - start
+    return {'rows': total, 'errors': failed, 'seconds': seconds,
+            'rows_per_second': total / seconds if seconds > 0 else math.inf}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    명령행 인자 파서를 만드는 함수.
+    """
+    parser = argparse.ArgumentParser(
+        prog='calculator',
+        description="Evaluate calculator operations from a CSV/JSONL file or stdin in fixed-size chunks.",
+    )
+    parser.add_argument('input', nargs='?', default='-', help="input file ('-' for stdin, default)")
+    parser.add_argument('-o', '--output', default='-', help="result file ('-' for stdout, default)")
+    parser.add_argument('-e', '--errors', default=None, help="error file (default: stderr)")
+    parser.add_argument('-f', '--format', choices=FORMATS, default=None,
+                        help="input format (default: from the file extension, csv for stdin)")
+    parser.add_argument('--output-format', choices=FORMATS, default=None, help="output format (default: input format)")
+    parser.add_argument('-c', '--chunk-size', type=int, default=10000, help="rows evaluated per chunk (default: 10000)")
+    parser.add_argument('-q', '--quiet', action='store_true', help="do not print the rows/sec summary")
+    return parser
+
+
+def _open(path: str, mode: str, default: TextIO) -> TextIO:
+    if path == '-':
+        return default
+    return open(path, mode, newline='' if mode == 'r' else None, encoding='utf-8')
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    명령행 진입점. 예: python -m calculator ops.csv -o results.csv -e errors.csv
+    """
+    args = build_parser().parse_args(argv)
+    if args.chunk_size < 1:
+        build_parser().error("--chunk-size must be a positive integer.")
+    fmt = args.format or ('jsonl' if args.input.endswith(('.jsonl', '.json')) else 'csv')
+    source = _open(args.input, 'r', sys.stdin)
+    output = _open(args.output, 'w', sys.stdout)
+    errors = _open(args.errors, 'w', sys.stderr) if args.errors else sys.stderr
+    try:
+        stats = run(source, output, errors, fmt, args.output_format, args.chunk_size)
+    finally:
+        for stream in (source, output, errors):
+            if stream not in (sys.stdin, sys.stdout, sys.stderr):
+                stream.close()
+    if not args.quiet:
+        print(f"{stats['rows']} rows in {stats['seconds']:.3f}s ({stats['rows_per_second']:,.0f} rows/s), "
+              f"{stats['errors']} errors", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
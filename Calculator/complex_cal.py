@@ -1,5 +1,13 @@
 import cmath
-from typing import Union
+from typing import Optional, Sequence, Union
+from .utils import get_numpy
+
+def _as_complex_array(a):
+    """
+    입력을 complex128 배열로 변환하는 내부 함수. 이미 complex128 배열이면 복사하지 않습니다.
+    """
+    np = get_numpy()
+    return np.asarray(a, dtype=np.complex128)
 
 class ComplexCalculator:
     """
@@ -7,6 +15,11 @@ class ComplexCalculator:
     복소수의 덧셈, 뺄셈, 곱셈, 나눗셈, 절대값, 편각, 극좌표 변환, 직교좌표 변환 기능을 제공.
     """
 
+    # enable_cache로 결과 캐시를 켰을 때 캐시되는 메서드 목록
+    CACHED_METHODS = ('divide', 'magnitude', 'argument', 'to_polar', 'to_rectangular')
+
+    _result_cache = None  # 결과 캐시 (enable_cache를 호출하기 전에는 사용하지 않음)
+
     def add(self, a: complex, b: complex) -> complex:
         """
         두 복소수의 덧셈을 수행합니다.
@@ -112,3 +125,231 @@ class ComplexCalculator:
             complex: 변환된 직교 좌표 표현.
         """
         return cmath.rect(r, theta)
+
+    # ---- 결과 캐시 (opt-in) ----
+    # EngineeringCalculator.enable_cache와 같은 방식으로 CACHED_METHODS의 메서드를 캐시를 거치는 함수로 인스턴스에 덮어씁니다.
+
+    def enable_cache(self, maxsize: int = 1024, path: Optional[str] = None) -> None:
+        """
+        결과 캐시를 켜는 함수. 캐시 키는 (메서드 이름, 인자, 인자 타입)입니다.
+        1, 1.0, 1+0j처럼 값이 같아도 결과 타입이 다를 수 있으므로 인자 타입 이름도 키에 포함합니다.
+        path를 지정하면 결과를 SQLite 파일에 저장하는 PersistentCache를 사용하며, 켤 때 최근 사용된 결과를 미리 읽습니다.
+
+        Args:
+            maxsize (int): 캐시에 보관할 최대 결과 수 (path를 지정하면 파일에 보관할 최대 결과 수).
+            path (Optional[str]): 결과를 저장할 SQLite 파일 경로. None이면 메모리에만 보관.
+        """
+        self.disable_cache()
+        if path is None:
+            from .cache import LRUCache
+            self._result_cache = LRUCache(maxsize)
+        else:
+            from .persistent_cache import PersistentCache
+            self._result_cache = PersistentCache(path, maxsize, namespace=type(self).__name__, preload=True)
+        for name in self.CACHED_METHODS:
+            setattr(self, name, self._memoize(name))
+
+    def disable_cache(self) -> None:
+        """
+        결과 캐시를 끄고 저장된 결과를 모두 버리는 함수. PersistentCache는 모아 둔 쓰기를 파일에 기록하고 닫습니다.
+        """
+        if self._result_cache is None:
+            return
+        for name in self.CACHED_METHODS:
+            self.__dict__.pop(name, None)
+        close = getattr(self._result_cache, 'close', None)
+        if close is not None:
+            close()
+        self._result_cache = None
+
+    def cache_info(self) -> Optional[dict]:
+        """
+        결과 캐시의 적중/실패/제거 횟수와 크기를 반환하는 함수.
+
+        Returns:
+            Optional[dict]: hits, misses, evictions, size, maxsize 값 (PersistentCache는 hit_rate 등 추가).
+                            캐시가 꺼져 있으면 None.
+        """
+        if self._result_cache is None:
+            return None
+        return self._result_cache.info()
+
+    def _memoize(self, name: str):
+        """
+        메서드 호출 결과를 결과 캐시에 저장하는 함수로 감싸는 내부 함수.
+        해시할 수 없는 인자는 캐시하지 않고 원래 메서드를 호출합니다.
+        """
+        from .cache import MISSING
+
+        get, put = self._result_cache.get, self._result_cache.put
+        cls = type(self)
+
+        def cached(*args):
+            key = (name, args, tuple(type(arg).__name__ for arg in args))
+            try:
+                value = get(key)
+            except TypeError:
+                return getattr(cls, name)(self, *args)
+            if value is MISSING:
+                value = getattr(cls, name)(self, *args)
+                put(key, value)
+            return value
+
+        cached.__name__ = name
+        cached.__doc__ = getattr(cls, name).__doc__
+        return cached
+
+    # ---- 배열(batch) 연산 ----
+    # 아래 메서드들은 complex128 배열(또는 복소수 시퀀스)을 받아 Python complex 객체 없이 한 번에 계산합니다.
+    # 실수부/허수부 배열이 따로 있는 경우 complex_array로 먼저 합치거나, 극좌표 변환은 from_parts_to_polar 메서드를 사용합니다.
+
+    def complex_array(self, real: Sequence, imag: Sequence):
+        """
+        실수부 배열과 허수부 배열을 하나의 complex128 배열로 합칩니다.
+
+        Args:
+            real (Sequence): 실수부 배열.
+            imag (Sequence): 허수부 배열.
+
+        Returns:
+            numpy.ndarray: complex128 배열.
+        """
+        np = get_numpy()
+        real, imag = np.broadcast_arrays(np.asarray(real, dtype=float), np.asarray(imag, dtype=float))
+        result = np.empty(real.shape, dtype=np.complex128)
+        result.real = real  # 중간 complex 배열 없이 실수부/허수부를 직접 채움
+        result.imag = imag
+        return result
+
+    def add_array(self, a: Sequence, b: Sequence):
+        """
+        두 복소수 배열의 원소별 덧셈을 수행합니다.
+
+        Args:
+            a (Sequence): 첫 번째 복소수 배열.
+            b (Sequence): 두 번째 복소수 배열.
+
+        Returns:
+            numpy.ndarray: 두 배열의 합 (complex128).
+        """
+        return get_numpy().add(_as_complex_array(a), _as_complex_array(b))
+
+    def subtract_array(self, a: Sequence, b: Sequence):
+        """
+        두 복소수 배열의 원소별 뺄셈을 수행합니다.
+
+        Args:
+            a (Sequence): 첫 번째 복소수 배열.
+            b (Sequence): 두 번째 복소수 배열.
+
+        Returns:
+            numpy.ndarray: 첫 번째 배열에서 두 번째 배열을 뺀 값 (complex128).
+        """
+        return get_numpy().subtract(_as_complex_array(a), _as_complex_array(b))
+
+    def multiply_array(self, a: Sequence, b: Sequence):
+        """
+        두 복소수 배열의 원소별 곱셈을 수행합니다.
+
+        Args:
+            a (Sequence): 첫 번째 복소수 배열.
+            b (Sequence): 두 번째 복소수 배열.
+
+        Returns:
+            numpy.ndarray: 두 배열의 곱 (complex128).
+        """
+        return get_numpy().multiply(_as_complex_array(a), _as_complex_array(b))
+
+    def divide_array(self, a: Sequence, b: Sequence, fill: Optional[complex] = None, return_mask: bool = False):
+        """
+        두 복소수 배열의 원소별 나눗셈을 수행합니다.
+        제수가 0인 원소는 예외 대신 nan 또는 inf 값을 가지며, fill 값으로 바꾸거나 return_mask로 위치를 받을 수 있습니다.
+
+        Args:
+            a (Sequence): 나눗셈의 피제수 배열.
+            b (Sequence): 나눗셈의 제수 배열.
+            fill (Optional[complex]): 제수가 0인 원소에 넣을 값. None이면 nan/inf를 그대로 둡니다.
+            return_mask (bool): True이면 제수가 0인 위치를 나타내는 boolean 배열을 함께 반환합니다.
+
+        Returns:
+            numpy.ndarray: 두 배열의 나눗셈 결과 (complex128).
+                return_mask=True이면 (결과 배열, 제수가 0인 위치의 boolean 배열).
+        """
+        np = get_numpy()
+        b = _as_complex_array(b)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = np.true_divide(_as_complex_array(a), b)
+        if fill is None and not return_mask:
+            return result
+        mask = np.broadcast_to(b == 0, result.shape).copy()
+        if fill is not None:
+            result = np.where(mask, fill, result)
+        return (result, mask) if return_mask else result
+
+    def magnitude_array(self, a: Sequence):
+        """
+        복소수 배열의 각 원소의 절대값(크기)을 계산합니다.
+
+        Args:
+            a (Sequence): 절대값을 구할 복소수 배열.
+
+        Returns:
+            numpy.ndarray: 각 복소수의 크기 (float64).
+        """
+        return get_numpy().abs(_as_complex_array(a))
+
+    def argument_array(self, a: Sequence):
+        """
+        복소수 배열의 각 원소의 편각(Argument)을 계산합니다.
+
+        Args:
+            a (Sequence): 편각을 구할 복소수 배열.
+
+        Returns:
+            numpy.ndarray: 각 복소수의 편각 (라디안 값, float64).
+        """
+        return get_numpy().angle(_as_complex_array(a))
+
+    def to_polar_array(self, a: Sequence):
+        """
+        복소수 배열을 극좌표로 변환합니다.
+
+        Args:
+            a (Sequence): 극좌표로 변환할 복소수 배열.
+
+        Returns:
+            tuple: (크기 배열, 편각 배열). 편각은 라디안 값입니다.
+        """
+        np = get_numpy()
+        a = _as_complex_array(a)
+        return np.abs(a), np.angle(a)
+
+    def from_parts_to_polar(self, real: Sequence, imag: Sequence):
+        """
+        실수부/허수부 배열을 complex 배열을 만들지 않고 바로 극좌표로 변환합니다.
+
+        Args:
+            real (Sequence): 실수부 배열.
+            imag (Sequence): 허수부 배열.
+
+        Returns:
+            tuple: (크기 배열, 편각 배열). 편각은 라디안 값입니다.
+        """
+        np = get_numpy()
+        return np.hypot(real, imag), np.arctan2(imag, real)
+
+    def to_rectangular_array(self, r: Sequence, theta: Sequence):
+        """
+        극좌표 배열을 직교 좌표 배열로 변환합니다.
+
+        Args:
+            r (Sequence): 극좌표의 크기 배열.
+            theta (Sequence): 극좌표의 편각 배열 (라디안 값).
+
+        Returns:
+            numpy.ndarray: 변환된 직교 좌표 표현 (complex128).
+        """
+        np = get_numpy()
+        r = np.asarray(r, dtype=float)
+        theta = np.asarray(theta, dtype=float)
+        return self.complex_array(r * np.cos(theta), r * np.sin(theta))
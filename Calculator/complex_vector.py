@@ -0,0 +1,216 @@
+# calculator/complex_vector.py
+
+import math
+import operator
+from array import array
+from itertools import repeat
+from typing import Iterable, Iterator, Tuple, Union
+
+_add, _sub, _mul = operator.add, operator.sub, operator.mul
+_real, _imag = operator.attrgetter('real'), operator.attrgetter('imag')
+
+
+def _compact(values: Iterable[float]) -> array:
+    """
+    값들을 array('d')로 만드는 내부 함수. 반복자를 바로 넘기면 array가 늘어나면서 여유 공간을 남기므로
+    리스트로 먼저 모아 정확한 크기로 만듭니다.
+    """
+    return array('d', values if isinstance(values, (array, list)) else list(values))
+
+
+def _zero_safe_divide(a: complex, b: complex) -> complex:
+    """
+    0으로 나누면 예외 대신 nan을 반환하는 복소수 나눗셈 (ComplexCalculator.divide_array와 같이 예외 없이 계산).
+    """
+    try:
+        return a / b
+    except ZeroDivisionError:
+        return complex(math.nan, math.nan)
+
+
+class ComplexVector:
+    """
+    NumPy 없이 복소수 여러 개를 한 번에 계산하는 벡터 클래스 (ComplexCalculator의 *_array 메서드의 표준 라이브러리 버전).
+
+    실수부와 허수부를 각각 array('d')에 나누어 저장하므로 원소당 16바이트만 사용합니다
+    (Python complex 객체의 리스트는 원소당 객체 32바이트 + 포인터 8바이트).
+
+    - 사칙연산은 같은 길이의 ComplexVector 또는 복소수 하나(모든 원소에 적용)와 원소별로 계산하며,
+      +, -, *, / 연산자로도 사용할 수 있습니다. 0으로 나눈 원소는 예외 대신 nan+nanj가 됩니다.
+    - real, imag 속성은 array('d')이므로 버퍼 프로토콜을 지원합니다. memoryview(vector.real)나
+      buffers()로 복사 없이 내보낼 수 있습니다 (예: numpy.frombuffer(vector.real)).
+    """
+
+    __slots__ = ('real', 'imag')
+
+    def __init__(self, real: Iterable[float] = (), imag: Union[Iterable[float], None] = None):
+        """
+        클래스 초기화 함수.
+
+        Args:
+            real (Iterable[float]): 실수부 값들.
+            imag (Optional[Iterable[float]]): 허수부 값들 (None이면 모두 0).
+
+        Raises:
+            ValueError: 실수부와 허수부의 길이가 다를 경우 발생.
+        """
+        self.real = _compact(real)
+        self.imag = array('d', [0.0]) * len(self.real) if imag is None else _compact(imag)
+        if len(self.real) != len(self.imag):
+            raise ValueError("Real and imaginary parts must have the same length.")
+
+    @classmethod
+    def from_complex(cls, values: Iterable[complex]) -> 'ComplexVector':
+        """
+        복소수들로 벡터를 만드는 함수.
+        """
+        values = list(map(complex, values))
+        return cls(map(_real, values), map(_imag, values))
+
+    @classmethod
+    def from_polar(cls, r: Iterable[float], theta: Iterable[float]) -> 'ComplexVector':
+        """
+        극좌표(크기, 편각)들로 벡터를 만드는 함수 (ComplexCalculator.to_rectangular_array와 같음).
+
+        Args:
+            r (Iterable[float]): 크기들.
+            theta (Iterable[float]): 편각들 (라디안 값).
+        """
+        r, theta = list(r), list(theta)
+        if len(r) != len(theta):
+            raise ValueError("Magnitudes and angles must have the same length.")
+        return cls(map(_mul, r, map(math.cos, theta)), map(_mul, r, map(math.sin, theta)))
+
+    def __len__(self) -> int:
+        return len(self.real)
+
+    def __iter__(self) -> Iterator[complex]:
+        return map(complex, self.real, self.imag)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[complex, 'ComplexVector']:
+        if isinstance(index, slice):
+            return ComplexVector(self.real[index], self.imag[index])
+        return complex(self.real[index], self.imag[index])
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ComplexVector):
+            return NotImplemented
+        return self.real == other.real and self.imag == other.imag
+
+    def __repr__(self) -> str:
+        return f"ComplexVector({self.tolist()})"
+
+    def tolist(self) -> list:
+        """
+        원소들을 Python complex 리스트로 반환하는 함수.
+        """
+        return list(self)
+
+    def buffers(self) -> Tuple[memoryview, memoryview]:
+        """
+        실수부와 허수부를 복사 없이 내보내는 함수.
+
+        Returns:
+            Tuple[memoryview, memoryview]: 실수부, 허수부의 memoryview (형식 'd').
+        """
+        return memoryview(self.real), memoryview(self.imag)
+
+    def _parts(self, other) -> tuple:
+        """
+        다른 피연산자의 실수부/허수부 반복자를 반환하는 내부 함수. 복소수 하나는 모든 원소에 반복 적용합니다.
+        """
+        if isinstance(other, ComplexVector):
+            if len(other) != len(self):
+                raise ValueError(f"Vector lengths differ: {len(self)} and {len(other)}")
+            return other.real, other.imag
+        if isinstance(other, (int, float, complex)):
+            other = complex(other)
+            return repeat(other.real, len(self)), repeat(other.imag, len(self))
+        raise TypeError(f"Unsupported operand type: {type(other).__name__}")
+
+    # ---- 원소별 연산 (ComplexCalculator 메서드와 같은 이름) ----
+
+    def add(self, other: Union['ComplexVector', complex]) -> 'ComplexVector':
+        """
+        원소별 덧셈을 수행합니다.
+        """
+        real, imag = self._parts(other)
+        return ComplexVector(map(_add, self.real, real), map(_add, self.imag, imag))
+
+    def subtract(self, other: Union['ComplexVector', complex]) -> 'ComplexVector':
+        """
+        원소별 뺄셈을 수행합니다.
+        """
+        real, imag = self._parts(other)
+        return ComplexVector(map(_sub, self.real, real), map(_sub, self.imag, imag))
+
+    def multiply(self, other: Union['ComplexVector', complex]) -> 'ComplexVector':
+        """
+        원소별 곱셈을 수행합니다: (a + bi)(c + di) = (ac - bd) + (ad + bc)i
+        """
+        real, imag = self._parts(other)
+        if not isinstance(other, ComplexVector):
+            real, imag = list(real), list(imag)  # repeat 반복자는 한 번만 읽을 수 있으므로 두 번 쓰기 위해 리스트로 만듦
+        a, b = self.real, self.imag
+        return ComplexVector(map(_sub, map(_mul, a, real), map(_mul, b, imag)),
+                             map(_add, map(_mul, a, imag), map(_mul, b, real)))
+
+    def divide(self, other: Union['ComplexVector', complex]) -> 'ComplexVector':
+        """
+        원소별 나눗셈을 수행합니다. overflow를 피하기 위해 Python complex 나눗셈으로 계산하며,
+        제수가 0인 원소는 예외 대신 nan+nanj가 됩니다.
+        """
+        real, imag = self._parts(other)
+        dividends, divisors = map(complex, self.real, self.imag), map(complex, real, imag)
+        try:
+            quotients = list(map(operator.truediv, dividends, divisors))
+        except ZeroDivisionError:
+            real, imag = self._parts(other)
+            quotients = list(map(_zero_safe_divide, map(complex, self.real, self.imag), map(complex, real, imag)))
+        return ComplexVector(map(_real, quotients), map(_imag, quotients))
+
+    def magnitude(self) -> array:
+        """
+        각 원소의 절대값(크기)을 계산합니다.
+
+        Returns:
+            array: 각 복소수의 크기 (array('d')).
+        """
+        return _compact(map(math.hypot, self.real, self.imag))
+
+    def argument(self) -> array:
+        """
+        각 원소의 편각을 계산합니다.
+
+        Returns:
+            array: 각 복소수의 편각 (라디안 값, array('d')).
+        """
+        return _compact(map(math.atan2, self.imag, self.real))
+
+    def to_polar(self) -> Tuple[array, array]:
+        """
+        각 원소를 극좌표로 변환합니다.
+
+        Returns:
+            Tuple[array, array]: (크기 배열, 편각 배열). 편각은 라디안 값입니다.
+        """
+        return self.magnitude(), self.argument()
+
+    __add__ = add
+    __sub__ = subtract
+    __mul__ = multiply
+    __truediv__ = divide
+
+    def __radd__(self, other: complex) -> 'ComplexVector':
+        return self.add(other)
+
+    def __rmul__(self, other: complex) -> 'ComplexVector':
+        return self.multiply(other)
+
+    def __rsub__(self, other: complex) -> 'ComplexVector':
+        real, imag = self._parts(other)
+        return ComplexVector(map(_sub, real, self.real), map(_sub, imag, self.imag))
+
+    def __rtruediv__(self, other: complex) -> 'ComplexVector':
+        real, imag = self._parts(other)
+        return ComplexVector(real, imag).divide(self)  # 제수가 0인 원소는 divide와 같이 nan+nanj
@@ -1,14 +1,56 @@
 # calculator/engineering.py
 
 import math
+import threading
+from contextvars import ContextVar
 from .basic import Calculator
-from .utils import round_result, convert_to_radians
-from typing import Optional, Union
+from .utils import round_result, convert_to_radians, round_array, convert_to_radians_array, get_numpy, power_result
+from typing import TYPE_CHECKING, Optional, Sequence, Union
+
+# 결과 캐시, 삼각함수 표, 설정 고정 계산기는 opt-in 기능이므로 처음 사용할 때 가져옵니다 (패키지 import 시간 단축).
+if TYPE_CHECKING:
+    from .frozen import FrozenCalculator
+    from .lazy import LazyCalculator
+    from .trig_table import DegreeTrigTable
 
 # 각도 단위를 상수로 정의
 RADIAN = 'radian'
 DEGREE = 'degree'
 
+# settings 블록의 설정은 인스턴스마다 만드는 ContextVar에 (precision, return_float, unit) 튜플로 저장되므로
+# 스레드마다, asyncio 작업(task)마다 따로 유지됩니다. settings를 한 번도 사용하지 않은 인스턴스는 값이 설정되지 않는
+# 아래 공용 ContextVar를 사용합니다 (항상 None).
+_NO_SETTINGS: ContextVar[Optional[tuple]] = ContextVar('calculator_settings', default=None)
+_settings_lock = threading.Lock()  # 인스턴스의 ContextVar를 한 번만 만들기 위한 잠금
+
+# settings에서 지정하지 않은 설정을 나타내는 값 (precision=None과 구분하기 위해 사용)
+_UNSET = object()
+
+
+class _Settings:
+    """
+    EngineeringCalculator.settings가 반환하는 context manager.
+    블록에 들어갈 때 이 계산기의 ContextVar에 설정을 저장하고, 나올 때 이전 값으로 되돌립니다.
+    """
+
+    __slots__ = ('_calculator', '_settings', '_token')
+
+    def __init__(self, calculator: 'EngineeringCalculator', settings: tuple):
+        self._calculator = calculator
+        self._settings = settings
+        self._token = None
+
+    def __enter__(self) -> 'EngineeringCalculator':
+        calculator = self._calculator
+        variable = calculator._context_settings
+        previous = variable.get() or calculator._instance_settings()
+        self._token = variable.set(tuple(old if new is _UNSET else new for old, new in zip(previous, self._settings)))
+        return calculator
+
+    def __exit__(self, *exc_info) -> None:
+        self._calculator._context_settings.reset(self._token)
+        self._token = None
+
 class EngineeringCalculator(Calculator):
     """
     공학용 계산기 클래스, 기본 계산기 기능 외에 공학적 연산을 제공하는 클래스.
@@ -16,6 +58,12 @@ class EngineeringCalculator(Calculator):
     또한 결과를 소수점 자릿수와 원하는 타입(float 또는 int)으로 제어할 수 있습니다.
     """
 
+    # enable_cache로 결과 캐시를 켰을 때 캐시되는 메서드 목록
+    CACHED_METHODS = ('square_root', 'power', 'log', 'sin', 'cos', 'tan')
+
+    # settings 블록의 설정을 저장하는 ContextVar (settings를 처음 호출할 때 인스턴스마다 생성)
+    _context_settings = _NO_SETTINGS
+
     def __init__(self, precision: Optional[int] = None, return_float: bool = False):
         """
         클래스 초기화 함수.
@@ -28,11 +76,14 @@ class EngineeringCalculator(Calculator):
         """
         self._precision = precision  # 소수점 자릿수
         self._return_float = return_float  # float 타입 강제 변환 여부
+        self._result_cache = None  # 결과 캐시 (enable_cache를 호출하기 전에는 사용하지 않음)
+        self._trig_table = None  # degree 삼각함수 표 (enable_trig_table을 호출하기 전에는 사용하지 않음)
 
     # precision 속성에 대한 getter
     @property
     def precision(self):
-        return self._precision
+        settings = self._context_settings.get()
+        return self._precision if settings is None else settings[0]  # settings 블록 안에서는 블록의 설정을 사용
 
     # precision 속성에 대한 setter
     @precision.setter
@@ -53,7 +104,17 @@ class EngineeringCalculator(Calculator):
     # return_float 속성에 대한 getter
     @property
     def return_float(self):
-        return self._return_float
+        settings = self._context_settings.get()
+        return self._return_float if settings is None else settings[1]
+
+    # 각도 단위 기본값에 대한 getter (settings 블록 밖에서는 항상 'radian')
+    @property
+    def unit(self) -> str:
+        settings = self._context_settings.get()
+        return RADIAN if settings is None else settings[2]
+
+    def _instance_settings(self) -> tuple:
+        return (self._precision, self._return_float, RADIAN)
 
     # return_float 속성에 대한 setter
     @return_float.setter
@@ -71,9 +132,222 @@ class EngineeringCalculator(Calculator):
             raise TypeError("Return_float must be a boolean.")
         self._return_float = value
 
+    # ---- context별 설정 ----
+
+    def settings(self, precision: Optional[int] = _UNSET, return_float: bool = _UNSET,
+                 unit: str = _UNSET) -> _Settings:
+        """
+        with 블록 안에서만 적용되는 설정을 지정하는 함수.
+
+        설정은 contextvars로 저장되므로 현재 스레드(또는 asyncio 작업) 안에서만 보이며, 다른 스레드/작업이
+        같은 인스턴스를 동시에 사용해도 서로 영향을 주지 않습니다. 따라서 요청마다 계산기를 새로 만들거나
+        setter에 잠금을 걸지 않고 인스턴스 하나를 공유할 수 있습니다. 블록은 중첩할 수 있으며, 지정하지 않은
+        설정은 바깥 블록(없으면 인스턴스 속성)의 값을 사용합니다. 블록 안에서 바꾼 precision/return_float
+        속성은 블록이 끝난 뒤부터 보입니다.
+
+        예: with calc.settings(precision=4, unit='degree'): calc.sin(30)
+
+        Args:
+            precision (Optional[int]): 블록 안에서 사용할 소수점 자릿수 (None이면 반올림하지 않음).
+            return_float (bool): 블록 안에서 배열 결과를 float로 반환할지 여부.
+            unit (str): 블록 안에서 sin/cos/tan과 배열 버전, freeze의 unit을 생략했을 때 사용할 각도 단위.
+
+        Returns:
+            context manager. with 문의 as 대상은 이 계산기입니다.
+
+        Raises:
+            TypeError: precision이 정수나 None이 아니거나, return_float이 boolean이 아닐 경우 발생.
+            ValueError: unit이 'radian' 또는 'degree'가 아닐 경우 발생.
+        """
+        if precision is not _UNSET and precision is not None and not isinstance(precision, int):
+            raise TypeError("Precision must be an integer or None.")
+        if return_float is not _UNSET and not isinstance(return_float, bool):
+            raise TypeError("Return_float must be a boolean.")
+        if unit is not _UNSET and unit not in (RADIAN, DEGREE):
+            raise ValueError(f"Unknown angle unit: {unit!r}")
+        if '_context_settings' not in self.__dict__:
+            with _settings_lock:
+                if '_context_settings' not in self.__dict__:
+                    self._context_settings = ContextVar(f'calculator_settings_{id(self):x}', default=None)
+        return _Settings(self, (precision, return_float, unit))
+
+    # ---- 결과 캐시 (opt-in) ----
+    # enable_cache는 CACHED_METHODS의 메서드를 캐시를 거치는 함수로 인스턴스에 덮어씁니다.
+    # 캐시를 켜지 않은 인스턴스는 클래스 메서드를 그대로 호출하므로 추가 비용이 없습니다.
+
+    def enable_cache(self, maxsize: int = 1024, path: Optional[str] = None) -> None:
+        """
+        결과 캐시를 켜는 함수. 캐시 키는 (메서드 이름, 인자, 인자 타입, unit 등 키워드 인자, precision, return_float,
+        기본 각도 단위)입니다.
+        precision이나 return_float을 바꾸거나 settings 블록 안에서 호출하면 키가 달라지므로 다른 설정의 결과가 반환되지 않습니다.
+
+        path를 지정하면 결과를 SQLite 파일에 저장하는 PersistentCache를 사용합니다. 같은 파일을 지정한 다른 프로세스나
+        다시 시작한 프로세스가 결과를 재사용하며, 켤 때 최근 사용된 결과를 미리 읽습니다 (PersistentCache 참고).
+
+        Args:
+            maxsize (int): 캐시에 보관할 최대 결과 수. 넘으면 가장 오래 사용되지 않은 결과부터 제거(LRU).
+                           path를 지정하면 파일에 보관할 최대 결과 수.
+            path (Optional[str]): 결과를 저장할 SQLite 파일 경로. None이면 메모리에만 보관.
+        """
+        self.disable_cache()
+        if path is None:
+            from .cache import LRUCache
+            self._result_cache = LRUCache(maxsize)
+        else:
+            from .persistent_cache import PersistentCache
+            self._result_cache = PersistentCache(path, maxsize, namespace=type(self).__name__, preload=True)
+        for name in self.CACHED_METHODS:
+            setattr(self, name, self._memoize(name))
+
+    def disable_cache(self) -> None:
+        """
+        결과 캐시를 끄고 저장된 결과를 모두 버리는 함수. PersistentCache는 모아 둔 쓰기를 파일에 기록하고 닫습니다.
+        """
+        if self._result_cache is None:
+            return
+        for name in self.CACHED_METHODS:
+            self.__dict__.pop(name, None)
+        close = getattr(self._result_cache, 'close', None)
+        if close is not None:
+            close()
+        self._result_cache = None
+
+    def clear_cache(self, method: Optional[str] = None) -> int:
+        """
+        캐시된 결과를 무효화하는 함수.
+
+        Args:
+            method (Optional[str]): 무효화할 메서드 이름 (예: 'sin'). None이면 모든 결과를 무효화.
+
+        Returns:
+            int: 삭제된 결과 수. 캐시가 꺼져 있으면 0.
+        """
+        if self._result_cache is None:
+            return 0
+        if method is None:
+            return self._result_cache.invalidate()
+        return self._result_cache.invalidate(lambda key: key[0] == method)
+
+    def cache_info(self) -> Optional[dict]:
+        """
+        결과 캐시의 적중/실패/제거 횟수와 크기를 반환하는 함수.
+
+        Returns:
+            Optional[dict]: hits, misses, evictions, size, maxsize 값 (PersistentCache는 hit_rate 등 추가).
+                            캐시가 꺼져 있으면 None.
+        """
+        if self._result_cache is None:
+            return None
+        return self._result_cache.info()
+
+    def _memoize(self, name: str):
+        """
+        메서드 호출 결과를 결과 캐시에 저장하는 함수로 감싸는 내부 함수.
+        해시할 수 없는 인자(배열 등)는 캐시하지 않고 원래 메서드를 호출합니다.
+        2 == 2.0처럼 값이 같아도 타입에 따라 결과가 다를 수 있으므로(power 등) 인자 타입 이름도 키에 포함합니다.
+        원래 메서드는 호출할 때마다 클래스에서 찾으므로, 캐시를 켠 뒤에 계측(instrumentation)을 켜도
+        캐시 실패(miss) 시의 계산이 기록됩니다.
+        """
+        from .cache import MISSING
+
+        get, put = self._result_cache.get, self._result_cache.put
+        cls = type(self)
+
+        def cached(*args, **kwargs):
+            key = (name, args, tuple(type(arg).__name__ for arg in args),
+                   tuple(sorted((k, v, type(v).__name__) for k, v in kwargs.items())) if kwargs else (),
+                   self.precision, self.return_float, self.unit)
+            try:
+                value = get(key)
+            except TypeError:
+                return getattr(cls, name)(self, *args, **kwargs)
+            if value is MISSING:
+                value = getattr(cls, name)(self, *args, **kwargs)
+                put(key, value)
+            return value
+
+        cached.__name__ = name
+        cached.__doc__ = getattr(cls, name).__doc__
+        return cached
+
+    # ---- degree 삼각함수 표 (opt-in) ----
+
+    def enable_trig_table(self, step: float = 0.1, interpolate: bool = False) -> 'DegreeTrigTable':
+        """
+        unit='degree'인 sin/cos/tan (및 배열 버전) 호출에 미리 계산된 표를 사용하도록 설정하는 함수.
+        정확도와 오차 범위는 DegreeTrigTable 설명을 참고하세요. 캐시된 결과는 무효화됩니다.
+
+        Args:
+            step (float): 표의 격자 간격 (degree). 기본값은 0.1.
+            interpolate (bool): 격자 밖 각도를 보간으로 계산할지 여부. 기본값은 False.
+
+        Returns:
+            DegreeTrigTable: 생성된 표.
+        """
+        from .trig_table import DegreeTrigTable
+
+        self._trig_table = DegreeTrigTable(step, interpolate)
+        self.clear_cache()
+        return self._trig_table
+
+    def disable_trig_table(self) -> None:
+        """
+        degree 삼각함수 표 사용을 끄는 함수. 캐시된 결과는 무효화됩니다.
+        """
+        self._trig_table = None
+        self.clear_cache()
+
+    def freeze(self, unit: Optional[str] = None) -> 'FrozenCalculator':
+        """
+        현재 설정(precision, return_float, degree 삼각함수 표)을 고정한 FrozenCalculator를 만드는 함수.
+        반복문에서 같은 설정으로 여러 번 호출할 때 사용합니다. 이후 이 계산기의 설정을 바꿔도 반영되지 않습니다.
+
+        Args:
+            unit (Optional[str]): 고정할 각도 단위 ('radian' 또는 'degree'). 생략하면 settings 블록의 unit(기본값 'radian').
+
+        Returns:
+            FrozenCalculator: 설정이 고정된 계산기.
+        """
+        from .frozen import FrozenCalculator
+
+        if unit is None:
+            unit = self.unit
+        return FrozenCalculator(self.precision, self.return_float, unit, self._trig_table)
+
+    def lazy(self) -> 'LazyCalculator':
+        """
+        이 계산기의 precision을 사용하는 LazyCalculator를 만드는 함수.
+        메서드 호출이 바로 계산되지 않고 지연 계산 그래프를 만들며, 반올림은 마지막 결과에 한 번만 적용됩니다.
+
+        Returns:
+            LazyCalculator: 지연 계산 그래프를 만드는 계산기.
+        """
+        from .lazy import LazyCalculator
+
+        return LazyCalculator(self.precision)
+
+    def polynomial(self, coefficients: Sequence, x, method: str = 'auto'):
+        """
+        계수 목록(최고차항부터)으로 정의한 다항식을 x에서 계산하는 함수 (polynomial.Polynomial 참고).
+        중간 계산은 반올림하지 않고, precision은 마지막 결과에 한 번만 적용합니다.
+
+        Args:
+            coefficients (Sequence): 최고차항부터 나열한 실수 또는 복소수 계수들 (예: [2, 0, -1]은 2x² - 1).
+            x: 숫자 하나 또는 숫자 배열 (배열은 NumPy 필요).
+            method (str): 'auto'(기본값), 'horner', 'estrin' 중 하나.
+
+        Returns:
+            숫자 입력이면 숫자, 배열 입력이면 NumPy 배열.
+        """
+        from .polynomial import polyval
+
+        return polyval(coefficients, x, self.precision, method)
+
     def square_root(self, x: Union[int, float]) -> Union[int, float]:
         """
         제곱근을 계산하는 함수.
+        float 범위를 넘는 큰 정수는 math.isqrt로 계산합니다. 완전제곱수이면 정확한 정수 제곱근을, 아니면 정수 제곱근을
+        float로 바꿔 반환합니다 (제곱근도 float 범위를 넘으면 OverflowError).
 
         Args:
             x (Union[int, float]): 제곱근을 구할 값.
@@ -81,23 +355,109 @@ class EngineeringCalculator(Calculator):
         Returns:
             Union[int, float]: 결과값. 소수점 자릿수는 precision에 따라 제한되며, return_float에 따라 float 타입으로 반환될 수 있음.
         """
-        result = math.sqrt(x)  # math.sqrt로 제곱근 계산
+        try:
+            result = math.sqrt(x)  # math.sqrt로 제곱근 계산
+        except OverflowError:
+            if not isinstance(x, int):
+                raise
+            root = math.isqrt(x)
+            if root * root == x:
+                return root
+            result = float(root)  # 오차(1 미만)가 float 한 칸(ulp)보다 훨씬 작음
         return round_result(result, precision=self.precision)  # round_result를 사용하여 precision 적용
 
-    def power(self, x: Union[int, float], y: Union[int, float]) -> Union[int, float]:
+    def power(self, x: Union[int, float], y: Union[int, float], modulus: Optional[int] = None) -> Union[int, float]:
         """
         거듭제곱을 계산하는 함수.
+        결과가 float 범위를 넘는 정수 거듭제곱은 MAX_EXACT_POWER_BITS 비트까지 정확한 정수로 계산합니다 (power_result 참고).
+        그보다 큰 정확한 정수 결과는 int_power로 명시적으로 계산합니다.
 
         Args:
             x (Union[int, float]): 밑값.
             y (Union[int, float]): 지수값.
+            modulus (Optional[int], optional): 지정하면 int_power로 (x ** y) % modulus를 정확한 정수로 계산. 기본값은 None.
 
         Returns:
             Union[int, float]: 결과값. 소수점 자릿수는 precision에 따라 제한될 수 있음.
         """
-        result = math.pow(x, y)  # math.pow로 거듭제곱 계산
+        if modulus is not None:
+            return self.int_power(x, y, modulus)
+        result = power_result(x, y)  # math.pow로 거듭제곱 계산
         return round_result(result, precision=self.precision)  # round_result를 사용하여 precision 적용
 
+    # ---- 정수 연산 ----
+    # 아래 메서드들은 float로 바꾸지 않고 정수로 계산하므로 결과가 정확하며, 큰 정수에서도 overflow가 없습니다.
+    # 결과가 정수이므로 precision과 return_float 설정은 적용하지 않습니다.
+
+    def int_power(self, x: int, y: int, modulus: Optional[int] = None) -> int:
+        """
+        정수 거듭제곱을 정확히 계산하는 함수. 내장 pow로 제곱을 반복하는 방식(exponentiation by squaring)으로
+        계산하며, modulus를 지정하면 중간 결과를 매 단계 나머지로 줄이므로 지수가 커도 빠릅니다.
+
+        Args:
+            x (int): 밑값.
+            y (int): 지수값. modulus가 없으면 0 이상이어야 합니다.
+                modulus가 있으면 음수도 가능하며, 이때는 x의 모듈러 역원을 거듭제곱합니다.
+            modulus (Optional[int], optional): 나머지를 구할 값. 기본값은 None.
+
+        Returns:
+            int: x ** y 또는 (x ** y) % modulus.
+
+        Raises:
+            TypeError: 인자가 정수가 아닐 경우 발생.
+            ValueError: modulus 없이 지수가 음수이거나, modulus가 0이거나, 역원이 없을 경우 발생.
+        """
+        if not (isinstance(x, int) and isinstance(y, int) and (modulus is None or isinstance(modulus, int))):
+            raise TypeError("int_power requires integer arguments.")
+        if modulus is None:
+            if y < 0:
+                raise ValueError("Negative exponent needs a modulus for an exact integer result.")
+            return x ** y
+        return pow(x, y, modulus)
+
+    def int_sqrt(self, x: int, exact: bool = False) -> int:
+        """
+        정수 제곱근(내림값)을 math.isqrt로 정확히 계산하는 함수 (예: int_sqrt(17) = 4).
+
+        Args:
+            x (int): 0 이상의 정수.
+            exact (bool, optional): True이면 x가 완전제곱수가 아닐 때 ValueError를 발생. 기본값은 False.
+
+        Returns:
+            int: x의 제곱근 이하인 가장 큰 정수.
+
+        Raises:
+            TypeError: x가 정수가 아닐 경우 발생.
+            ValueError: x가 음수이거나, exact=True인데 완전제곱수가 아닐 경우 발생.
+        """
+        if not isinstance(x, int):
+            raise TypeError("int_sqrt requires an integer argument.")
+        root = math.isqrt(x)
+        if exact and root * root != x:
+            raise ValueError(f"{x} is not a perfect square.")
+        return root
+
+    def is_perfect_square(self, x: int) -> bool:
+        """
+        정수가 완전제곱수인지 확인하는 함수. 제곱수의 16진수 마지막 자리는 0, 1, 4, 9 중 하나이므로
+        이 조건으로 대부분의 수를 isqrt 계산 없이 걸러냅니다.
+
+        Args:
+            x (int): 확인할 정수.
+
+        Returns:
+            bool: 완전제곱수이면 True (음수는 False).
+
+        Raises:
+            TypeError: x가 정수가 아닐 경우 발생.
+        """
+        if not isinstance(x, int):
+            raise TypeError("is_perfect_square requires an integer argument.")
+        if x < 0 or (x & 0xF) not in (0, 1, 4, 9):
+            return False
+        root = math.isqrt(x)
+        return root * root == x
+
     def log(self, x: Union[int, float], base: int = 10) -> Union[int, float]:
         """
         로그를 계산하는 함수 (기본값은 상용로그, base=10).
@@ -112,47 +472,192 @@ class EngineeringCalculator(Calculator):
         result = math.log(x, base)  # math.log로 로그 계산
         return round_result(result, precision=self.precision)  # round_result를 사용하여 precision 적용
 
-    def sin(self, angle: Union[int, float], unit: str = RADIAN) -> Union[int, float]:
+    def sin(self, angle: Union[int, float], unit: Optional[str] = None) -> Union[int, float]:
         """
         사인 값을 계산하는 함수. 기본적으로 라디안 단위로 계산되며, 'degree' 옵션을 사용하면 각도를 degree로 변환하여 계산 가능.
 
         Args:
             angle (Union[int, float]): 각도 값 (라디안 또는 degree).
-            unit (str, optional): 각도의 단위 ('radian' 또는 'degree'). 기본값은 'radian'.
+            unit (Optional[str], optional): 각도의 단위 ('radian' 또는 'degree'). 생략하면 settings 블록의 unit(기본값 'radian').
 
         Returns:
             Union[int, float]: 결과값. 소수점 자릿수는 precision에 따라 제한될 수 있음.
         """
+        if unit is None:
+            unit = self.unit
+        table = self._trig_table
+        if table is not None and unit == DEGREE:
+            result = table.sin_values.get(angle)  # 0°~360° 격자 각도는 딕셔너리 조회 한 번으로 계산
+            if result is None:
+                result = table.sin(angle)
+            return round_result(result, precision=self.precision)
         angle_in_radians = convert_to_radians(angle, unit)  # 각도 단위를 라디안으로 변환
         result = math.sin(angle_in_radians)  # math.sin으로 사인 값 계산
         return round_result(result, precision=self.precision)  # round_result를 사용하여 precision 적용
 
-    def cos(self, angle: Union[int, float], unit: str = RADIAN) -> Union[int, float]:
+    def cos(self, angle: Union[int, float], unit: Optional[str] = None) -> Union[int, float]:
         """
         코사인 값을 계산하는 함수. 기본적으로 라디안 단위로 계산되며, 'degree' 옵션을 사용하면 각도를 degree로 변환하여 계산 가능.
 
         Args:
             angle (Union[int, float]): 각도 값 (라디안 또는 degree).
-            unit (str, optional): 각도의 단위 ('radian' 또는 'degree'). 기본값은 'radian'.
+            unit (Optional[str], optional): 각도의 단위 ('radian' 또는 'degree'). 생략하면 settings 블록의 unit(기본값 'radian').
 
         Returns:
             Union[int, float]: 결과값. 소수점 자릿수는 precision에 따라 제한될 수 있음.
         """
+        if unit is None:
+            unit = self.unit
+        table = self._trig_table
+        if table is not None and unit == DEGREE:
+            result = table.cos_values.get(angle)  # 0°~360° 격자 각도는 딕셔너리 조회 한 번으로 계산
+            if result is None:
+                result = table.cos(angle)
+            return round_result(result, precision=self.precision)
         angle_in_radians = convert_to_radians(angle, unit)  # 각도 단위를 라디안으로 변환
         result = math.cos(angle_in_radians)  # math.cos으로 코사인 값 계산
         return round_result(result, precision=self.precision)  # round_result를 사용하여 precision 적용
 
-    def tan(self, angle: Union[int, float], unit: str = RADIAN) -> Union[int, float]:
+    def tan(self, angle: Union[int, float], unit: Optional[str] = None) -> Union[int, float]:
         """
         탄젠트 값을 계산하는 함수. 기본적으로 라디안 단위로 계산되며, 'degree' 옵션을 사용하면 각도를 degree로 변환하여 계산 가능.
 
         Args:
             angle (Union[int, float]): 각도 값 (라디안 또는 degree).
-            unit (str, optional): 각도의 단위 ('radian' 또는 'degree'). 기본값은 'radian'.
+            unit (Optional[str], optional): 각도의 단위 ('radian' 또는 'degree'). 생략하면 settings 블록의 unit(기본값 'radian').
 
         Returns:
             Union[int, float]: 결과값. 소수점 자릿수는 precision에 따라 제한될 수 있음.
         """
+        if unit is None:
+            unit = self.unit
+        table = self._trig_table
+        if table is not None and unit == DEGREE:
+            result = table.tan_values.get(angle)  # 0°~360° 격자 각도는 딕셔너리 조회 한 번으로 계산
+            if result is None:
+                result = table.tan(angle)
+            return round_result(result, precision=self.precision)
         angle_in_radians = convert_to_radians(angle, unit)  # 각도 단위를 라디안으로 변환
         result = math.tan(angle_in_radians)  # math.tan으로 탄젠트 값 계산
         return round_result(result, precision=self.precision)  # round_result를 사용하여 precision 적용
+
+    # ---- 배열(batch) 연산 ----
+    # 아래 메서드들은 값 배열 전체를 받아 NumPy ufunc로 한 번에 계산합니다.
+    # 정의역을 벗어난 원소(음수의 제곱근/로그 등)는 예외 대신 nan이 됩니다.
+
+    def _finish_array(self, result):
+        """
+        배열 결과에 precision과 return_float 설정을 한 번에 적용하는 내부 함수.
+        """
+        result = round_array(result, self.precision)
+        if self.return_float:
+            result = get_numpy().asarray(result, dtype=float)
+        return result
+
+    def square_root_array(self, x: Sequence):
+        """
+        배열의 각 원소에 대한 제곱근을 계산하는 함수.
+
+        Args:
+            x (Sequence): 제곱근을 구할 값들의 배열.
+
+        Returns:
+            numpy.ndarray: 결과 배열. precision과 return_float 설정이 적용됨.
+        """
+        np = get_numpy()
+        with np.errstate(invalid='ignore'):
+            result = np.sqrt(np.asarray(x, dtype=float))
+        return self._finish_array(result)
+
+    def power_array(self, x: Sequence, y: Union[Sequence, int, float]):
+        """
+        배열의 각 원소에 대한 거듭제곱을 계산하는 함수. math.pow와 같이 float로 계산합니다.
+
+        Args:
+            x (Sequence): 밑값 배열.
+            y (Union[Sequence, int, float]): 지수값 배열 또는 모든 원소에 공통으로 적용할 지수값.
+
+        Returns:
+            numpy.ndarray: 결과 배열. precision과 return_float 설정이 적용됨.
+        """
+        np = get_numpy()
+        with np.errstate(invalid='ignore', over='ignore', divide='ignore'):
+            result = np.float_power(x, y)
+        return self._finish_array(result)
+
+    def log_array(self, x: Sequence, base: int = 10):
+        """
+        배열의 각 원소에 대한 로그를 계산하는 함수 (기본값은 상용로그, base=10).
+
+        Args:
+            x (Sequence): 로그를 계산할 값들의 배열.
+            base (int, optional): 로그의 밑값 (기본값은 10).
+
+        Returns:
+            numpy.ndarray: 결과 배열. precision과 return_float 설정이 적용됨.
+        """
+        np = get_numpy()
+        x = np.asarray(x, dtype=float)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if base == 10:
+                result = np.log10(x)
+            elif base == 2:
+                result = np.log2(x)
+            else:
+                result = np.log(x)
+                result /= math.log(base)  # 밑 변환은 제자리 연산으로 추가 배열 생성 없이 처리
+        return self._finish_array(result)
+
+    def sin_array(self, angles: Sequence, unit: Optional[str] = None):
+        """
+        각도 배열의 사인 값을 계산하는 함수.
+
+        Args:
+            angles (Sequence): 각도 값 배열 (라디안 또는 degree).
+            unit (Optional[str], optional): 각도의 단위 ('radian' 또는 'degree'). 생략하면 settings 블록의 unit(기본값 'radian').
+
+        Returns:
+            numpy.ndarray: 결과 배열. precision과 return_float 설정이 적용됨.
+        """
+        if unit is None:
+            unit = self.unit
+        if self._trig_table is not None and unit == DEGREE:
+            return self._finish_array(self._trig_table.sin_array(angles))  # 표에서 바로 계산
+        radians = convert_to_radians_array(angles, unit)  # 각도 단위를 라디안으로 변환 (새 배열)
+        return self._finish_array(get_numpy().sin(radians, out=radians))
+
+    def cos_array(self, angles: Sequence, unit: Optional[str] = None):
+        """
+        각도 배열의 코사인 값을 계산하는 함수.
+
+        Args:
+            angles (Sequence): 각도 값 배열 (라디안 또는 degree).
+            unit (Optional[str], optional): 각도의 단위 ('radian' 또는 'degree'). 생략하면 settings 블록의 unit(기본값 'radian').
+
+        Returns:
+            numpy.ndarray: 결과 배열. precision과 return_float 설정이 적용됨.
+        """
+        if unit is None:
+            unit = self.unit
+        if self._trig_table is not None and unit == DEGREE:
+            return self._finish_array(self._trig_table.cos_array(angles))  # 표에서 바로 계산
+        radians = convert_to_radians_array(angles, unit)  # 각도 단위를 라디안으로 변환 (새 배열)
+        return self._finish_array(get_numpy().cos(radians, out=radians))
+
+    def tan_array(self, angles: Sequence, unit: Optional[str] = None):
+        """
+        각도 배열의 탄젠트 값을 계산하는 함수.
+
+        Args:
+            angles (Sequence): 각도 값 배열 (라디안 또는 degree).
+            unit (Optional[str], optional): 각도의 단위 ('radian' 또는 'degree'). 생략하면 settings 블록의 unit(기본값 'radian').
+
+        Returns:
+            numpy.ndarray: 결과 배열. precision과 return_float 설정이 적용됨.
+        """
+        if unit is None:
+            unit = self.unit
+        if self._trig_table is not None and unit == DEGREE:
+            return self._finish_array(self._trig_table.tan_array(angles))  # 표에서 바로 계산
+        radians = convert_to_radians_array(angles, unit)  # 각도 단위를 라디안으로 변환 (새 배열)
+        return self._finish_array(get_numpy().tan(radians, out=radians))
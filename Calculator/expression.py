@@ -0,0 +1,441 @@
+# calculator/expression.py
+
+import math
+import re
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Union
+
+from .cache import LRUCache, MISSING
+from .complex_cal import ComplexCalculator
+from .engineering import EngineeringCalculator, RADIAN, DEGREE
+from .utils import get_numpy
+
+# 수식에서 사용할 수 있는 상수
+CONSTANTS = {'pi': math.pi, 'e': math.e}
+
+# 각도 단위 이름은 변수 대신 문자열 상수로 해석됩니다 (예: sin(x, degree))
+UNITS = (RADIAN, DEGREE)
+
+# 토큰 정규식: 숫자(지수 표기, 허수 j 포함), 식별자, 연산자
+_TOKEN_RE = re.compile(r'''
+    \s*(?:
+        (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?j?)
+      | (?P<name>[A-Za-z_][A-Za-z_0-9]*)
+      | (?P<op>\*\*|[-+*/^(),])
+    )''', re.VERBOSE)
+
+
+def _tokenize(source: str) -> list:
+    """
+    수식 문자열을 (종류, 값) 토큰 목록으로 나누는 함수.
+
+    Raises:
+        ValueError: 해석할 수 없는 문자가 있을 경우 발생.
+    """
+    tokens = []
+    pos = 0
+    source = source.rstrip()
+    while pos < len(source):
+        match = _TOKEN_RE.match(source, pos)
+        if match is None:
+            raise ValueError(f"Invalid character in expression at position {pos}: {source[pos:]!r}")
+        pos = match.end()
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+    return tokens
+
+
+class _Parser:
+    """
+    재귀 하강(recursive descent) 방식의 수식 파서.
+    결과는 튜플로 된 구문 트리(AST)입니다: ('num', 값), ('str', 단위), ('var', 이름),
+    ('neg', 노드), ('bin', 연산자, 왼쪽, 오른쪽), ('call', 함수 이름, (인자들)).
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.tokens = _tokenize(source)
+        self.pos = 0
+
+    def _peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def _next(self):
+        token = self._peek()
+        self.pos += 1
+        return token
+
+    def _expect(self, value: str):
+        kind, token = self._next()
+        if token != value:
+            raise ValueError(f"Expected {value!r} in expression {self.source!r}, got {token!r}")
+
+    def parse(self):
+        if not self.tokens:
+            raise ValueError("Expression is empty.")
+        node = self._expr()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"Unexpected token {self._peek()[1]!r} in expression {self.source!r}")
+        return node
+
+    def _expr(self):
+        # expr := term (('+' | '-') term)*
+        node = self._term()
+        while self._peek()[1] in ('+', '-'):
+            op = self._next()[1]
+            node = ('bin', op, node, self._term())
+        return node
+
+    def _term(self):
+        # term := unary (('*' | '/') unary)*
+        node = self._unary()
+        while self._peek()[1] in ('*', '/'):
+            op = self._next()[1]
+            node = ('bin', op, node, self._unary())
+        return node
+
+    def _unary(self):
+        # unary := ('-' | '+') unary | power
+        if self._peek()[1] in ('-', '+'):
+            op = self._next()[1]
+            operand = self._unary()
+            return ('neg', operand) if op == '-' else operand
+        return self._power()
+
+    def _power(self):
+        # power := primary (('^' | '**') unary)?   (오른쪽 결합)
+        node = self._primary()
+        if self._peek()[1] in ('^', '**'):
+            self._next()
+            node = ('bin', '^', node, self._unary())
+        return node
+
+    def _primary(self):
+        # primary := NUMBER | NAME | NAME '(' args ')' | '(' expr ')'
+        kind, token = self._next()
+        if kind == 'number':
+            if token.endswith('j'):
+                return ('num', complex(token))
+            return ('num', float(token) if any(c in token for c in '.eE') else int(token))
+        if kind == 'name':
+            if self._peek()[1] == '(':
+                self._next()
+                args = []
+                if self._peek()[1] != ')':
+                    args.append(self._expr())
+                    while self._peek()[1] == ',':
+                        self._next()
+                        args.append(self._expr())
+                self._expect(')')
+                return ('call', token, tuple(args))
+            if token in UNITS:
+                return ('str', token)
+            if token in CONSTANTS:
+                return ('num', CONSTANTS[token])
+            return ('var', token)
+        if token == '(':
+            node = self._expr()
+            self._expect(')')
+            return node
+        raise ValueError(f"Unexpected token {token!r} in expression {self.source!r}")
+
+
+def _variables(node) -> set:
+    """
+    구문 트리에서 사용된 변수 이름들을 모으는 함수.
+    """
+    if node[0] == 'var':
+        return {node[1]}
+    if node[0] == 'neg':
+        return _variables(node[1])
+    if node[0] == 'bin':
+        return _variables(node[2]) | _variables(node[3])
+    if node[0] == 'call':
+        return set().union(*(_variables(arg) for arg in node[2])) if node[2] else set()
+    return set()
+
+
+def _checked_divide(result):
+    """
+    Calculator.divide가 반환하는 에러 문자열을 예외로 바꾸는 함수.
+    수식 중간에서 문자열이 다음 연산으로 전달되지 않도록 합니다.
+    """
+    if isinstance(result, str):
+        raise ZeroDivisionError(result)
+    return result
+
+
+def _checked_divide_array(calc: EngineeringCalculator, a, b):
+    """
+    배열 나눗셈에서 0으로 나누는 원소가 있으면 스칼라 평가와 같이 ZeroDivisionError를 발생시키는 함수.
+    """
+    result, mask = calc.divide_array(a, b, return_mask=True)
+    if mask.any():
+        raise ZeroDivisionError("Error: Division by zero is not allowed.")
+    return result
+
+
+def _checked_domain(func: Callable, lower: float, inclusive: bool) -> Callable:
+    """
+    실수 배열 인자가 정의역(lower 초과, inclusive이면 lower 이상) 밖이면 스칼라 평가의 math 함수와 같이
+    ValueError를 발생시키는 함수로 func를 감싸는 함수 (sqrt, log에 사용). 복소수 배열은 그대로 계산합니다.
+    """
+    np = get_numpy()
+
+    def checked(x, *args):
+        x = np.asarray(x)
+        if x.dtype.kind in 'biuf' and ((x < lower) if inclusive else (x <= lower)).any():
+            raise ValueError("math domain error")
+        return func(x, *args)
+
+    return checked
+
+
+def _scalar_operations(calc: EngineeringCalculator, complex_calc: ComplexCalculator) -> tuple:
+    """
+    스칼라 평가에 사용할 (연산자 표, 함수 표)를 만드는 함수.
+    함수 표의 값은 (호출 가능한 객체, 최소 인자 수, 최대 인자 수)입니다.
+    """
+    operators = {
+        '+': lambda a, b: calc.add(a, b),
+        '-': lambda a, b: calc.subtract(a, b),
+        '*': lambda a, b: calc.multiply(a, b),
+        '/': lambda a, b: _checked_divide(calc.divide(a, b)),
+        '^': calc.power,
+    }
+    functions = {
+        'sin': (calc.sin, 1, 2),
+        'cos': (calc.cos, 1, 2),
+        'tan': (calc.tan, 1, 2),
+        'log': (calc.log, 1, 2),
+        'ln': (lambda x: calc.log(x, math.e), 1, 1),
+        'sqrt': (calc.square_root, 1, 1),
+        'pow': (calc.power, 2, 2),
+        'abs': (complex_calc.magnitude, 1, 1),
+        'arg': (complex_calc.argument, 1, 1),
+    }
+    return operators, functions
+
+
+def _array_operations(calc: EngineeringCalculator, complex_calc: ComplexCalculator) -> tuple:
+    """
+    배열(batch) 평가에 사용할 (연산자 표, 함수 표)를 만드는 함수. 각 연산은 *_array 메서드에 연결됩니다.
+    """
+    np = get_numpy()
+    operators = {
+        '+': lambda a, b: calc.add_array(a, b),
+        '-': lambda a, b: calc.subtract_array(a, b),
+        '*': lambda a, b: calc.multiply_array(a, b),
+        '/': lambda a, b: _checked_divide_array(calc, a, b),
+        '^': calc.power_array,
+    }
+    functions = {
+        'sin': (calc.sin_array, 1, 2),
+        'cos': (calc.cos_array, 1, 2),
+        'tan': (calc.tan_array, 1, 2),
+        'log': (_checked_domain(calc.log_array, 0, False), 1, 2),
+        'ln': (_checked_domain(lambda x: calc.log_array(x, math.e), 0, False), 1, 1),
+        'sqrt': (_checked_domain(calc.square_root_array, 0, True), 1, 1),
+        'pow': (calc.power_array, 2, 2),
+        'abs': (lambda x: np.abs(x) if np.isrealobj(x) else complex_calc.magnitude_array(x), 1, 1),
+        'arg': (complex_calc.argument_array, 1, 1),
+    }
+    return operators, functions
+
+
+def _build(node, operators: dict, functions: dict) -> Callable[[Mapping], Any]:
+    """
+    구문 트리를 변수 딕셔너리를 받는 중첩 클로저로 변환하는 함수.
+    평가 시에는 트리 탐색이나 이름 조회 없이 미리 연결된 연산만 호출됩니다.
+    """
+    kind = node[0]
+    if kind in ('num', 'str'):
+        value = node[1]
+        return lambda env: value
+    if kind == 'var':
+        name = node[1]
+
+        def load(env):
+            try:
+                return env[name]
+            except KeyError:
+                raise NameError(f"Undefined variable in expression: {name!r}") from None
+        return load
+    if kind == 'neg':
+        operand = _build(node[1], operators, functions)
+        return lambda env: -operand(env)
+    if kind == 'bin':
+        op = operators[node[1]]
+        left = _build(node[2], operators, functions)
+        right = _build(node[3], operators, functions)
+        return lambda env: op(left(env), right(env))
+    # kind == 'call'
+    name, arg_nodes = node[1], node[2]
+    if name not in functions:
+        raise ValueError(f"Unknown function in expression: {name!r}")
+    func, min_args, max_args = functions[name]
+    if not min_args <= len(arg_nodes) <= max_args:
+        raise TypeError(f"{name}() takes {min_args} to {max_args} arguments ({len(arg_nodes)} given)")
+    args = [_build(arg, operators, functions) for arg in arg_nodes]
+    if len(args) == 1:
+        (arg,) = args
+        return lambda env: func(arg(env))
+    if len(args) == 2:
+        first, second = args
+        return lambda env: func(first(env), second(env))
+    return lambda env: func(*[arg(env) for arg in args])
+
+
+class CompiledExpression:
+    """
+    한 번 파싱된 수식을 나타내는 클래스.
+    스칼라 평가용 클로저는 컴파일 시점에 만들어지고, 배열 평가용 클로저는 처음 배열 평가 시 한 번 만들어집니다.
+    """
+
+    def __init__(self, source: str, tree: tuple, engine: 'ExpressionEngine'):
+        self.source = source
+        self.tree = tree
+        self.variables = tuple(sorted(_variables(tree)))  # 수식에서 사용하는 변수 이름들
+        self._engine = engine
+        self._scalar = _build(tree, *engine._scalar_ops)
+        self._array = None
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.source!r})"
+
+    def __call__(self, **variables: Union[int, float, complex]) -> Union[int, float, complex]:
+        return self._scalar(variables)
+
+    def evaluate(self, variables: Optional[Mapping[str, Any]] = None, **kwargs: Union[int, float, complex]) -> Union[int, float, complex]:
+        """
+        스칼라 변수 값으로 수식을 평가하는 함수.
+
+        Args:
+            variables (Optional[Mapping[str, Any]]): 변수 이름과 값을 담은 딕셔너리.
+            **kwargs: 키워드 인자로 전달하는 변수 값.
+
+        Returns:
+            Union[int, float, complex]: 계산 결과.
+
+        Raises:
+            NameError: 수식의 변수 값이 주어지지 않은 경우 발생.
+            ZeroDivisionError: 0으로 나누는 경우 발생.
+        """
+        if variables is None:
+            return self._scalar(kwargs)
+        if kwargs:
+            variables = {**variables, **kwargs}
+        return self._scalar(variables)
+
+    def evaluate_batch(self, bindings: Union[Mapping[str, Sequence], Sequence[Mapping[str, Any]]]):
+        """
+        여러 변수 값 묶음에 대해 수식을 한 번에 평가하는 함수. 배열(batch) 메서드를 사용합니다.
+
+        Args:
+            bindings: 변수 이름 -> 값 배열 딕셔너리(열 단위), 또는 변수 딕셔너리들의 목록(행 단위).
+
+        Returns:
+            numpy.ndarray: 각 변수 값 묶음에 대한 계산 결과 배열.
+
+        Raises:
+            ValueError: 행 단위 bindings의 어떤 행에 수식의 변수 값이 없는 경우 발생.
+            NameError: 열 단위 bindings에 수식의 변수 값이 없는 경우 발생.
+            ZeroDivisionError: 어떤 변수 값 묶음에서든 0으로 나누는 경우 발생 (스칼라 평가와 같음).
+            ValueError: 어떤 변수 값 묶음에서든 sqrt, log, ln의 인자가 정의역 밖인 경우 발생 (스칼라 평가와 같음).
+        """
+        if self._array is None:
+            self._array = _build(self.tree, *self._engine._array_ops())
+        np = get_numpy()
+        shape = None
+        if not isinstance(bindings, Mapping):
+            rows = list(bindings)
+            shape = (len(rows),)
+            bindings = {}
+            for name in self.variables:
+                try:
+                    bindings[name] = [row[name] for row in rows]
+                except KeyError:
+                    index = next(i for i, row in enumerate(rows) if name not in row)
+                    raise ValueError(f"Missing value for variable {name!r} in bindings row {index}") from None
+        columns = {name: np.asarray(values) for name, values in bindings.items()}
+        result = np.asarray(self._array(columns))
+        if shape is None:
+            shape = np.broadcast_shapes(*(column.shape for column in columns.values()))
+        if result.shape != shape:
+            # 변수를 쓰지 않는 부분식(상수 수식 등)은 묶음 크기의 배열로 맞춤
+            result = np.broadcast_to(result, np.broadcast_shapes(result.shape, shape)).copy()
+        return result
+
+
+class ExpressionEngine:
+    """
+    수식 문자열을 컴파일하고 평가하는 클래스.
+    컴파일된 수식은 크기가 제한된 LRU 캐시에 보관되므로, 같은 수식을 반복 평가할 때 파싱 비용이 들지 않습니다.
+
+    지원 연산자: +, -, *, /, ^ (또는 **), 단항 -
+    지원 함수: sin, cos, tan (두 번째 인자로 radian/degree), log (두 번째 인자로 밑), ln, sqrt, pow, abs, arg
+    지원 상수: pi, e, 허수 리터럴 (예: 2j)
+    """
+
+    def __init__(self, calculator: Optional[EngineeringCalculator] = None,
+                 complex_calculator: Optional[ComplexCalculator] = None, cache_size: int = 256):
+        """
+        클래스 초기화 함수.
+
+        Args:
+            calculator (Optional[EngineeringCalculator]): 연산에 사용할 계산기. None이면 새로 생성.
+            complex_calculator (Optional[ComplexCalculator]): abs/arg 연산에 사용할 복소수 계산기. None이면 새로 생성.
+            cache_size (int): 컴파일된 수식을 보관할 LRU 캐시의 최대 크기. 기본값은 256.
+        """
+        self.calculator = calculator if calculator is not None else EngineeringCalculator()
+        self.complex_calculator = complex_calculator if complex_calculator is not None else ComplexCalculator()
+        self._cache = LRUCache(cache_size)
+        self._scalar_ops = _scalar_operations(self.calculator, self.complex_calculator)
+        self._array_ops_cache = None
+
+    def _array_ops(self) -> tuple:
+        if self._array_ops_cache is None:
+            self._array_ops_cache = _array_operations(self.calculator, self.complex_calculator)
+        return self._array_ops_cache
+
+    def compile(self, source: str) -> CompiledExpression:
+        """
+        수식 문자열을 컴파일하는 함수. 캐시에 있으면 파싱 없이 바로 반환합니다.
+
+        Args:
+            source (str): 수식 문자열 (예: "sin(x, degree) * log(y) + sqrt(z)").
+
+        Returns:
+            CompiledExpression: 컴파일된 수식.
+
+        Raises:
+            ValueError: 수식 문법이 잘못되었거나 알 수 없는 함수가 있는 경우 발생.
+        """
+        compiled = self._cache.get(source)
+        if compiled is MISSING:
+            compiled = CompiledExpression(source, _Parser(source).parse(), self)
+            self._cache.put(source, compiled)
+        return compiled
+
+    def evaluate(self, source: str, variables: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> Union[int, float, complex]:
+        """
+        수식 문자열을 스칼라 변수 값으로 평가하는 함수 (compile 후 evaluate).
+        """
+        return self.compile(source).evaluate(variables, **kwargs)
+
+    def evaluate_batch(self, source: str, bindings: Union[Mapping[str, Sequence], Sequence[Mapping[str, Any]]]):
+        """
+        수식 문자열을 여러 변수 값 묶음에 대해 한 번에 평가하는 함수 (compile 후 evaluate_batch).
+        """
+        return self.compile(source).evaluate_batch(bindings)
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        컴파일 캐시의 적중/실패 횟수와 크기를 반환하는 함수.
+        """
+        return self._cache.info()
+
+    def clear_cache(self) -> None:
+        """
+        컴파일 캐시를 비우는 함수.
+        """
+        self._cache.clear()
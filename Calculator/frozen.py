@@ -0,0 +1,223 @@
+# calculator/frozen.py
+
+import math
+from typing import TYPE_CHECKING, Callable, Optional, Union
+
+from .utils import power_result
+
+if TYPE_CHECKING:
+    from .trig_table import DegreeTrigTable
+
+RADIAN = 'radian'
+DEGREE = 'degree'
+
+
+def _rounded(func: Callable, precision: Optional[int]) -> Callable:
+    """
+    인자 하나를 받는 func의 결과를 precision 자릿수로 반올림하는 함수로 감싸는 내부 함수.
+    precision이 None이면 func를 그대로 반환합니다. round_result(func(x), precision)과 같은 결과를 반환합니다.
+    """
+    if precision is None:
+        return func
+    return lambda x: round(func(x), precision)
+
+
+def _degree(func: Callable, precision: Optional[int]) -> Callable:
+    """
+    degree 단위 각도를 라디안으로 바꾼 뒤 func를 호출하고 precision을 적용하는 함수를 만드는 내부 함수.
+    함수 호출 단계를 줄이기 위해 변환과 반올림을 한 함수 안에서 처리합니다.
+    """
+    radians = math.radians
+    if precision is None:
+        return lambda angle: func(radians(angle))
+    return lambda angle: round(func(radians(angle)), precision)
+
+
+def _from_table(values: dict, fallback: Callable) -> Callable:
+    """
+    degree 삼각함수 표의 딕셔너리를 먼저 조회하고, 없으면 표의 계산 함수를 호출하는 함수를 만드는 내부 함수.
+    """
+    get = values.get
+
+    def lookup(angle):
+        result = get(angle)
+        if result is None:
+            result = fallback(angle)
+        return result
+
+    return lookup
+
+
+# ---- 사칙연산 (Calculator 메서드와 같은 계산 순서) ----
+
+def _add(*nums: Union[int, float]) -> Union[int, float]:
+    return sum(nums)
+
+
+def _subtract(*nums: Union[int, float]) -> Union[int, float]:
+    result = nums[0]
+    for num in nums[1:]:
+        result -= num
+    return result
+
+
+def _multiply(*nums: Union[int, float]) -> Union[int, float]:
+    result = nums[0]
+    for num in nums[1:]:
+        result *= num
+    return result
+
+
+def _divide(*nums: Union[int, float]) -> Union[int, float, str]:
+    try:
+        result = nums[0]
+        for num in nums[1:]:
+            result /= num
+        return result
+    except ZeroDivisionError:
+        return "Error: Division by zero is not allowed."
+
+
+# ---- 제곱근 (EngineeringCalculator 메서드와 같은 정수 처리) ----
+
+def _square_root(x: Union[int, float]) -> Union[int, float]:
+    try:
+        return math.sqrt(x)
+    except OverflowError:
+        if not isinstance(x, int):
+            raise
+        root = math.isqrt(x)
+        return root if root * root == x else float(root)
+
+
+def _rounded_divide(precision: int) -> Callable:
+    """
+    precision 자릿수로 반올림하는 나눗셈 함수를 만드는 내부 함수.
+    0으로 나누기의 에러 메시지(문자열)는 반올림하지 않도록 반올림을 try 블록 밖에서 결과에만 적용합니다.
+    """
+    def divide(*nums: Union[int, float]) -> Union[int, float, str]:
+        try:
+            result = nums[0]
+            for num in nums[1:]:
+                result /= num
+        except ZeroDivisionError:
+            return "Error: Division by zero is not allowed."
+        return round(result, precision)
+
+    return divide
+
+
+def _arithmetic(func: Callable, precision: Optional[int]) -> Callable:
+    """
+    사칙연산 함수에 precision 설정을 적용한 함수를 만드는 내부 함수. 설정에 따른 분기는 여기서 한 번만 합니다.
+    Calculator 메서드와 같이 return_float은 적용하지 않습니다.
+    """
+    if precision is None:
+        return func
+    if func is _divide:
+        return _rounded_divide(precision)
+    return lambda *nums: round(func(*nums), precision)
+
+
+def _modular_power(x: int, y: int, modulus: int) -> int:
+    # EngineeringCalculator.int_power(x, y, modulus)와 같은 검사와 결과 (정수 결과이므로 precision 미적용)
+    if not (isinstance(x, int) and isinstance(y, int) and isinstance(modulus, int)):
+        raise TypeError("int_power requires integer arguments.")
+    return pow(x, y, modulus)
+
+
+def _power(precision: Optional[int]) -> Callable:
+    """
+    EngineeringCalculator.power와 같은 인자(modulus 포함)를 받는 거듭제곱 함수를 만드는 내부 함수.
+    """
+    if precision is None:
+        def power(x: Union[int, float], y: Union[int, float], modulus: Optional[int] = None) -> Union[int, float]:
+            if modulus is None:
+                return power_result(x, y)
+            return _modular_power(x, y, modulus)
+    else:
+        def power(x: Union[int, float], y: Union[int, float], modulus: Optional[int] = None) -> Union[int, float]:
+            if modulus is None:
+                return round(power_result(x, y), precision)
+            return _modular_power(x, y, modulus)
+    return power
+
+
+class FrozenCalculator:
+    """
+    설정(precision, return_float, 각도 단위)을 고정한 변경 불가능한 계산기 클래스.
+
+    EngineeringCalculator의 메서드는 호출할 때마다 precision 속성을 읽고, round_result에서 None 여부를 확인하고,
+    convert_to_radians에서 단위 문자열을 비교합니다. FrozenCalculator는 생성할 때 설정에 맞는 함수를 미리 만들어
+    인스턴스 속성으로 두므로, 호출 시에는 이런 속성 조회나 분기 없이 바로 계산합니다.
+    (예: precision=None, unit='radian'이면 sin은 math.sin 그 자체)
+
+    - 결과는 같은 설정의 EngineeringCalculator 메서드와 같습니다.
+      sin/cos/tan은 각도 단위를 인자로 받지 않고 생성 시 지정한 unit을 사용합니다.
+    - power는 EngineeringCalculator.power와 같이 modulus 인자를 받으며, 지정하면 정확한 정수 (x ** y) % modulus를 반환합니다.
+    - add/subtract/multiply/divide는 Calculator 메서드에 precision을 키워드로 넘긴 것과 같은 결과입니다.
+      return_float은 EngineeringCalculator처럼 설정으로만 보관하며 스칼라 결과에는 적용하지 않습니다
+      (EngineeringCalculator에서는 배열 결과에만 적용됨).
+    - __slots__를 사용하며, 생성 후에는 속성을 바꿀 수 없습니다.
+    """
+
+    __slots__ = ('precision', 'return_float', 'unit',
+                 'add', 'subtract', 'multiply', 'divide',
+                 'square_root', 'power', 'log', 'sin', 'cos', 'tan')
+
+    def __init__(self, precision: Optional[int] = None, return_float: bool = False, unit: str = RADIAN,
+                 trig_table: Optional['DegreeTrigTable'] = None):
+        """
+        클래스 초기화 함수.
+
+        Args:
+            precision (Optional[int]): 결과의 소수점 자릿수 (None이면 반올림하지 않음).
+            return_float (bool): EngineeringCalculator의 return_float 설정 (스칼라 결과에는 적용되지 않음).
+            unit (str): sin/cos/tan의 각도 단위 ('radian' 또는 'degree'). 기본값은 'radian'.
+            trig_table (Optional[DegreeTrigTable]): unit='degree'일 때 사용할 삼각함수 표 (None이면 math 함수로 계산).
+
+        Raises:
+            TypeError: precision이 정수나 None이 아니거나, return_float이 boolean이 아닐 경우 발생.
+            ValueError: unit이 'radian' 또는 'degree'가 아닐 경우 발생.
+        """
+        if precision is not None and not isinstance(precision, int):
+            raise TypeError("Precision must be an integer or None.")
+        if not isinstance(return_float, bool):
+            raise TypeError("Return_float must be a boolean.")
+        if unit not in (RADIAN, DEGREE):
+            raise ValueError(f"Unknown angle unit: {unit!r}")
+        setattr_ = object.__setattr__
+        setattr_(self, 'precision', precision)
+        setattr_(self, 'return_float', return_float)
+        setattr_(self, 'unit', unit)
+
+        for name, func in (('add', _add), ('subtract', _subtract), ('multiply', _multiply), ('divide', _divide)):
+            setattr_(self, name, _arithmetic(func, precision))
+
+        log = math.log
+        setattr_(self, 'square_root', _rounded(_square_root, precision))
+        setattr_(self, 'power', _power(precision))
+        if precision is None:
+            setattr_(self, 'log', lambda x, base=10: log(x, base))
+        else:
+            setattr_(self, 'log', lambda x, base=10: round(log(x, base), precision))
+
+        for name in ('sin', 'cos', 'tan'):
+            if unit == DEGREE and trig_table is not None:
+                values = getattr(trig_table, name + '_values')
+                func = _rounded(_from_table(values, getattr(trig_table, name)), precision)
+            elif unit == DEGREE:
+                func = _degree(getattr(math, name), precision)
+            else:
+                func = _rounded(getattr(math, name), precision)
+            setattr_(self, name, func)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return (f"FrozenCalculator(precision={self.precision}, return_float={self.return_float}, "
+                f"unit={self.unit!r})")
@@ -0,0 +1,261 @@
+# calculator/instrumentation.py
+
+import bisect
+import functools
+import math
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+from .basic import Calculator
+from .engineering import EngineeringCalculator
+from .complex_cal import ComplexCalculator
+
+# 계측 대상 클래스. 각 클래스가 직접 정의한 공개 메서드만 감싸므로 상속받은 메서드는 정의한 클래스 이름으로 집계됩니다.
+# (예: EngineeringCalculator().add 호출은 'Calculator.add'로 집계)
+INSTRUMENTED_CLASSES = (Calculator, EngineeringCalculator, ComplexCalculator)
+
+# 계산이 아닌 설정용 메서드는 계측하지 않음
+_EXCLUDED_METHODS = frozenset({
+    'enable_cache', 'disable_cache', 'clear_cache', 'cache_info', 'enable_trig_table', 'disable_trig_table',
+    'freeze', 'lazy', 'settings',
+})
+
+# 지연 시간 히스토그램의 기본 구간 상한(초). 100ns부터 약 10ms까지이며, 마지막 구간(+Inf)은 자동으로 추가됩니다.
+DEFAULT_BUCKETS = (
+    1e-7, 2.5e-7, 5e-7, 1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2,
+)
+
+
+class Instrumentation:
+    """
+    메서드별 호출 수, 에러 수, 지연 시간 히스토그램을 기록하는 클래스.
+
+    에러는 예외가 발생했거나 에러 메시지 문자열(예: divide의 0으로 나누기)을 반환한 호출입니다.
+    호출 경로의 비용을 줄이기 위해 기록은 잠금 없이 갱신합니다. 여러 스레드가 같은 메서드를 동시에 호출하면
+    스레드 전환 시점에 따라 드물게 일부 호출이 누락될 수 있으며, 잠금은 기록 목록 생성/복사/초기화에만 사용합니다.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        클래스 초기화 함수.
+
+        Args:
+            buckets (Sequence[float]): 지연 시간 히스토그램의 구간 상한(초). 오름차순이어야 합니다.
+
+        Raises:
+            ValueError: buckets가 비어 있거나 오름차순이 아닐 경우 발생.
+        """
+        buckets = tuple(float(bound) for bound in buckets)
+        if not buckets or any(a >= b for a, b in zip(buckets, buckets[1:])):
+            raise ValueError("Buckets must be a non-empty, strictly increasing sequence.")
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._stats: Dict[str, list] = {}  # 메서드 이름 -> [호출 수, 에러 수, 지연 시간 합, 구간별 호출 수]
+
+    def _series(self, name: str) -> list:
+        """
+        메서드 하나의 기록 목록 [호출 수, 에러 수, 지연 시간 합, 구간별 호출 수]을 반환하는 내부 함수 (없으면 생성).
+        계측 함수는 이 목록을 미리 받아 두고 직접 갱신하여 호출마다 이름으로 찾는 비용을 없앱니다.
+        """
+        with self._lock:
+            series = self._stats.get(name)
+            if series is None:
+                series = self._stats[name] = [0, 0, 0.0, [0] * (len(self.buckets) + 1)]
+            return series
+
+    def record(self, name: str, seconds: float, error: bool = False) -> None:
+        """
+        호출 한 번을 기록하는 함수.
+
+        Args:
+            name (str): 메서드 이름 (예: 'Calculator.divide').
+            seconds (float): 걸린 시간(초).
+            error (bool): 에러 여부.
+        """
+        series = self._series(name)
+        series[0] += 1
+        series[1] += error
+        series[2] += seconds
+        series[3][bisect.bisect_left(self.buckets, seconds)] += 1
+
+    def reset(self) -> None:
+        """
+        기록된 값을 모두 0으로 되돌리는 함수.
+        """
+        with self._lock:
+            for series in self._stats.values():
+                series[:3] = [0, 0, 0.0]
+                series[3][:] = [0] * len(series[3])
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        현재까지 기록된 값을 복사하여 반환하는 함수.
+
+        Returns:
+            Dict[str, dict]: 메서드 이름 -> calls, errors, total_seconds, buckets 값.
+                buckets는 (구간 상한, 누적 호출 수) 목록이며 마지막 구간의 상한은 math.inf입니다.
+                한 번도 호출되지 않은 메서드는 포함되지 않습니다.
+        """
+        with self._lock:
+            items = [(name, calls, errors, total, list(counts))
+                     for name, (calls, errors, total, counts) in self._stats.items() if calls]
+        bounds = self.buckets + (math.inf,)
+        snapshot = {}
+        for name, calls, errors, total, counts in sorted(items):
+            cumulative, running = [], 0
+            for bound, count in zip(bounds, counts):
+                running += count
+                cumulative.append((bound, running))
+            snapshot[name] = {'calls': calls, 'errors': errors, 'total_seconds': total, 'buckets': cumulative}
+        return snapshot
+
+    def to_prometheus(self, prefix: str = 'calculator') -> str:
+        """
+        기록된 값을 Prometheus 텍스트 형식(exposition format)으로 변환하는 함수.
+
+        Args:
+            prefix (str): 지표 이름 앞에 붙일 문자열. 기본값은 'calculator'.
+
+        Returns:
+            str: {prefix}_calls_total, {prefix}_errors_total, {prefix}_latency_seconds 히스토그램.
+        """
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_calls_total Number of calculator method calls.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        lines += [f'{prefix}_calls_total{{method="{name}"}} {stats["calls"]}' for name, stats in snapshot.items()]
+        lines += [
+            f"# HELP {prefix}_errors_total Number of calculator method calls that raised or returned an error.",
+            f"# TYPE {prefix}_errors_total counter",
+        ]
+        lines += [f'{prefix}_errors_total{{method="{name}"}} {stats["errors"]}' for name, stats in snapshot.items()]
+        lines += [
+            f"# HELP {prefix}_latency_seconds Calculator method latency in seconds.",
+            f"# TYPE {prefix}_latency_seconds histogram",
+        ]
+        for name, stats in snapshot.items():
+            for bound, count in stats['buckets']:
+                le = '+Inf' if bound == math.inf else repr(bound)
+                lines.append(f'{prefix}_latency_seconds_bucket{{method="{name}",le="{le}"}} {count}')
+            lines.append(f'{prefix}_latency_seconds_sum{{method="{name}"}} {stats["total_seconds"]!r}')
+            lines.append(f'{prefix}_latency_seconds_count{{method="{name}"}} {stats["calls"]}')
+        return '\n'.join(lines) + '\n'
+
+
+# ---- 전역 계측 켜기/끄기 ----
+# enable은 계측 대상 클래스의 메서드를 계측 함수로 감싼 것으로 바꾸고, disable은 원래 메서드로 되돌립니다.
+# 따라서 계측을 켜지 않았을 때는 메서드 호출에 추가 비용이 전혀 없습니다.
+
+_active: Optional[Instrumentation] = None
+_originals: List[tuple] = []  # (클래스, 메서드 이름, 원래 함수)
+_switch_lock = threading.Lock()
+
+
+def _wrap(name: str, func, recorder: Instrumentation):
+    """
+    메서드를 호출 시간과 에러 여부를 기록하는 함수로 감싸는 내부 함수. 반환값과 예외는 그대로 전달합니다.
+    호출마다의 비용을 줄이기 위해 기록 목록과 구간 상한을 미리 지역 변수로 받아 둡니다.
+    """
+    clock, bisect_left = time.perf_counter, bisect.bisect_left
+    series, buckets = recorder._series(name), recorder.buckets
+    counts = series[3]
+
+    @functools.wraps(func)
+    def instrumented(*args, **kwargs):
+        start = clock()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException:
+            error, result = True, None
+            raise
+        else:
+            error = isinstance(result, str)  # 에러 메시지 문자열 반환 (예: 0으로 나누기)
+            return result
+        finally:
+            elapsed = clock() - start
+            series[0] += 1
+            series[1] += error
+            series[2] += elapsed
+            counts[bisect_left(buckets, elapsed)] += 1
+
+    return instrumented
+
+
+def _public_methods(cls) -> List[str]:
+    return [
+        name for name, value in vars(cls).items()
+        if not name.startswith('_') and callable(value) and name not in _EXCLUDED_METHODS
+    ]
+
+
+def enable(buckets: Optional[Sequence[float]] = None) -> Instrumentation:
+    """
+    세 계산기 클래스의 모든 공개 계산 메서드(스칼라, *_array, *_stream)의 계측을 켜는 함수.
+    이미 켜져 있으면 기존 기록을 유지하고 그대로 반환합니다 (buckets는 무시됨).
+
+    Args:
+        buckets (Optional[Sequence[float]]): 지연 시간 히스토그램의 구간 상한(초). None이면 DEFAULT_BUCKETS.
+
+    Returns:
+        Instrumentation: 호출이 기록되는 객체.
+    """
+    global _active
+    with _switch_lock:
+        if _active is not None:
+            return _active
+        recorder = Instrumentation(DEFAULT_BUCKETS if buckets is None else buckets)
+        for cls in INSTRUMENTED_CLASSES:
+            for name in _public_methods(cls):
+                func = vars(cls)[name]
+                _originals.append((cls, name, func))
+                setattr(cls, name, _wrap(f"{cls.__name__}.{name}", func, recorder))
+        _active = recorder
+        return recorder
+
+
+def disable() -> Optional[Instrumentation]:
+    """
+    계측을 끄고 원래 메서드로 되돌리는 함수.
+
+    Returns:
+        Optional[Instrumentation]: 그동안 기록된 객체 (켜져 있지 않았으면 None).
+    """
+    global _active
+    with _switch_lock:
+        recorder, _active = _active, None
+        while _originals:
+            cls, name, func = _originals.pop()
+            setattr(cls, name, func)
+        return recorder
+
+
+def is_enabled() -> bool:
+    """
+    계측이 켜져 있는지 여부를 반환하는 함수.
+    """
+    return _active is not None
+
+
+def get_instrumentation() -> Optional[Instrumentation]:
+    """
+    현재 기록 중인 Instrumentation 객체를 반환하는 함수 (계측이 꺼져 있으면 None).
+    """
+    return _active
+
+
+def snapshot() -> Dict[str, dict]:
+    """
+    현재 기록된 값을 반환하는 함수 (Instrumentation.snapshot 참고). 계측이 꺼져 있으면 빈 dict.
+    """
+    recorder = _active
+    return recorder.snapshot() if recorder is not None else {}
+
+
+def to_prometheus(prefix: str = 'calculator') -> str:
+    """
+    현재 기록된 값을 Prometheus 텍스트 형식으로 반환하는 함수. 계측이 꺼져 있으면 빈 문자열.
+    """
+    recorder = _active
+    return recorder.to_prometheus(prefix) if recorder is not None else ''
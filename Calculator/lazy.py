@@ -0,0 +1,414 @@
+# calculator/lazy.py
+
+import math
+import operator
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+from .utils import get_numpy, power_result, round_array
+
+RADIAN = 'radian'
+DEGREE = 'degree'
+
+Operand = Union['Expr', int, float, complex]
+
+# 스칼라 평가에 사용할 연산 (EngineeringCalculator 메서드에서 반올림을 뺀 계산과 같음)
+_SCALAR_OPERATIONS = {
+    'add': operator.add,
+    'subtract': operator.sub,
+    'multiply': operator.mul,
+    'divide': operator.truediv,
+    'neg': operator.neg,
+    'power': power_result,
+    'sqrt': math.sqrt,
+    'log': math.log,
+    'radians': math.radians,
+    'sin': math.sin,
+    'cos': math.cos,
+    'tan': math.tan,
+}
+
+# 연산자 표기 (repr에 사용)
+_SYMBOLS = {'add': '+', 'subtract': '-', 'multiply': '*', 'divide': '/', 'power': '**'}
+
+
+def _log_array(x, base):
+    """
+    배열 로그 함수 (EngineeringCalculator.log_array와 같은 계산).
+    """
+    np = get_numpy()
+    if base == 10:
+        return np.log10(x)
+    if base == 2:
+        return np.log2(x)
+    result = np.log(x)
+    result /= math.log(base)
+    return result
+
+
+def _array_operations() -> dict:
+    np = get_numpy()
+    return {
+        'add': np.add,
+        'subtract': np.subtract,
+        'multiply': np.multiply,
+        'divide': np.true_divide,
+        'neg': np.negative,
+        'power': np.float_power,
+        'sqrt': np.sqrt,
+        'log': _log_array,
+        'radians': np.radians,
+        'sin': np.sin,
+        'cos': np.cos,
+        'tan': np.tan,
+    }
+
+
+class Expr:
+    """
+    지연 계산 그래프(DAG)의 노드 하나. LazyCalculator의 메서드나 연산자(+, -, *, /, **, 단항 -)로 만듭니다.
+
+    노드는 만들 때 계산되지 않고, evaluate를 호출할 때 필요한 노드만 한 번씩 계산됩니다.
+    같은 LazyCalculator에서 같은 연산과 같은 입력으로 만든 노드는 같은 객체이므로(중복 제거),
+    sin(x, 'degree')를 여러 번 사용해도 한 번만 계산됩니다.
+    """
+
+    __slots__ = ('op', 'args', 'calculator')
+
+    def __init__(self, op: str, args: tuple, calculator: 'LazyCalculator'):
+        self.op = op  # 연산 이름 ('var', 'const', 'add', 'sin' 등)
+        self.args = args  # 'var'/'const'는 (이름 또는 값,), 나머지는 입력 노드들
+        self.calculator = calculator
+
+    def __repr__(self) -> str:
+        if self.op == 'var':
+            return self.args[0]
+        if self.op == 'const':
+            return repr(self.args[0])
+        if self.op in _SYMBOLS:
+            left, right = self.args
+            return f"({left!r} {_SYMBOLS[self.op]} {right!r})"
+        if self.op == 'neg':
+            return f"(-{self.args[0]!r})"
+        return f"{self.op}({', '.join(repr(arg) for arg in self.args)})"
+
+    @property
+    def variables(self) -> tuple:
+        """
+        이 노드가 사용하는 변수 이름들 (정렬됨).
+        """
+        return tuple(sorted(node.args[0] for node in self.calculator._schedule([self]) if node.op == 'var'))
+
+    def evaluate(self, bindings: Optional[Mapping[str, Any]] = None, **kwargs: Any):
+        """
+        변수 값으로 이 노드를 계산하는 함수 (LazyCalculator.evaluate 참고).
+        """
+        return self.calculator.evaluate(self, bindings, **kwargs)
+
+    def __add__(self, other: Operand) -> 'Expr':
+        return self.calculator.add(self, other)
+
+    def __radd__(self, other: Operand) -> 'Expr':
+        return self.calculator.add(other, self)
+
+    def __sub__(self, other: Operand) -> 'Expr':
+        return self.calculator.subtract(self, other)
+
+    def __rsub__(self, other: Operand) -> 'Expr':
+        return self.calculator.subtract(other, self)
+
+    def __mul__(self, other: Operand) -> 'Expr':
+        return self.calculator.multiply(self, other)
+
+    def __rmul__(self, other: Operand) -> 'Expr':
+        return self.calculator.multiply(other, self)
+
+    def __truediv__(self, other: Operand) -> 'Expr':
+        return self.calculator.divide(self, other)
+
+    def __rtruediv__(self, other: Operand) -> 'Expr':
+        return self.calculator.divide(other, self)
+
+    def __pow__(self, other: Operand) -> 'Expr':
+        return self.calculator.power(self, other)
+
+    def __rpow__(self, other: Operand) -> 'Expr':
+        return self.calculator.power(other, self)
+
+    def __neg__(self) -> 'Expr':
+        return self.calculator._node('neg', self)
+
+
+class LazyCalculator:
+    """
+    EngineeringCalculator와 같은 이름의 메서드로 계산 대신 지연 계산 그래프(DAG)를 만드는 클래스.
+
+    EngineeringCalculator 메서드를 이어서 호출하면 중간 결과마다 계산과 round_result가 실행되고, 같은 부분식
+    (예: sin(x, 'degree'))도 호출할 때마다 다시 계산됩니다. LazyCalculator는 다음과 같이 계산합니다.
+
+    - 중복 제거: 같은 연산과 같은 입력의 노드는 한 번만 만들어지고(hash-consing) 한 번만 계산됩니다.
+      degree 각도의 라디안 변환도 노드이므로 sin(x, 'degree')와 cos(x, 'degree')는 변환을 공유합니다.
+    - 반올림: 중간 결과는 반올림하지 않고, precision은 요청한 결과에 마지막에 한 번만 적용됩니다.
+    - 평가: evaluate를 호출할 때 변수 값이 모두 숫자이면 스칼라(math), 배열이 있으면 NumPy 배열 연산으로
+      필요한 노드만 계산합니다. 배열 평가에서는 더 이상 쓰이지 않는 중간 배열을 다음 연산의 출력으로 재사용합니다.
+
+    0으로 나누면 스칼라 평가와 배열 평가 모두 ZeroDivisionError가 발생합니다 (ExpressionEngine과 같음).
+    """
+
+    def __init__(self, precision: Optional[int] = None):
+        """
+        클래스 초기화 함수.
+
+        Args:
+            precision (Optional[int]): 결과의 소수점 자릿수 (None이면 반올림하지 않음).
+
+        Raises:
+            TypeError: precision이 정수나 None이 아닐 경우 발생.
+        """
+        if precision is not None and not isinstance(precision, int):
+            raise TypeError("Precision must be an integer or None.")
+        self.precision = precision
+        self._nodes: Dict[tuple, Expr] = {}  # (연산, 입력) -> 노드
+        self._plans: Dict[tuple, tuple] = {}  # 결과 노드들 -> (계산 순서, 스칼라 평가 계획). 노드는 바뀌지 않으므로 재사용
+        self._array_operations = None
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __repr__(self) -> str:
+        return f"LazyCalculator(precision={self.precision}, nodes={len(self._nodes)})"
+
+    # ---- 그래프 만들기 ----
+
+    def _operand(self, value: Operand) -> Expr:
+        if isinstance(value, Expr):
+            if value.calculator is not self:
+                raise ValueError("Cannot combine expressions from different LazyCalculator instances.")
+            return value
+        return self.constant(value)
+
+    def _node(self, op: str, *operands: Operand) -> Expr:
+        args = tuple(self._operand(operand) for operand in operands)
+        key = (op,) + tuple(map(id, args))  # 입력 노드는 중복 제거되어 있으므로 id로 비교
+        node = self._nodes.get(key)
+        if node is None:
+            node = self._nodes[key] = Expr(op, args, self)
+        return node
+
+    def _fold(self, op: str, operands: tuple) -> Expr:
+        # Calculator.add(*nums)처럼 왼쪽부터 차례대로 계산
+        if not operands:
+            raise TypeError(f"{op}() requires at least one operand.")
+        result = self._operand(operands[0])
+        for operand in operands[1:]:
+            result = self._node(op, result, operand)
+        return result
+
+    def _angle(self, angle: Operand, unit: str) -> Expr:
+        if unit == DEGREE:
+            return self._node('radians', angle)
+        if unit == RADIAN:
+            return self._operand(angle)
+        raise ValueError(f"Unknown angle unit: {unit!r}")
+
+    def var(self, name: str) -> Expr:
+        """
+        이름이 name인 변수 노드를 반환하는 함수. 값은 evaluate에서 지정합니다.
+        """
+        key = ('var', name)
+        node = self._nodes.get(key)
+        if node is None:
+            node = self._nodes[key] = Expr('var', (name,), self)
+        return node
+
+    def constant(self, value: Union[int, float, complex]) -> Expr:
+        """
+        상수 노드를 반환하는 함수. 연산자와 메서드에 숫자를 넘기면 자동으로 상수 노드가 됩니다.
+
+        Raises:
+            TypeError: value가 숫자가 아닐 경우 발생.
+        """
+        if not isinstance(value, (int, float, complex)):
+            raise TypeError(f"Unsupported operand type: {type(value).__name__}")
+        key = ('const', type(value), value)
+        node = self._nodes.get(key)
+        if node is None:
+            node = self._nodes[key] = Expr('const', (value,), self)
+        return node
+
+    def add(self, *operands: Operand) -> Expr:
+        return self._fold('add', operands)
+
+    def subtract(self, *operands: Operand) -> Expr:
+        return self._fold('subtract', operands)
+
+    def multiply(self, *operands: Operand) -> Expr:
+        return self._fold('multiply', operands)
+
+    def divide(self, *operands: Operand) -> Expr:
+        return self._fold('divide', operands)
+
+    def power(self, x: Operand, y: Operand) -> Expr:
+        return self._node('power', x, y)
+
+    def square_root(self, x: Operand) -> Expr:
+        return self._node('sqrt', x)
+
+    def log(self, x: Operand, base: Operand = 10) -> Expr:
+        return self._node('log', x, base)
+
+    def sin(self, angle: Operand, unit: str = RADIAN) -> Expr:
+        return self._node('sin', self._angle(angle, unit))
+
+    def cos(self, angle: Operand, unit: str = RADIAN) -> Expr:
+        return self._node('cos', self._angle(angle, unit))
+
+    def tan(self, angle: Operand, unit: str = RADIAN) -> Expr:
+        return self._node('tan', self._angle(angle, unit))
+
+    # ---- 평가 ----
+
+    def _schedule(self, outputs: Sequence[Expr]) -> List[Expr]:
+        """
+        outputs를 계산하는 데 필요한 노드들을 입력이 먼저 오는 순서(위상 정렬)로 반환하는 내부 함수.
+        각 노드는 한 번만 포함됩니다.
+        """
+        order, visited = [], set()
+        for output in outputs:
+            stack = [(output, False)]
+            while stack:
+                node, expanded = stack.pop()
+                if expanded:
+                    order.append(node)
+                    continue
+                if id(node) in visited:
+                    continue
+                visited.add(id(node))
+                stack.append((node, True))
+                if node.op not in ('var', 'const'):
+                    stack.extend((arg, False) for arg in reversed(node.args) if id(arg) not in visited)
+        return order
+
+    def evaluate(self, outputs: Union[Expr, Sequence[Expr]], bindings: Optional[Mapping[str, Any]] = None,
+                 **kwargs: Any):
+        """
+        변수 값으로 노드들을 계산하는 함수. 여러 노드를 함께 계산하면 공통 부분식은 한 번만 계산됩니다.
+
+        Args:
+            outputs (Union[Expr, Sequence[Expr]]): 계산할 노드 하나 또는 노드들.
+            bindings (Optional[Mapping[str, Any]]): 변수 이름 -> 값 (숫자 또는 배열).
+            **kwargs: 키워드 인자로 전달하는 변수 값.
+
+        Returns:
+            노드 하나이면 결과 하나, 노드 목록이면 결과 목록. 변수 값 중 배열이 있으면 결과는 NumPy 배열입니다.
+            precision은 결과에만 적용됩니다.
+
+        Raises:
+            NameError: 변수 값이 주어지지 않은 경우 발생.
+            ZeroDivisionError: 0으로 나누는 경우 발생 (배열 평가에서는 어느 한 원소라도 0으로 나누는 경우).
+        """
+        single = isinstance(outputs, Expr)
+        outputs = [outputs] if single else list(outputs)
+        outputs = [self._operand(output) for output in outputs]
+        if bindings is None:
+            bindings = kwargs
+        elif kwargs:
+            bindings = {**bindings, **kwargs}
+        key = tuple(map(id, outputs))
+        plan = self._plans.get(key)
+        if plan is None:
+            order = self._schedule(outputs)
+            plan = self._plans[key] = (order, self._scalar_plan(order, outputs))
+        order, scalar_plan = plan
+        precision = self.precision
+        for value in bindings.values():
+            if not isinstance(value, (int, float, complex)):
+                results = self._evaluate_arrays(order, outputs, bindings)
+                results = [round_array(result, precision) for result in results]
+                break
+        else:
+            results = self._evaluate_scalars(scalar_plan, bindings)
+            if precision is not None:
+                results = [round(result, precision) for result in results]
+        return results[0] if single else results
+
+    def _scalar_plan(self, order: List[Expr], outputs: List[Expr]) -> tuple:
+        """
+        스칼라 평가 계획을 만드는 내부 함수. 노드마다 값 목록(slots)의 위치를 정하고,
+        (상수가 채워진 slots 틀, 변수 (이름, 위치)들, 연산 (함수, 위치, 입력 위치들)들, 결과 위치들)을 반환합니다.
+        """
+        index = {id(node): position for position, node in enumerate(order)}
+        template, variables, steps = [None] * len(order), [], []
+        for position, node in enumerate(order):
+            if node.op == 'var':
+                variables.append((node.args[0], position))
+            elif node.op == 'const':
+                template[position] = node.args[0]
+            else:
+                steps.append((_SCALAR_OPERATIONS[node.op], position, tuple(index[id(arg)] for arg in node.args)))
+        return template, tuple(variables), tuple(steps), tuple(index[id(output)] for output in outputs)
+
+    def _evaluate_scalars(self, plan: tuple, bindings: Mapping[str, Any]) -> list:
+        template, variables, steps, results = plan
+        slots = template[:]
+        for name, position in variables:
+            try:
+                slots[position] = bindings[name]
+            except KeyError:
+                raise NameError(f"Undefined variable in expression: {name!r}") from None
+        for func, position, args in steps:
+            if len(args) == 1:
+                slots[position] = func(slots[args[0]])
+            else:
+                slots[position] = func(slots[args[0]], slots[args[1]])
+        return [slots[position] for position in results]
+
+    def _evaluate_arrays(self, order: List[Expr], outputs: List[Expr], bindings: Mapping[str, Any]) -> list:
+        np = get_numpy()
+        if self._array_operations is None:
+            self._array_operations = _array_operations()
+        operations = self._array_operations
+
+        # 노드마다 남은 사용 횟수. 결과로 요청된 노드는 1을 더해 재사용되지 않게 합니다.
+        remaining: Dict[int, int] = {}
+        for node in order:
+            if node.op not in ('var', 'const'):
+                for arg in node.args:
+                    remaining[id(arg)] = remaining.get(id(arg), 0) + 1
+        for output in outputs:
+            remaining[id(output)] = remaining.get(id(output), 0) + 1
+
+        values, owned = {}, set()  # owned: 이 평가에서 만든 중간 배열 (변수 값과 상수는 제외)
+        with np.errstate(all='ignore'):
+            for node in order:
+                if node.op == 'var':
+                    try:
+                        values[id(node)] = np.asarray(bindings[node.args[0]])
+                    except KeyError:
+                        raise NameError(f"Undefined variable in expression: {node.args[0]!r}") from None
+                    continue
+                if node.op == 'const':
+                    values[id(node)] = node.args[0]
+                    continue
+                func = operations[node.op]
+                args = [values[id(arg)] for arg in node.args]
+                if node.op == 'divide' and not np.all(args[1]):
+                    raise ZeroDivisionError("Error: Division by zero is not allowed.")  # 스칼라 평가와 같음
+                out = None
+                if isinstance(func, np.ufunc):
+                    # 마지막으로 사용되는 float/complex 중간 배열이 있으면 그 배열에 결과를 씀 (새 배열 생성 없음)
+                    for arg, value in zip(node.args, args):
+                        if (id(arg) in owned and remaining[id(arg)] == 1 and value.dtype.kind in 'fc'
+                                and value.dtype == np.result_type(*args)
+                                and value.shape == np.broadcast_shapes(*(np.shape(a) for a in args))):
+                            out = value
+                            owned.discard(id(arg))
+                            break
+                result = func(*args) if out is None else func(*args, out=out)
+                for arg in node.args:
+                    remaining[id(arg)] -= 1
+                    if not remaining[id(arg)]:
+                        values.pop(id(arg), None)  # 더 이상 쓰이지 않는 값은 바로 해제하여 메모리 사용량을 줄임
+                values[id(node)] = result
+                if isinstance(result, np.ndarray):
+                    owned.add(id(node))
+        return [np.asarray(values[id(output)]) for output in outputs]
@@ -0,0 +1,119 @@
+# calculator/loadgen.py
+
+import argparse
+import asyncio
+import json
+import time
+from typing import List, Optional
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    정렬된 값 목록에서 백분위 값을 구하는 함수 (nearest-rank 방식).
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+async def _connection(host: str, port: int, path: Optional[str], requests: int, window: int,
+                      request: dict, latencies: List[float]) -> int:
+    """
+    연결 하나에서 최대 window개의 요청을 응답을 기다리지 않고 보내며(pipelining) 지연 시간을 기록하는 함수.
+    응답은 요청 순서대로 돌아오므로 보낸 시각을 순서대로 보관합니다.
+    """
+    if path is not None:
+        reader, writer = await asyncio.open_unix_connection(path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    slots = asyncio.Semaphore(window)
+    sent_at = asyncio.Queue()
+    errors = 0
+
+    async def send() -> None:
+        for request_id in range(requests):
+            await slots.acquire()
+            payload = dict(request, id=request_id)
+            sent_at.put_nowait(time.perf_counter())
+            writer.write(json.dumps(payload).encode() + b'\n')
+            if slots.locked():
+                await writer.drain()
+        await writer.drain()
+
+    sender = asyncio.create_task(send())
+    for _ in range(requests):
+        line = await reader.readline()
+        latencies.append(time.perf_counter() - sent_at.get_nowait())
+        slots.release()
+        if 'error' in json.loads(line):
+            errors += 1
+    await sender
+    writer.close()
+    await writer.wait_closed()
+    return errors
+
+
+async def run_load(host: str = '127.0.0.1', port: int = 8765, path: Optional[str] = None, requests: int = 10000,
+                   connections: int = 4, window: int = 64, op: str = 'sin', args: Optional[list] = None,
+                   precision: Optional[int] = None) -> dict:
+    """
+    계산 서버에 부하를 주고 지연 시간과 처리량을 측정하는 함수.
+
+    Args:
+        host (str), port (int): TCP 서버 주소.
+        path (Optional[str]): 지정하면 TCP 대신 Unix 소켓을 사용.
+        requests (int): 연결마다 보낼 요청 수.
+        connections (int): 동시 연결 수.
+        window (int): 연결마다 응답을 기다리는 최대 요청 수 (pipelining 깊이).
+        op (str), args (Optional[list]), precision (Optional[int]): 보낼 요청 내용. 기본값은 sin(30, degree).
+
+    Returns:
+        dict: requests, errors, seconds, throughput(요청/초), p50_ms, p99_ms, max_ms 값.
+    """
+    request = {'op': op, 'args': args if args is not None else [30, 'degree']}
+    if precision is not None:
+        request['precision'] = precision
+    latencies: List[float] = []
+    start = time.perf_counter()
+    errors = await asyncio.gather(*(
+        _connection(host, port, path, requests, window, request, latencies) for _ in range(connections)
+    ))
+    seconds = time.perf_counter() - start
+    latencies.sort()
+    total = requests * connections
+    return {
+        'requests': total,
+        'errors': sum(errors),
+        'seconds': seconds,
+        'throughput': total / seconds if seconds > 0 else 0.0,
+        'p50_ms': _percentile(latencies, 0.50) * 1000,
+        'p99_ms': _percentile(latencies, 0.99) * 1000,
+        'max_ms': latencies[-1] * 1000 if latencies else 0.0,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    명령행 진입점. 예: python -m calculator.loadgen --port 8765 --requests 20000 --connections 8
+    """
+    parser = argparse.ArgumentParser(prog='calculator.loadgen', description="Load generator for calculator.server.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', default=None, help="connect to this Unix socket path instead of TCP")
+    parser.add_argument('--requests', type=int, default=10000, help="requests per connection")
+    parser.add_argument('--connections', type=int, default=4)
+    parser.add_argument('--window', type=int, default=64, help="pipelined requests in flight per connection")
+    parser.add_argument('--op', default='sin')
+    parser.add_argument('--args', default='[30, "degree"]', help="JSON list of arguments")
+    parser.add_argument('--precision', type=int, default=None)
+    args = parser.parse_args(argv)
+    stats = asyncio.run(run_load(args.host, args.port, args.unix, args.requests, args.connections, args.window,
+                                 args.op, json.loads(args.args), args.precision))
+    print(f"{stats['requests']} requests in {stats['seconds']:.3f}s ({stats['throughput']:,.0f} req/s), "
+          f"{stats['errors']} errors | p50 {stats['p50_ms']:.3f} ms | p99 {stats['p99_ms']:.3f} ms | "
+          f"max {stats['max_ms']:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+# calculator/mmap_io.py
+
+import argparse
+import os
+import sys
+import time
+from typing import Any, List, Optional, Sequence, Union
+
+from .cli import BulkEvaluator, parse_value
+from .utils import get_numpy
+
+# 입력 하나: 바이너리 파일 경로 또는 모든 원소에 공통으로 적용할 숫자
+Operand = Union[str, os.PathLike, int, float, complex]
+
+
+def _is_path(operand: Operand) -> bool:
+    return isinstance(operand, (str, os.PathLike))
+
+
+def evaluate_file(op: str, inputs: Sequence[Operand], output: Union[str, os.PathLike],
+                  dtype: Union[str, Sequence[str]] = 'float64', block_size: int = 1 << 20,
+                  precision: Optional[int] = None, **kwargs: Any) -> int:
+    """
+    평평한(flat) 바이너리 파일들을 메모리 매핑(memory-map)하여 연산 하나를 블록 단위로 계산하고,
+    결과를 메모리 매핑된 결과 파일에 바로 쓰는 함수 (예: float64 파일의 각 원소를 degree 단위 sin으로 변환).
+
+    블록마다 입력/결과 파일의 해당 구간만 매핑하고 계산이 끝나면 해제하므로, 파일 전체를 읽어 들이지 않고
+    상주 메모리는 블록 크기에 비례하는 수준으로 유지됩니다. 따라서 RAM보다 큰 파일도 처리할 수 있습니다.
+
+    Args:
+        op (str): 연산 이름 (cli.OPERATIONS의 키, 예: 'divide', 'power', 'sin', 'magnitude').
+        inputs (Sequence[Operand]): 입력 파일 경로들. 숫자를 넣으면 모든 원소에 같은 값을 사용합니다 (예: 지수 2).
+        output (Union[str, os.PathLike]): 결과 파일 경로 (새로 만들거나 덮어씀).
+        dtype (Union[str, Sequence[str]]): 입력 파일의 dtype (예: 'float64', 'complex128'). 파일마다 다르면 목록으로 지정.
+        block_size (int): 한 번에 계산할 원소 수. 기본값은 1,048,576.
+        precision (Optional[int]): 소수점 자릿수 (복소수 연산에는 적용되지 않음).
+        **kwargs: unit, base 등 연산 메서드에 그대로 전달할 키워드 인자.
+
+    Returns:
+        int: 계산한 원소 수.
+
+    Raises:
+        ValueError: 입력 파일이 없거나, 파일 크기가 dtype 크기의 배수가 아니거나, 파일들의 원소 수가 다를 경우 발생.
+    """
+    np = get_numpy()
+    if block_size < 1:
+        raise ValueError("block_size must be a positive integer.")
+    paths = [operand for operand in inputs if _is_path(operand)]
+    if not paths:
+        raise ValueError("At least one input file is required.")
+    dtypes = [np.dtype(dtype)] * len(paths) if isinstance(dtype, str) else [np.dtype(d) for d in dtype]
+    if len(dtypes) != len(paths):
+        raise ValueError("dtype must be a single dtype or one dtype per input file.")
+
+    lengths = set()
+    for path, file_dtype in zip(paths, dtypes):
+        size = os.path.getsize(path)
+        if size % file_dtype.itemsize:
+            raise ValueError(f"Size of {os.fspath(path)!r} is not a multiple of {file_dtype} ({file_dtype.itemsize} bytes).")
+        lengths.add(size // file_dtype.itemsize)
+    if len(lengths) != 1:
+        raise ValueError("All input files must contain the same number of elements.")
+    length = lengths.pop()
+
+    evaluator = BulkEvaluator()
+
+    def operands(start: int, count: int) -> List[Any]:
+        # 파일 입력은 [start, start + count) 구간만 읽기 전용으로 매핑, 숫자 입력은 그대로 사용
+        views, files = [], iter(zip(paths, dtypes))
+        for operand in inputs:
+            if _is_path(operand):
+                path, file_dtype = next(files)
+                views.append(np.memmap(path, dtype=file_dtype, mode='r', offset=start * file_dtype.itemsize,
+                                       shape=(count,)))
+            else:
+                views.append(operand)
+        return views
+
+    # 결과 dtype은 첫 원소만 계산하여 결정 (빈 파일이면 같은 dtype의 1로 대신 계산)
+    if length:
+        samples = operands(0, 1)
+    else:
+        files = iter(dtypes)
+        samples = [np.ones(1, dtype=next(files)) if _is_path(operand) else operand for operand in inputs]
+    out_dtype = np.dtype(evaluator.array_result_dtype(op, samples, precision, **kwargs))
+    del samples
+    with open(output, 'wb') as handle:
+        handle.truncate(length * out_dtype.itemsize)  # 결과 파일 크기를 미리 확보 (sparse 파일)
+
+    for start in range(0, length, block_size):
+        count = min(block_size, length - start)
+        views = operands(start, count)
+        result = np.memmap(output, dtype=out_dtype, mode='r+', offset=start * out_dtype.itemsize, shape=(count,))
+        result[:] = evaluator.evaluate_array(op, views, precision, **kwargs)
+        result.flush()
+        del result, views  # 블록 매핑 해제
+    return length
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    명령행 진입점. 예: python -m calculator.mmap_io sin angles.f64 -o sines.f64 --unit degree
+    """
+    parser = argparse.ArgumentParser(
+        prog='calculator.mmap_io',
+        description="Apply a calculator operation block by block to memory-mapped flat binary files.",
+    )
+    parser.add_argument('op', help="operation name, e.g. divide, power, sin, magnitude")
+    parser.add_argument('inputs', nargs='+', help="input files; plain numbers are broadcast to every element")
+    parser.add_argument('-o', '--output', required=True, help="result file")
+    parser.add_argument('--dtype', default='float64', help="input dtype, e.g. float64 or complex128")
+    parser.add_argument('--block-size', type=int, default=1 << 20, help="elements per block (default: 1048576)")
+    parser.add_argument('--precision', type=int, default=None)
+    parser.add_argument('--unit', default=None, help="angle unit for sin/cos/tan (radian or degree)")
+    parser.add_argument('--base', type=float, default=None, help="logarithm base for log")
+    args = parser.parse_args(argv)
+
+    inputs = [value if os.path.exists(value) else parse_value(value) for value in args.inputs]
+    kwargs = {key: value for key, value in (('unit', args.unit), ('base', args.base)) if value is not None}
+    start = time.perf_counter()
+    count = evaluate_file(args.op, inputs, args.output, args.dtype, args.block_size, args.precision, **kwargs)
+    seconds = time.perf_counter() - start
+    rate = count / seconds if seconds > 0 else 0.0
+    print(f"{count} elements in {seconds:.3f}s ({rate:,.0f} elements/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
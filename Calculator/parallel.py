@@ -0,0 +1,176 @@
+# calculator/parallel.py
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from .cli import BulkEvaluator
+from .utils import get_numpy
+
+# 각 작업 프로세스가 재사용하는 계산기 묶음 (작업 프로세스 초기화 시 생성)
+_worker_evaluator = None
+
+
+def _init_worker() -> None:
+    """
+    작업 프로세스 초기화 함수. 계산기 인스턴스를 한 번만 만들어 모든 작업에서 재사용합니다.
+    """
+    global _worker_evaluator
+    _worker_evaluator = BulkEvaluator()
+
+
+def _evaluate_rows(rows: List[Tuple[str, list, Optional[int]]]) -> List[Tuple[bool, Any]]:
+    """
+    작업 프로세스에서 (연산, 인자, precision) 행 묶음을 계산하는 함수.
+    각 행의 결과는 (성공 여부, 결과 또는 에러 메시지)입니다.
+    """
+    evaluate = _worker_evaluator.evaluate
+    results = []
+    for op, args, precision in rows:
+        try:
+            results.append((True, evaluate(op, args, precision)))
+        except (ArithmeticError, ValueError, TypeError) as exc:
+            results.append((False, f"{type(exc).__name__}: {exc}"))
+    return results
+
+
+def _attach(spec: Tuple[str, tuple, str]):
+    """
+    공유 메모리 블록에 연결하여 (블록, NumPy 배열 뷰)를 반환하는 함수. 데이터는 복사하지 않습니다.
+    """
+    np = get_numpy()
+    name, shape, dtype = spec
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _evaluate_slice(op: str, inputs: List[Tuple[str, tuple, str]], output: Tuple[str, tuple, str],
+                    start: int, stop: int, precision: Optional[int], kwargs: dict) -> None:
+    """
+    작업 프로세스에서 공유 메모리 배열의 [start:stop] 구간을 계산하여 결과 공유 메모리에 바로 쓰는 함수.
+    입력과 결과 배열은 프로세스 간에 pickle로 전달되지 않습니다.
+    """
+    blocks, views = [], []
+    try:
+        for spec in inputs + [output]:
+            block, view = _attach(spec)
+            blocks.append(block)
+            views.append(view)
+        *arrays, result = views
+        result[start:stop] = _worker_evaluator.evaluate_array(op, [array[start:stop] for array in arrays],
+                                                             precision, **kwargs)
+        del arrays, result
+    finally:
+        views.clear()  # 블록을 닫기 전에 버퍼를 참조하는 배열 뷰를 모두 해제
+        for block in blocks:
+            block.close()
+
+
+class ParallelEvaluator:
+    """
+    큰 연산 묶음을 여러 프로세스에 나누어 계산하는 클래스.
+
+    - evaluate: (연산, 인자, precision) 행들을 묶음으로 나누어 계산하고 입력 순서대로 결과를 반환합니다.
+    - map_arrays: 숫자 배열에 대한 연산을 공유 메모리(multiprocessing.shared_memory)에 올려
+      각 프로세스가 자기 구간만 계산해서 결과 배열에 바로 쓰도록 합니다 (배열 pickle 없음).
+
+    각 작업 프로세스는 계산기 인스턴스를 한 번만 만들어 재사용합니다. with 문으로 사용하거나 close를 호출해야 합니다.
+    """
+
+    def __init__(self, processes: Optional[int] = None, chunk_size: int = 100_000, mp_context=None):
+        """
+        클래스 초기화 함수.
+
+        Args:
+            processes (Optional[int]): 작업 프로세스 수. None이면 CPU 코어 수.
+            chunk_size (int): 한 작업에 넘길 행(또는 배열 원소) 수. 기본값은 100,000.
+            mp_context: multiprocessing 컨텍스트 (예: multiprocessing.get_context('spawn')). None이면 기본값.
+
+        Raises:
+            ValueError: chunk_size가 1보다 작을 경우 발생.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._executor = ProcessPoolExecutor(self.processes, mp_context=mp_context, initializer=_init_worker)
+
+    def __enter__(self) -> 'ParallelEvaluator':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        작업 프로세스들을 종료하는 함수.
+        """
+        self._executor.shutdown()
+
+    def evaluate(self, rows: Iterable[Tuple[str, list, Optional[int]]]) -> List[Tuple[bool, Any]]:
+        """
+        (연산, 인자, precision) 행들을 여러 프로세스에서 계산하는 함수.
+
+        Args:
+            rows (Iterable[Tuple[str, list, Optional[int]]]): 계산할 행들 (예: ('add', [1, 2], None)).
+
+        Returns:
+            List[Tuple[bool, Any]]: 입력 순서대로 (성공 여부, 결과 또는 에러 메시지).
+        """
+        rows = list(rows)
+        chunks = [rows[i:i + self.chunk_size] for i in range(0, len(rows), self.chunk_size)]
+        results = []
+        for chunk_results in self._executor.map(_evaluate_rows, chunks):
+            results.extend(chunk_results)
+        return results
+
+    def map_arrays(self, op: str, *arrays: Sequence, precision: Optional[int] = None, **kwargs: Any):
+        """
+        배열 연산 하나를 여러 프로세스에서 구간별로 계산하는 함수 (예: map_arrays('sin', angles, unit='degree')).
+
+        Args:
+            op (str): 연산 이름 (cli.OPERATIONS의 키. to_polar처럼 결과가 튜플인 연산은 지원하지 않음).
+            *arrays (Sequence): 같은 길이의 1차원 입력 배열들.
+            precision (Optional[int]): 소수점 자릿수 (복소수 연산에는 적용되지 않음).
+            **kwargs: unit, base 등 메서드에 그대로 전달할 키워드 인자.
+
+        Returns:
+            numpy.ndarray: 입력 순서대로 계산된 결과 배열.
+
+        Raises:
+            ValueError: 배열 길이가 다르거나 결과가 배열 하나가 아닌 연산인 경우 발생.
+        """
+        np = get_numpy()
+        arrays = [np.ascontiguousarray(array) for array in arrays]
+        if not arrays or any(array.ndim != 1 for array in arrays) or len({len(a) for a in arrays}) != 1:
+            raise ValueError("map_arrays requires one or more 1-D arrays of the same length.")
+        length = len(arrays[0])
+        # 결과 dtype을 알기 위해 첫 원소만 현재 프로세스에서 계산
+        dtype = np.dtype(BulkEvaluator().array_result_dtype(op, arrays, precision, **kwargs))
+
+        blocks = []
+        try:
+            input_specs = []
+            for array in arrays:
+                block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                blocks.append(block)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+                input_specs.append((block.name, array.shape, array.dtype.str))
+            output_block = shared_memory.SharedMemory(create=True, size=max(length * dtype.itemsize, 1))
+            blocks.append(output_block)
+            output_spec = (output_block.name, (length,), dtype.str)
+
+            futures = [
+                self._executor.submit(_evaluate_slice, op, input_specs, output_spec, start,
+                                      min(start + self.chunk_size, length), precision, kwargs)
+                for start in range(0, length, self.chunk_size)
+            ]
+            for future in futures:
+                future.result()  # 작업 프로세스의 예외를 그대로 전달
+            result = np.ndarray((length,), dtype=dtype, buffer=output_block.buf).copy()
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+        return result
@@ -0,0 +1,285 @@
+# calculator/persistent_cache.py
+
+import marshal
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional
+
+from .cache import LRUCache, MISSING
+
+# 다른 프로세스의 쓰기를 반영하기 위해 파일의 결과 수를 다시 세는 간격 (flush 횟수)
+RECOUNT_INTERVAL = 16
+
+# 결과 테이블. namespace는 계산기 클래스 이름이며, used는 마지막 사용 시각(크기 제한 시 오래된 것부터 제거)입니다.
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS results ("
+    " namespace TEXT NOT NULL, key TEXT NOT NULL, data BLOB NOT NULL, used REAL NOT NULL,"
+    " PRIMARY KEY (namespace, key))",
+    "CREATE INDEX IF NOT EXISTS results_used ON results (used)",
+)
+
+
+class PersistentCache:
+    """
+    SQLite 파일에 계산 결과를 저장하여 프로세스를 다시 시작해도 재사용할 수 있는 캐시 클래스.
+    LRUCache와 같은 get/put/invalidate/clear/info 메서드를 제공하므로 계산기의 결과 캐시로 사용할 수 있습니다
+    (EngineeringCalculator.enable_cache, ComplexCalculator.enable_cache의 path 인자).
+
+    - 여러 프로세스가 같은 파일을 동시에 읽고 쓸 수 있습니다 (WAL 모드, 쓰기는 트랜잭션 단위).
+    - 읽은 결과는 프로세스 안의 LRU 캐시에도 보관하므로 반복 조회는 파일을 읽지 않습니다.
+      파일에서는 키의 repr 문자열로 찾지만 프로세스 안의 LRU 캐시는 키를 ==로 비교하므로, (1,)과 (1.0,)처럼
+      값이 같은 키는 같은 키로 취급될 수 있습니다. 타입을 구분해야 하면 키에 타입을 포함하세요
+      (계산기의 결과 캐시 키에는 인자 타입 이름이 들어 있습니다).
+    - 쓰기는 write_batch개씩 모아 한 트랜잭션으로 기록하며, 적중한 결과의 사용 시각도 이때 함께 갱신합니다.
+      종료 전에 close(또는 flush)를 호출하세요.
+    - 파일의 결과 수가 maxsize를 넘으면 가장 오래 사용되지 않은 결과부터 제거합니다. 여러 프로세스가 동시에 쓰면
+      잠시 maxsize를 넘을 수 있으며, 다음에 결과 수를 다시 셀 때 제거됩니다.
+    - 키와 결과는 marshal로 저장하므로 숫자, 문자열, 튜플 같은 기본 타입만 파일에 저장되며,
+      그 밖의 값(NumPy 스칼라 등)은 프로세스 안의 LRU 캐시에만 보관합니다.
+    - 적중/실패/제거 횟수는 프로세스별로 집계합니다.
+    """
+
+    def __init__(self, path: str, maxsize: int = 100_000, namespace: str = '', memory_size: int = 4096,
+                 write_batch: int = 64, preload: bool = False, timeout: float = 30.0):
+        """
+        클래스 초기화 함수. 파일이 없으면 새로 만듭니다.
+
+        Args:
+            path (str): SQLite 파일 경로.
+            maxsize (int): 파일에 보관할 최대 결과 수 (모든 namespace 합계).
+            namespace (str): 같은 파일을 쓰는 다른 계산기 클래스의 결과와 구분하기 위한 이름.
+            memory_size (int): 프로세스 안의 LRU 캐시에 보관할 최대 결과 수.
+            write_batch (int): 한 트랜잭션으로 모아 기록할 쓰기 수.
+            preload (bool): True이면 최근 사용된 결과를 memory_size개까지 미리 읽습니다 (preload 참고).
+            timeout (float): 다른 프로세스가 쓰는 동안 잠금을 기다릴 최대 시간(초).
+
+        Raises:
+            ValueError: maxsize, memory_size, write_batch가 1보다 작을 경우 발생.
+        """
+        for name, value in (('maxsize', maxsize), ('memory_size', memory_size), ('write_batch', write_batch)):
+            if not isinstance(value, int) or value < 1:
+                raise ValueError(f"{name} must be a positive integer.")
+        self.path = os.fspath(path)
+        self.maxsize = maxsize
+        self.namespace = namespace
+        self.write_batch = write_batch
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.preloaded = 0
+        self._memory = LRUCache(memory_size)
+        self._pending = {}  # 아직 기록하지 않은 결과: 키 문자열(repr) -> marshal 데이터
+        self._touched = set()  # 적중했지만 사용 시각을 아직 갱신하지 않은 키 (다음 쓰기와 함께 기록)
+        self._last = (None, None)  # 파일에서 찾지 못한 마지막 (키, 키 문자열). 이어지는 put에서 repr을 다시 계산하지 않기 위해 사용
+        self._size = None  # 파일의 결과 수 추정값 (다른 프로세스의 쓰기는 다시 셀 때 반영)
+        self._flushes = 0
+        self._lock = threading.Lock()  # 연결과 대기 목록을 스레드 사이에서 보호
+        self._connection = None
+        self._pid = None
+        self._connect()
+        if preload:
+            self.preload()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        현재 프로세스의 SQLite 연결을 반환하는 내부 함수.
+        fork로 만든 자식 프로세스는 부모의 연결을 사용할 수 없으므로 프로세스가 바뀌면 새로 연결합니다.
+        """
+        if self._pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None,
+                                         check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            self._connection, self._pid = connection, os.getpid()
+            self._pending, self._touched, self._size = {}, set(), None
+        return self._connection
+
+    def __len__(self) -> int:
+        self.flush()
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def __enter__(self) -> 'PersistentCache':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get(self, key: Hashable) -> Any:
+        """
+        캐시에서 값을 찾는 함수. 프로세스 안의 LRU 캐시를 먼저 찾고, 없으면 파일에서 읽습니다.
+
+        Args:
+            key (Hashable): 찾을 키.
+
+        Returns:
+            Any: 저장된 값. 없으면 MISSING 객체를 반환.
+
+        Raises:
+            TypeError: key를 해시할 수 없을 경우 발생.
+        """
+        value = self._memory.get(key)
+        if value is MISSING:
+            text = repr(key)
+            self._last = (key, text)
+            with self._lock:
+                row = self._connect().execute("SELECT data FROM results WHERE namespace = ? AND key = ?",
+                                              (self.namespace, text)).fetchone()
+            if row is None:
+                self.misses += 1
+                return MISSING
+            value = marshal.loads(row[0])[1]
+            self._memory.put(key, value)
+        self.hits += 1
+        with self._lock:
+            self._touched.add(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        캐시에 값을 저장하는 함수. 파일에는 write_batch개가 모이거나 flush를 호출할 때 기록됩니다.
+
+        Args:
+            key (Hashable): 저장할 키.
+            value (Any): 저장할 값.
+        """
+        self._memory.put(key, value)
+        last_key, text = self._last
+        if last_key is not key:
+            text = repr(key)
+        try:
+            data = marshal.dumps((key, value))
+        except ValueError:
+            return  # 파일에 저장할 수 없는 타입은 프로세스 안에만 보관
+        with self._lock:
+            self._pending[text] = data
+            full = len(self._pending) >= self.write_batch
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        모아 둔 쓰기와 사용 시각 갱신을 한 트랜잭션으로 기록하고, 최대 크기를 넘은 결과를 제거하는 함수.
+        """
+        with self._lock:
+            connection = self._connect()
+            pending, self._pending = self._pending, {}
+            touched, self._touched = {repr(key) for key in self._touched} - pending.keys(), set()
+            if not pending and not touched:
+                return
+            now = time.time()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO results (namespace, key, data, used) VALUES (?, ?, ?, ?)",
+                    [(self.namespace, text, data, now) for text, data in pending.items()])
+                connection.executemany("UPDATE results SET used = ? WHERE namespace = ? AND key = ?",
+                                       [(now, self.namespace, text) for text in touched])
+                if pending:
+                    self._trim(connection, len(pending))
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    def _trim(self, connection: sqlite3.Connection, written: int) -> None:
+        """
+        파일의 결과 수가 maxsize를 넘으면 가장 오래 사용되지 않은 결과부터 제거하는 내부 함수 (flush의 트랜잭션 안에서 호출).
+        COUNT(*)는 결과 수에 비례하는 비용이 들므로 추정값이 maxsize를 넘거나 RECOUNT_INTERVAL번 기록할 때마다만 다시 셉니다.
+        """
+        self._flushes += 1
+        if self._size is not None and self._size + written <= self.maxsize and self._flushes % RECOUNT_INTERVAL:
+            self._size += written
+            return
+        self._size = connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        excess = self._size - self.maxsize
+        if excess > 0:
+            connection.execute("DELETE FROM results WHERE rowid IN "
+                               "(SELECT rowid FROM results ORDER BY used LIMIT ?)", (excess,))
+            self.evictions += excess
+            self._size = self.maxsize
+
+    def preload(self, limit: Optional[int] = None) -> int:
+        """
+        파일에서 최근 사용된 결과를 프로세스 안의 LRU 캐시로 미리 읽는 함수 (warm start).
+        새로 시작한 프로세스가 첫 호출부터 파일을 읽지 않고 결과를 재사용할 수 있습니다.
+
+        Args:
+            limit (Optional[int]): 읽을 최대 결과 수. None이면 LRU 캐시 크기(memory_size)만큼.
+
+        Returns:
+            int: 읽은 결과 수.
+        """
+        if limit is None:
+            limit = self._memory.maxsize
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT data FROM results WHERE namespace = ? ORDER BY used DESC LIMIT ?",
+                (self.namespace, limit)).fetchall()
+        for data, in reversed(rows):  # 가장 최근에 사용된 결과가 LRU 캐시에서도 가장 최근이 되도록
+            self._memory.put(*marshal.loads(data))
+        self.preloaded += len(rows)
+        return len(rows)
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """
+        이 namespace의 캐시 항목을 파일에서 삭제하는 함수. 통계는 유지됩니다.
+        다른 프로세스의 LRU 캐시에 이미 읽힌 결과는 그 프로세스에서 계속 사용될 수 있습니다.
+
+        Args:
+            predicate (Optional[Callable[[Hashable], bool]]): 키를 받아 삭제 여부를 반환하는 함수.
+                                                              None이면 모든 항목을 삭제.
+
+        Returns:
+            int: 삭제된 항목 수.
+        """
+        self.flush()
+        self._memory.invalidate(predicate)
+        with self._lock:
+            connection = self._connect()
+            if predicate is None:
+                return connection.execute("DELETE FROM results WHERE namespace = ?", (self.namespace,)).rowcount
+            rows = connection.execute("SELECT rowid, data FROM results WHERE namespace = ?",
+                                      (self.namespace,)).fetchall()
+            rowids = [(rowid,) for rowid, data in rows if predicate(marshal.loads(data)[0])]
+            connection.executemany("DELETE FROM results WHERE rowid = ?", rowids)
+            return len(rowids)
+
+    def clear(self) -> None:
+        """
+        이 namespace의 모든 항목과 통계를 초기화하는 함수.
+        """
+        self.invalidate()
+        self._memory.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.preloaded = 0
+
+    def info(self) -> dict:
+        """
+        캐시 상태를 딕셔너리로 반환하는 함수. 모아 둔 쓰기를 먼저 기록합니다 (size 계산).
+
+        Returns:
+            dict: hits, misses, evictions, size(파일의 결과 수), maxsize, memory_size(LRU 캐시의 결과 수),
+                  preloaded, hit_rate(조회가 없으면 0.0) 값을 담은 딕셔너리.
+        """
+        lookups = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'size': len(self),
+                'maxsize': self.maxsize, 'memory_size': len(self._memory), 'preloaded': self.preloaded,
+                'hit_rate': self.hits / lookups if lookups else 0.0}
+
+    def close(self) -> None:
+        """
+        모아 둔 쓰기를 기록하고 파일 연결을 닫는 함수. 닫은 뒤에 다시 사용하면 새로 연결합니다.
+        """
+        self.flush()
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+            self._connection, self._pid = None, None
@@ -0,0 +1,154 @@
+# calculator/polynomial.py
+
+from typing import Optional, Sequence, Union
+
+from .utils import get_numpy, round_array, round_result
+
+Number = Union[int, float, complex]
+
+METHODS = ('auto', 'horner', 'estrin')
+
+# method='auto'일 때 Estrin 방식을 사용하는 조건: 차수가 ESTRIN_MIN_DEGREE 이상이고 점의 수가 ESTRIN_MAX_POINTS 이하.
+# 점이 적으면 배열 연산 호출 비용이 대부분이므로 호출 수가 log2(차수)인 Estrin이 빠르고,
+# 점이 많으면 중간 배열이 커지는 Estrin보다 배열 하나를 제자리에서 갱신하는 Horner가 빠릅니다.
+ESTRIN_MIN_DEGREE = 32
+ESTRIN_MAX_POINTS = 256
+
+# Estrin 방식에서 한 번에 만드는 중간 배열의 최대 원소 수 (입력이 크면 나누어 계산하여 메모리 사용량을 제한)
+ESTRIN_BLOCK_ELEMENTS = 1 << 18
+
+
+def _round_scalar(value: Number, precision: Optional[int]) -> Number:
+    """
+    스칼라 결과에 precision을 적용하는 내부 함수. 복소수는 실수부와 허수부를 각각 반올림합니다.
+    """
+    if precision is not None and isinstance(value, complex):
+        return complex(round(value.real, precision), round(value.imag, precision))
+    return round_result(value, precision)
+
+
+class Polynomial:
+    """
+    계수 목록으로 정의한 다항식을 여러 점에서 한 번에 계산하는 클래스.
+
+    계수는 최고차항부터 나열합니다 (numpy.polyval과 같은 순서). 예: Polynomial([2, 0, -1])은 2x² - 1.
+    실수와 복소수 계수/입력을 모두 지원하며, 복소수 연산은 ComplexCalculator와 같이 Python/NumPy 복소수 연산을 따릅니다.
+
+    - 스칼라 입력: Horner 방식으로 Python에서 계산합니다. 정수 계수와 정수 입력이면 정확한 int를 반환합니다.
+    - 배열 입력(NumPy 필요): 차수마다 배열 연산 한 번(Horner) 또는 log2(차수)번(Estrin)으로 모든 점을 한 번에 계산합니다.
+      Estrin 방식은 계수를 두 개씩 묶어(c0 + c1·x) x², x⁴, ...로 합치는 방식으로, 차수가 높고 점이 적을 때 빠릅니다.
+
+    precision은 마지막 결과에 한 번만 적용됩니다 (복소수는 실수부/허수부 각각).
+    """
+
+    def __init__(self, coefficients: Sequence[Number]):
+        """
+        클래스 초기화 함수.
+
+        Args:
+            coefficients (Sequence[Number]): 최고차항부터 나열한 계수들.
+
+        Raises:
+            ValueError: 계수가 없을 경우 발생.
+        """
+        coefficients = tuple(coefficients)
+        if not coefficients:
+            raise ValueError("A polynomial needs at least one coefficient.")
+        self.coefficients = coefficients
+        self._array = None  # NumPy 배열 버전의 계수 (배열 입력을 처음 계산할 때 생성)
+
+    def __repr__(self) -> str:
+        return f"Polynomial({list(self.coefficients)})"
+
+    @property
+    def degree(self) -> int:
+        return len(self.coefficients) - 1
+
+    def __call__(self, x, precision: Optional[int] = None, method: str = 'auto'):
+        return self.evaluate(x, precision, method)
+
+    def evaluate(self, x, precision: Optional[int] = None, method: str = 'auto'):
+        """
+        다항식을 계산하는 함수.
+
+        Args:
+            x: 계산할 점. 숫자(int, float, complex) 하나 또는 숫자 배열(list, NumPy 배열 등).
+            precision (Optional[int]): 결과의 소수점 자릿수 (None이면 반올림하지 않음).
+            method (str): 'auto'(기본값), 'horner', 'estrin'. 'auto'는 배열 입력의 차수가 ESTRIN_MIN_DEGREE 이상이고
+                점의 수가 ESTRIN_MAX_POINTS 이하이면 Estrin, 그 외에는 Horner를 사용합니다.
+                스칼라 입력은 항상 Horner로 계산합니다.
+
+        Returns:
+            숫자 입력이면 숫자, 배열 입력이면 같은 모양의 NumPy 배열.
+
+        Raises:
+            ValueError: 알 수 없는 method인 경우 발생.
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown method: {method!r} (expected one of {', '.join(METHODS)})")
+        if isinstance(x, (int, float, complex)):
+            result = self.coefficients[0]
+            for coefficient in self.coefficients[1:]:
+                result = result * x + coefficient
+            return _round_scalar(result, precision)
+
+        np = get_numpy()
+        if self._array is None:
+            self._array = np.asarray(self.coefficients)
+        x = np.asarray(x)
+        if method == 'estrin' or (method == 'auto' and self.degree >= ESTRIN_MIN_DEGREE
+                                  and x.size <= ESTRIN_MAX_POINTS):
+            result = self._estrin(x)
+        else:
+            result = self._horner(x)
+        return round_array(result, precision)
+
+    def _horner(self, x):
+        """
+        배열 입력을 Horner 방식으로 계산하는 내부 함수: ((c0·x + c1)·x + c2)·x + ...
+        """
+        np = get_numpy()
+        coefficients = self._array
+        result = np.full(x.shape, coefficients[0], dtype=np.result_type(coefficients, x))
+        for coefficient in coefficients[1:]:
+            result *= x
+            result += coefficient
+        return result
+
+    def _estrin(self, x):
+        """
+        배열 입력을 Estrin 방식으로 계산하는 내부 함수.
+        단계마다 모든 (짝수 차 계수 + 홀수 차 계수·x^(2^k)) 쌍을 배열 연산 한 번으로 계산하므로
+        배열 연산은 약 log2(차수)번이며, 중간 배열이 ESTRIN_BLOCK_ELEMENTS를 넘지 않도록 입력을 나누어 계산합니다.
+        """
+        np = get_numpy()
+        lowest_first = self._array[::-1]
+        flat = x.reshape(-1)
+        result = np.empty(flat.shape, dtype=np.result_type(lowest_first, flat))
+        block = max(1, ESTRIN_BLOCK_ELEMENTS // max(1, (len(lowest_first) + 1) // 2))
+        for start in range(0, len(flat), block):
+            power = flat[start:start + block]
+            terms = lowest_first[:, None]  # (계수 수, 1): 첫 단계에서 입력 길이로 broadcast
+            while len(terms) > 1:
+                if len(terms) % 2:
+                    terms = np.concatenate([terms, np.zeros((1,) + terms.shape[1:], dtype=terms.dtype)])
+                terms = terms[0::2] + terms[1::2] * power
+                power = power * power
+            result[start:start + block] = terms[0]
+        return result.reshape(x.shape)
+
+
+def polyval(coefficients: Sequence[Number], x, precision: Optional[int] = None, method: str = 'auto'):
+    """
+    계수 목록(최고차항부터)으로 정의한 다항식을 x에서 계산하는 함수. Polynomial(coefficients).evaluate와 같습니다.
+
+    Args:
+        coefficients (Sequence[Number]): 최고차항부터 나열한 계수들 (예: [2, 0, -1]은 2x² - 1).
+        x: 숫자 하나 또는 숫자 배열.
+        precision (Optional[int]): 결과의 소수점 자릿수.
+        method (str): 'auto', 'horner', 'estrin' 중 하나.
+
+    Returns:
+        숫자 입력이면 숫자, 배열 입력이면 NumPy 배열.
+    """
+    return Polynomial(coefficients).evaluate(x, precision, method)
@@ -0,0 +1,235 @@
+# calculator/registry.py
+
+import functools
+import inspect
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+from .basic import Calculator
+from .complex_cal import ComplexCalculator
+from .engineering import EngineeringCalculator
+from . import calculator_module
+
+# 연산 이름 -> (계산기 종류, 메서드 이름)
+# 'basic'은 precision 키워드를, 'engineering'은 precision 설정된 인스턴스를, 'complex'와 'integer'(정확한 정수 연산)는
+# precision 없이 호출합니다. 'integer' 연산은 배열 버전이 없습니다.
+OPERATIONS = {
+    'add': ('basic', 'add'),
+    'subtract': ('basic', 'subtract'),
+    'multiply': ('basic', 'multiply'),
+    'divide': ('basic', 'divide'),
+    'square_root': ('engineering', 'square_root'),
+    'sqrt': ('engineering', 'square_root'),
+    'power': ('engineering', 'power'),
+    'log': ('engineering', 'log'),
+    'sin': ('engineering', 'sin'),
+    'cos': ('engineering', 'cos'),
+    'tan': ('engineering', 'tan'),
+    'int_power': ('integer', 'int_power'),
+    'int_sqrt': ('integer', 'int_sqrt'),
+    'is_perfect_square': ('integer', 'is_perfect_square'),
+    'complex_add': ('complex', 'add'),
+    'complex_subtract': ('complex', 'subtract'),
+    'complex_multiply': ('complex', 'multiply'),
+    'complex_divide': ('complex', 'divide'),
+    'magnitude': ('complex', 'magnitude'),
+    'argument': ('complex', 'argument'),
+    'to_polar': ('complex', 'to_polar'),
+    'to_rectangular': ('complex', 'to_rectangular'),
+}
+
+# calculator_module(이전 계산기 계층)에만 있는 연산
+LEGACY_OPERATIONS = {
+    'ln': ('engineering', 'ln'),
+}
+
+
+class Operation:
+    """
+    레지스트리에 등록된 연산 하나. 호출할 함수와 위치 인자 구성(schema)을 미리 구해 둡니다.
+
+    Attributes:
+        name (str): 연산 이름.
+        func (Callable): 미리 찾아 둔 호출 함수 (예: 계산기 인스턴스의 bound method).
+        params (Tuple[str, ...]): 위치 인자 이름들 (가변 인자는 '*nums'처럼 표시).
+        min_args (int): 최소 위치 인자 수.
+        max_args (Optional[int]): 최대 위치 인자 수 (가변 인자이면 None).
+        kind (str): 계산기 종류 ('basic', 'engineering', 'complex' 등).
+    """
+
+    __slots__ = ('name', 'func', 'params', 'min_args', 'max_args', 'kind')
+
+    def __init__(self, name: str, func: Callable, kind: str = 'custom', signature_of: Optional[Callable] = None):
+        self.name = name
+        self.func = func
+        self.kind = kind
+        params, min_args, max_args = [], 0, 0
+        for param in inspect.signature(signature_of or func).parameters.values():
+            if param.kind is param.VAR_POSITIONAL:
+                params.append('*' + param.name)
+                max_args = None
+            elif param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+                params.append(param.name)
+                if param.default is param.empty:
+                    min_args += 1
+                if max_args is not None:
+                    max_args += 1
+        self.params = tuple(params)
+        self.min_args = min_args
+        self.max_args = max_args
+
+    def __repr__(self) -> str:
+        return f"Operation({self.name!r}, params={self.params}, kind={self.kind!r})"
+
+    def __call__(self, *args: Any) -> Any:
+        return self.func(*args)
+
+    def check(self, args: Sequence) -> None:
+        """
+        인자 수가 연산의 위치 인자 구성에 맞는지 확인하는 함수.
+
+        Raises:
+            TypeError: 인자 수가 맞지 않을 경우 발생.
+        """
+        count = len(args)
+        if count < self.min_args or (self.max_args is not None and count > self.max_args):
+            expected = f"at least {self.min_args}" if self.max_args is None else (
+                str(self.min_args) if self.min_args == self.max_args else f"{self.min_args} to {self.max_args}")
+            raise TypeError(f"{self.name}() takes {expected} argument(s) ({count} given)")
+
+
+class OperationRegistry:
+    """
+    연산 이름으로 계산기 메서드를 바로 호출하는 레지스트리 클래스.
+
+    등록할 때 계산기 인스턴스의 메서드를 미리 찾아 두고(precision은 인스턴스 설정이나 functools.partial로 고정),
+    호출 시에는 딕셔너리 조회 한 번과 위치 인자 호출만 하므로 매번 getattr이나 키워드 인자를 풀 필요가 없습니다.
+
+    - legacy=False (기본값): basic/engineering/complex_cal 모듈의 계산기를 사용합니다.
+    - legacy=True: calculator_module(이전 계층)의 Calculator/EngineeringCalculator를 사용하고 ln 연산이 추가됩니다.
+      각도 단위는 두 계층 모두 두 번째 위치 인자이므로(unit / angle_unit) evaluate('sin', 30, 'degree')처럼
+      같은 방식으로 호출합니다.
+
+    메서드는 레지스트리를 만들 때 찾아 두므로, 그 뒤에 켠 계측(instrumentation)은 이 레지스트리에 반영되지 않습니다.
+    """
+
+    def __init__(self, precision: Optional[int] = None, legacy: bool = False):
+        """
+        클래스 초기화 함수.
+
+        Args:
+            precision (Optional[int]): 모든 연산 결과에 적용할 소수점 자릿수 (복소수 연산 제외).
+            legacy (bool): calculator_module의 계산기 계층을 사용할지 여부. 기본값은 False.
+        """
+        self.precision = precision
+        self.legacy = legacy
+        self._operations: Dict[str, Operation] = {}
+        if legacy:
+            calculators = {
+                'basic': calculator_module.Calculator(),
+                'engineering': calculator_module.EngineeringCalculator(),
+                'integer': EngineeringCalculator(),  # 정수 연산은 이전 계층에 없으므로 새 계층을 사용
+                'complex': ComplexCalculator(),
+            }
+            operations = {**OPERATIONS, **LEGACY_OPERATIONS}
+        else:
+            calculators = {
+                'basic': Calculator(),
+                'engineering': EngineeringCalculator(precision=precision),
+                'complex': ComplexCalculator(),
+            }
+            calculators['integer'] = calculators['engineering']
+            operations = OPERATIONS
+        for name, (kind, method_name) in operations.items():
+            method = getattr(calculators[kind], method_name)
+            func = method
+            # precision을 키워드 인자로 받는 메서드는 partial로 고정 (precision이 None이면 기본값과 같으므로 그대로 사용)
+            if precision is not None and (kind == 'basic' or (legacy and kind == 'engineering')):
+                func = functools.partial(method, precision=precision)
+            self._operations[name] = Operation(name, func, kind, signature_of=method)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._operations
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def names(self) -> List[str]:
+        """
+        등록된 연산 이름 목록을 반환하는 함수.
+        """
+        return list(self._operations)
+
+    def get(self, name: str) -> Operation:
+        """
+        연산 이름으로 Operation을 찾는 함수.
+
+        Raises:
+            ValueError: 등록되지 않은 연산인 경우 발생.
+        """
+        operation = self._operations.get(name)
+        if operation is None:
+            raise ValueError(f"Unknown operation: {name!r}")
+        return operation
+
+    def register(self, name: str, func: Callable, kind: str = 'custom') -> Operation:
+        """
+        연산을 추가하거나 같은 이름의 연산을 바꾸는 함수.
+
+        Args:
+            name (str): 연산 이름.
+            func (Callable): 위치 인자로 호출할 함수.
+            kind (str): 계산기 종류 이름. 기본값은 'custom'.
+
+        Returns:
+            Operation: 등록된 연산.
+        """
+        operation = self._operations[name] = Operation(name, func, kind)
+        return operation
+
+    def evaluate(self, op: str, *args: Any) -> Any:
+        """
+        연산 하나를 계산하는 함수 (예: evaluate('sin', 30, 'degree')).
+        인자 수 검사는 하지 않으므로 필요하면 get(op).check(args)를 먼저 호출하세요.
+
+        Returns:
+            Any: 계산기 메서드의 반환값 (0으로 나누기 등은 에러 메시지 문자열).
+
+        Raises:
+            ValueError: 등록되지 않은 연산인 경우 발생.
+        """
+        operation = self._operations.get(op)
+        if operation is None:
+            raise ValueError(f"Unknown operation: {op!r}")
+        return operation.func(*args)
+
+    def evaluate_many(self, ops: Union[str, Iterable[str]], args: Iterable[Sequence]) -> List[Any]:
+        """
+        여러 연산을 차례대로 계산하는 함수.
+
+        Args:
+            ops (Union[str, Iterable[str]]): 연산 이름 하나(모든 인자에 같은 연산 적용) 또는 args와 같은 길이의 연산 이름들.
+            args (Iterable[Sequence]): 각 연산의 위치 인자들 (예: [(1, 2), (3, 4)]).
+
+        Returns:
+            List[Any]: 입력 순서대로 계산된 결과들.
+
+        Raises:
+            ValueError: 등록되지 않은 연산이 있는 경우 발생.
+        """
+        if isinstance(ops, str):
+            func = self.get(ops).func
+            return [func(*call_args) for call_args in args]
+        lookup = self._operations.get
+        results = []
+        for op, call_args in zip(ops, args):
+            operation = lookup(op)
+            if operation is None:
+                raise ValueError(f"Unknown operation: {op!r}")
+            results.append(operation.func(*call_args))
+        return results
+
+
+# 기본 레지스트리 (precision 없음, basic/engineering/complex_cal 계산기)
+default_registry = OperationRegistry()
+evaluate = default_registry.evaluate
+evaluate_many = default_registry.evaluate_many
@@ -0,0 +1,298 @@
+# calculator/roots.py
+
+import sys
+from typing import Callable, Optional, Sequence
+
+from .utils import get_numpy, round_array
+
+# 원소별 수렴 상태 (RootFinder 메서드가 반환하는 status 배열의 값)
+CONVERGED = 0  # 허용 오차 안으로 수렴
+MAX_ITERATIONS = 1  # 최대 반복 횟수까지 수렴하지 않음 (roots에는 마지막 근삿값)
+FAILED = 2  # 계산할 수 없음: 도함수(또는 할선 기울기)가 0, 함수 값이 nan/inf, 구간 양 끝의 부호가 같음 (roots는 nan)
+
+STATUS_NAMES = {CONVERGED: 'converged', MAX_ITERATIONS: 'max_iterations', FAILED: 'failed'}
+
+
+class RootFinder:
+    """
+    서로 독립인 방정식 f(x) = 0 여러 개(수천~수백만 개)를 배열 연산으로 한 번에 푸는 클래스 (NumPy 필요).
+
+    f는 x 배열과 원소별 매개변수 배열(args)을 받아 같은 길이의 배열을 반환하는 함수입니다.
+    EngineeringCalculator의 *_array 메서드, LazyCalculator 식(expr.evaluate), NumPy 함수로 만들 수 있습니다.
+    예: lambda x, c: calc.log_array(x) + x - c  (원소마다 c가 다른 방정식)
+    f 안의 계산기는 precision=None이어야 합니다 (함수 값을 반올림하면 수렴 판정이 부정확해짐).
+
+    반복마다 아직 수렴하지 않은 원소만 모아 f를 호출하며, 수렴하거나 실패한 원소는 결과에 기록하고 제외합니다.
+    따라서 빨리 수렴하는 원소가 많을수록 뒤 반복의 배열이 작아집니다.
+
+    모든 메서드는 (roots, status, iterations)를 반환합니다. roots는 근, status는 원소별 수렴 상태
+    (CONVERGED, MAX_ITERATIONS, FAILED), iterations는 원소별 반복 횟수이며, 입력(x0와 args)을 broadcast한 모양입니다.
+    """
+
+    def __init__(self, xtol: float = 2e-12, rtol: float = 4 * sys.float_info.epsilon, ftol: float = 0.0,
+                 maxiter: int = 100, precision: Optional[int] = None):
+        """
+        클래스 초기화 함수. 원소는 |x 변화량| <= xtol + rtol·|x| 이거나 |f(x)| <= ftol이면 수렴한 것으로 봅니다.
+
+        Args:
+            xtol (float): x의 절대 허용 오차.
+            rtol (float): x의 상대 허용 오차.
+            ftol (float): 함수 값의 허용 오차 (기본값 0은 f(x)가 정확히 0인 경우만).
+            maxiter (int): 원소별 최대 반복 횟수.
+            precision (Optional[int]): roots의 소수점 자릿수 (None이면 반올림하지 않음). 마지막에 한 번만 적용됩니다.
+
+        Raises:
+            ValueError: 허용 오차가 음수이거나 maxiter가 1보다 작을 경우 발생.
+        """
+        if xtol < 0 or rtol < 0 or ftol < 0:
+            raise ValueError("Tolerances must be non-negative.")
+        if not isinstance(maxiter, int) or maxiter < 1:
+            raise ValueError("maxiter must be a positive integer.")
+        self.xtol = xtol
+        self.rtol = rtol
+        self.ftol = ftol
+        self.maxiter = maxiter
+        self.precision = precision
+
+    # ---- 공통 처리 ----
+
+    @staticmethod
+    def _prepare(starts: Sequence, args: Sequence):
+        """
+        시작값과 매개변수를 broadcast하여 1차원 배열로 펼치는 내부 함수.
+
+        Returns:
+            (모양, 시작값 배열 목록, 매개변수 배열 목록, 결과 배열 (roots, status, iterations))
+        """
+        np = get_numpy()
+        arrays = np.broadcast_arrays(*[np.asarray(start, dtype=float) for start in starts],
+                                     *[np.asarray(arg) for arg in args])
+        shape = arrays[0].shape
+        flat = [array.ravel() for array in arrays]
+        size = flat[0].size
+        results = (np.full(size, np.nan), np.full(size, MAX_ITERATIONS, dtype=np.int8), np.zeros(size, dtype=np.int64))
+        # 시작값은 복사하므로 반복 중에 갱신해도 입력 배열에 영향을 주지 않음
+        return shape, [np.array(array, dtype=float) for array in flat[:len(starts)]], flat[len(starts):], results
+
+    def _finish(self, shape, results):
+        """
+        결과 배열을 입력 모양으로 되돌리고 precision을 적용하는 내부 함수.
+        """
+        roots, status, iterations = (array.reshape(shape) for array in results)
+        return round_array(roots, self.precision), status, iterations
+
+    @staticmethod
+    def _retire(done, failed, root, index, results, iteration: int, state: list):
+        """
+        이번 반복에서 끝난 원소(done: 수렴, failed: 실패)의 결과를 기록하고, 남은 원소만 state에 남기는 내부 함수.
+
+        Returns:
+            남은 원소의 결과 위치 배열.
+        """
+        roots, status, iterations = results
+        finished = done | failed
+        if not finished.any():
+            return index
+        positions = index[finished]
+        roots[positions] = get_numpy().where(failed[finished], float('nan'), root[finished])
+        status[positions] = get_numpy().where(failed[finished], FAILED, CONVERGED)
+        iterations[positions] = iteration
+        keep = ~finished
+        state[:] = [array[keep] for array in state]
+        return index[keep]
+
+    def _small(self, np, fx):
+        return np.abs(fx) <= self.ftol
+
+    # ---- 도함수/할선 방식 ----
+
+    def newton(self, f: Callable, x0, fprime: Optional[Callable] = None, args: Sequence = ()):
+        """
+        Newton 방식으로 근을 찾는 함수: x ← x - f(x) / f'(x).
+
+        Args:
+            f (Callable): f(x, *args) -> 배열.
+            x0: 원소별 시작값 (숫자 또는 배열).
+            fprime (Optional[Callable]): 도함수 fprime(x, *args) -> 배열. None이면 전진 차분으로 근사합니다
+                                         (반복마다 f를 두 번 호출).
+            args (Sequence): f와 fprime에 전달할 원소별 매개변수 (숫자 또는 배열, x0와 broadcast).
+
+        Returns:
+            (roots, status, iterations)
+        """
+        np = get_numpy()
+        shape, (x,), params, results = self._prepare((x0,), args)
+        index = np.arange(x.size)
+        state = [x, *params]
+        with np.errstate(all='ignore'):
+            for iteration in range(1, self.maxiter + 1):
+                x, *params = state
+                fx = np.asarray(f(x, *params), dtype=float)
+                if fprime is None:
+                    h = np.sqrt(sys.float_info.epsilon) * np.maximum(np.abs(x), 1.0)
+                    slope = (np.asarray(f(x + h, *params), dtype=float) - fx) / h
+                else:
+                    slope = np.asarray(fprime(x, *params), dtype=float)
+                small = self._small(np, fx)
+                step = fx / slope
+                x_new = np.where(small, x, x - step)
+                finite = np.isfinite(x_new)
+                done = small | (finite & (np.abs(step) <= self.xtol + self.rtol * np.abs(x_new)))
+                failed = ~done & ~finite
+                state[0] = x_new
+                index = self._retire(done, failed, x_new, index, results, iteration, state)
+                if not index.size:
+                    break
+        results[0][index] = state[0]
+        results[2][index] = self.maxiter
+        return self._finish(shape, results)
+
+    def secant(self, f: Callable, x0, x1=None, args: Sequence = ()):
+        """
+        할선(secant) 방식으로 근을 찾는 함수. 도함수 대신 최근 두 점의 기울기를 사용하며 반복마다 f를 한 번 호출합니다.
+
+        Args:
+            f (Callable): f(x, *args) -> 배열.
+            x0: 원소별 첫 번째 시작값.
+            x1: 원소별 두 번째 시작값. None이면 x0에서 조금 떨어진 점(x0·(1 + 1e-4) ± 1e-4)을 사용합니다.
+            args (Sequence): f에 전달할 원소별 매개변수.
+
+        Returns:
+            (roots, status, iterations)
+        """
+        np = get_numpy()
+        if x1 is None:
+            x0 = np.asarray(x0, dtype=float)
+            x1 = x0 * (1 + 1e-4) + np.where(x0 >= 0, 1e-4, -1e-4)
+        shape, (previous, x), params, results = self._prepare((x0, x1), args)
+        index = np.arange(x.size)
+        f_previous = np.asarray(f(previous, *params), dtype=float)
+        state = [previous, f_previous, x, *params]
+        with np.errstate(all='ignore'):
+            for iteration in range(1, self.maxiter + 1):
+                previous, f_previous, x, *params = state
+                fx = np.asarray(f(x, *params), dtype=float)
+                small = self._small(np, fx)
+                step = fx * (x - previous) / (fx - f_previous)
+                x_new = np.where(small, x, x - step)
+                finite = np.isfinite(x_new)
+                done = small | (finite & (np.abs(step) <= self.xtol + self.rtol * np.abs(x_new)))
+                failed = ~done & ~finite
+                state[:3] = [x, fx, x_new]
+                index = self._retire(done, failed, x_new, index, results, iteration, state)
+                if not index.size:
+                    break
+        results[0][index] = state[2]
+        results[2][index] = self.maxiter
+        return self._finish(shape, results)
+
+    # ---- 구간 방식 ----
+    # a와 b에서 f의 부호가 달라야 하며 (f(a)·f(b) <= 0), 그렇지 않은 원소는 FAILED입니다.
+    # 구간 안에 근이 있으면 항상 수렴합니다.
+
+    def _bracket(self, np, f, a, b, args):
+        """
+        구간 양 끝의 함수 값을 계산하고, 끝점이 근이거나 부호가 같은 원소를 미리 처리하는 내부 함수.
+        """
+        shape, (a, b), params, results = self._prepare((a, b), args)
+        fa = np.asarray(f(a, *params), dtype=float)
+        fb = np.asarray(f(b, *params), dtype=float)
+        index = np.arange(a.size)
+        state = [a, b, fa, fb, *params]
+        at_a, at_b = self._small(np, fa), self._small(np, fb)
+        failed = ~(at_a | at_b) & ~(np.sign(fa) * np.sign(fb) < 0)
+        index = self._retire(at_a | at_b, failed, np.where(at_a, a, b), index, results, 0, state)
+        return shape, index, state, results
+
+    def bisect(self, f: Callable, a, b, args: Sequence = ()):
+        """
+        이분법으로 근을 찾는 함수. 반복마다 구간이 절반이 되므로 느리지만 항상 수렴합니다.
+
+        Args:
+            f (Callable): f(x, *args) -> 배열.
+            a: 원소별 구간 시작.
+            b: 원소별 구간 끝.
+            args (Sequence): f에 전달할 원소별 매개변수.
+
+        Returns:
+            (roots, status, iterations)
+        """
+        np = get_numpy()
+        shape, index, state, results = self._bracket(np, f, a, b, args)
+        with np.errstate(all='ignore'):
+            for iteration in range(1, self.maxiter + 1):
+                if not index.size:
+                    break
+                a, b, fa, fb, *params = state
+                middle = (a + b) / 2
+                fm = np.asarray(f(middle, *params), dtype=float)
+                left = np.sign(fm) == np.sign(fa)  # 근이 [middle, b]에 있음
+                state[:4] = [np.where(left, middle, a), np.where(left, b, middle),
+                             np.where(left, fm, fa), np.where(left, fb, fm)]
+                done = self._small(np, fm) | (np.abs(b - a) / 2 <= self.xtol + self.rtol * np.abs(middle))
+                failed = ~done & ~np.isfinite(fm)
+                index = self._retire(done, failed, middle, index, results, iteration, state)
+        results[0][index] = (state[0] + state[1]) / 2
+        results[2][index] = self.maxiter
+        return self._finish(shape, results)
+
+    def brent(self, f: Callable, a, b, args: Sequence = ()):
+        """
+        Brent 방식으로 근을 찾는 함수. 역2차 보간/할선 단계가 구간을 충분히 줄이지 못하면 이분법 단계를 사용하므로
+        이분법처럼 항상 수렴하면서 보통 훨씬 적은 반복으로 수렴합니다 (반복마다 f를 한 번 호출).
+
+        Args:
+            f (Callable): f(x, *args) -> 배열.
+            a: 원소별 구간 시작.
+            b: 원소별 구간 끝.
+            args (Sequence): f에 전달할 원소별 매개변수.
+
+        Returns:
+            (roots, status, iterations)
+        """
+        np = get_numpy()
+        shape, index, state, results = self._bracket(np, f, a, b, args)
+        # 원소별 상태: 이전 점(pre), 현재 점(cur), 근을 포함하는 반대쪽 끝(blk)과 함수 값, 이전/현재 단계 크기
+        pre, cur, fpre, fcur, *params = state
+        zeros = np.zeros_like(cur)
+        state = [pre, cur, cur.copy(), fpre, fcur, fcur.copy(), zeros, zeros.copy(), *params]
+        with np.errstate(all='ignore'):
+            for iteration in range(1, self.maxiter + 1):
+                if not index.size:
+                    break
+                pre, cur, blk, fpre, fcur, fblk, spre, scur, *params = state
+                # 근을 포함하는 반대쪽 끝 갱신
+                opposite = np.sign(fpre) * np.sign(fcur) < 0
+                blk, fblk = np.where(opposite, pre, blk), np.where(opposite, fpre, fblk)
+                spre = scur = np.where(opposite, cur - pre, scur)
+                # 함수 값이 더 작은 끝을 현재 점으로
+                swap = np.abs(fblk) < np.abs(fcur)
+                pre, fpre = np.where(swap, cur, pre), np.where(swap, fcur, fpre)
+                cur, fcur, blk, fblk = (np.where(swap, blk, cur), np.where(swap, fblk, fcur),
+                                        np.where(swap, cur, blk), np.where(swap, fcur, fblk))
+                delta = (self.xtol + self.rtol * np.abs(cur)) / 2
+                sbis = (blk - cur) / 2
+                done = self._small(np, fcur) | (np.abs(sbis) < delta)
+                failed = ~done & ~np.isfinite(fcur)
+                state[:] = [pre, cur, blk, fpre, fcur, fblk, spre, scur, *params]
+                index = self._retire(done, failed, cur, index, results, iteration, state)
+                if not index.size:
+                    break
+                pre, cur, blk, fpre, fcur, fblk, spre, scur, *params = state
+                delta = (self.xtol + self.rtol * np.abs(cur)) / 2
+                sbis = (blk - cur) / 2
+                # 보간 단계: 두 점이면 할선, 세 점이면 역2차 보간
+                dpre = (fpre - fcur) / (pre - cur)
+                dblk = (fblk - fcur) / (blk - cur)
+                stry = np.where(pre == blk, -fcur * (cur - pre) / (fcur - fpre),
+                                -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre)))
+                interpolate = (np.abs(spre) > delta) & (np.abs(fcur) < np.abs(fpre))
+                accept = interpolate & (2 * np.abs(stry) < np.minimum(np.abs(spre), 3 * np.abs(sbis) - delta))
+                spre, scur = np.where(accept, scur, sbis), np.where(accept, stry, sbis)
+                pre, fpre = cur, fcur
+                cur = cur + np.where(np.abs(scur) > delta, scur, np.where(sbis > 0, delta, -delta))
+                fcur = np.asarray(f(cur, *params), dtype=float)
+                state[:] = [pre, cur, blk, fpre, fcur, fblk, spre, scur, *params]
+        results[0][index] = state[1]
+        results[2][index] = self.maxiter
+        return self._finish(shape, results)
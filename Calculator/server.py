@@ -0,0 +1,304 @@
+# calculator/server.py
+
+import argparse
+import asyncio
+import json
+from collections import defaultdict
+from typing import Any, List, Optional, Tuple
+
+from .cli import OPERATIONS, BulkEvaluator, encode_result, parse_value
+from .utils import get_numpy
+
+# 배열(batch) 경로로 모아서 계산할 수 있는 연산. 응답이 묶음 여부(동시 요청 수)에 따라 달라지지 않도록,
+# float 입력에서 배열 경로가 스칼라 메서드와 비트 단위로 같은 결과를 내는 연산(사칙연산과 IEEE 754가 정확한 반올림을
+# 보장하는 제곱근)만 포함합니다. log, power, 삼각함수는 NumPy와 math 모듈의 구현이 마지막 자리에서 다를 수 있어 제외합니다.
+VECTORIZED_OPERATIONS = frozenset({'add', 'subtract', 'multiply', 'divide', 'square_root', 'sqrt'})
+
+# 한 그룹의 요청이 이 수 이상일 때만 배열 경로를 사용 (작은 그룹은 스칼라 경로가 더 빠름)
+MIN_VECTOR_SIZE = 8
+
+
+# 요청 인자로 허용하는 타입 (문자열은 'degree' 같은 단위 이름)
+_ARGUMENT_TYPES = (int, float, complex, str)
+
+
+class MicroBatcher:
+    """
+    여러 연결에서 동시에 들어온 요청을 작은 묶음(micro-batch)으로 모아 계산하는 클래스.
+
+    첫 요청이 들어온 뒤 최대 max_latency초 동안 최대 max_batch_size개의 요청을 모은 다음,
+    (연산, precision, 인자 수)가 같고 인자가 모두 float인 VECTORIZED_OPERATIONS 요청들을 묶어 *_array 메서드로
+    한 번에 계산합니다. 정수 인자(정확한 int 결과와 int64 overflow 방지)와 그 밖의 연산은 스칼라 경로로 계산하므로,
+    응답은 묶음 여부와 관계없이 스칼라 메서드의 결과와 같습니다.
+    배열 경로 결과가 유한하지 않은 원소(0으로 나누기, 정의역 밖 등)는 스칼라 경로로 다시 계산하여
+    스칼라 메서드와 같은 결과나 에러 메시지를 돌려줍니다.
+    대기 큐의 크기는 max_pending으로 제한되며, 큐가 가득 차면 submit이 기다리므로 소켓 읽기가 멈춥니다(backpressure).
+    """
+
+    def __init__(self, max_batch_size: int = 1024, max_latency: float = 0.001, max_pending: int = 65536):
+        """
+        클래스 초기화 함수.
+
+        Args:
+            max_batch_size (int): 한 묶음의 최대 요청 수. 기본값은 1024.
+            max_latency (float): 첫 요청 이후 묶음을 모으는 최대 대기 시간(초). 기본값은 0.001.
+            max_pending (int): 계산을 기다리는 요청의 최대 수. 기본값은 65536.
+        """
+        if max_batch_size < 1 or max_pending < 1 or max_latency < 0:
+            raise ValueError("max_batch_size and max_pending must be positive and max_latency non-negative.")
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.evaluator = BulkEvaluator()
+        self.batches = 0  # 처리한 묶음 수
+        self.requests = 0  # 처리한 요청 수
+        self._queue = asyncio.Queue(max_pending)
+
+    async def submit(self, op: str, args: list, precision: Optional[int]) -> asyncio.Future:
+        """
+        요청 하나를 대기 큐에 넣고, 결과 (성공 여부, 결과 또는 에러 메시지)가 설정될 Future를 반환하는 함수.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((op, args, precision, future))
+        return future
+
+    async def run(self) -> None:
+        """
+        대기 큐에서 묶음을 모아 계산하는 루프. 서버가 종료될 때까지 실행됩니다.
+        """
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            self._drain(batch)
+            if len(batch) < self.max_batch_size and self.max_latency > 0:
+                await asyncio.sleep(self.max_latency)  # 동시에 들어오는 요청을 더 모음
+                self._drain(batch)
+            try:
+                self.dispatch(batch)
+            except Exception as exc:  # 한 요청의 예외로 루프가 끝나면 이후 모든 요청이 응답을 받지 못함
+                for item in batch:
+                    if not item[3].done():
+                        item[3].set_result((False, f"{type(exc).__name__}: {exc}"))
+
+    def _drain(self, batch: list) -> None:
+        queue = self._queue
+        while len(batch) < self.max_batch_size and not queue.empty():
+            batch.append(queue.get_nowait())
+
+    def dispatch(self, batch: List[Tuple[str, list, Optional[int], asyncio.Future]]) -> None:
+        """
+        요청 묶음을 그룹으로 나누어 계산하고 각 Future에 결과를 설정하는 함수.
+        """
+        self.batches += 1
+        self.requests += len(batch)
+        groups = defaultdict(list)
+        scalar = []
+        for item in batch:
+            op, args = item[0], item[1]
+            if op in VECTORIZED_OPERATIONS and args and all(type(arg) is float for arg in args):
+                groups[(op, item[2], len(args))].append(item)
+            else:
+                scalar.append(item)
+        for (op, precision, count), items in groups.items():
+            if len(items) < MIN_VECTOR_SIZE:
+                scalar.extend(items)
+                continue
+            try:
+                self._evaluate_vector(op, precision, count, items)
+            except (ArithmeticError, ValueError, TypeError):
+                scalar.extend(items)  # 배열 경로에서 처리할 수 없는 묶음은 스칼라 경로로 계산
+        for item in scalar:
+            self._evaluate_scalar(item)
+
+    def _evaluate_scalar(self, item) -> None:
+        op, args, precision, future = item
+        if future.done():
+            return
+        try:
+            future.set_result((True, self.evaluator.evaluate(op, args, precision)))
+        except (ArithmeticError, ValueError, TypeError) as exc:
+            future.set_result((False, f"{type(exc).__name__}: {exc}"))
+
+    def _evaluate_vector(self, op: str, precision: Optional[int], count: int, items: list) -> None:
+        np = get_numpy()
+        arrays = [np.array([item[1][position] for item in items], dtype=float) for position in range(count)]
+        with np.errstate(all='ignore'):
+            results = np.asarray(self.evaluator.evaluate_array(op, arrays, precision), dtype=float)
+        if op == 'add':
+            results += 0.0  # sum()은 정수 0부터 더하므로 -0.0 대신 0.0을 반환함
+        finite = np.isfinite(results).tolist()
+        for index, (item, value) in enumerate(zip(items, results.tolist())):
+            if not finite[index]:
+                self._evaluate_scalar(item)  # 0으로 나누기 등은 스칼라 경로의 결과/에러 메시지를 사용
+            elif not item[3].done():
+                item[3].set_result((True, value))
+
+
+def _parse_request(line: bytes) -> Tuple[Any, Optional[str], list, Optional[int], Optional[str]]:
+    """
+    요청 한 줄을 (id, 연산, 인자, precision, 에러 메시지)로 해석하는 함수.
+    문자열 인자는 숫자(복소수 포함)로 바꿀 수 있으면 바꿉니다. 요청이 잘못되었으면 에러 메시지가 설정되며,
+    JSON 객체로 읽을 수 있는 경우에는 id를 유지합니다.
+    """
+    try:
+        request = json.loads(line)
+    except ValueError as exc:
+        return None, None, [], None, f"Invalid request: {exc}"
+    if not isinstance(request, dict):
+        return None, None, [], None, "Invalid request: expected a JSON object."
+    request_id = request.get('id')
+    if not isinstance(request.get('op'), str) or not isinstance(request.get('args', []), list):
+        return request_id, None, [], None, "Invalid request: 'op' must be a string and 'args' must be a list."
+    precision = request.get('precision')
+    if precision is not None and type(precision) is not int:
+        return request_id, None, [], None, "Invalid request: 'precision' must be an integer or null."
+    args = [parse_value(arg) if isinstance(arg, str) else arg for arg in request.get('args', [])]
+    if any(type(arg) not in _ARGUMENT_TYPES for arg in args):
+        return request_id, None, [], None, "Invalid request: arguments must be numbers or strings."
+    return request_id, request['op'], args, precision, None
+
+
+class CalculatorServer:
+    """
+    줄 단위 JSON 프로토콜로 계산 요청을 받는 asyncio 서버 클래스 (TCP 또는 Unix 소켓).
+
+    요청: {"id": 1, "op": "sin", "args": [30, "degree"], "precision": 3}
+    응답: {"id": 1, "result": 0.5} 또는 {"id": 1, "error": "..."}
+
+    한 연결에서 응답을 기다리지 않고 여러 요청을 연달아 보낼 수 있으며(pipelining), 응답은 요청 순서대로 돌아옵니다.
+    모든 연결의 요청은 MicroBatcher에서 묶음으로 계산됩니다. 연결마다 응답을 기다리는 요청 수는
+    max_in_flight로 제한되어, 응답을 읽지 않는 클라이언트는 요청 읽기가 멈춥니다(backpressure).
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765, path: Optional[str] = None,
+                 max_batch_size: int = 1024, max_latency: float = 0.001, max_pending: int = 65536,
+                 max_in_flight: int = 4096):
+        """
+        클래스 초기화 함수.
+
+        Args:
+            host (str): TCP 주소. 기본값은 '127.0.0.1'.
+            port (int): TCP 포트 (0이면 사용 가능한 포트를 자동 선택). 기본값은 8765.
+            path (Optional[str]): 지정하면 TCP 대신 이 경로의 Unix 소켓을 사용.
+            max_batch_size (int): 한 묶음의 최대 요청 수.
+            max_latency (float): 묶음을 모으는 최대 대기 시간(초).
+            max_pending (int): 계산을 기다리는 전체 요청의 최대 수.
+            max_in_flight (int): 연결마다 응답을 기다리는 요청의 최대 수.
+        """
+        self.host, self.port, self.path = host, port, path
+        self.max_in_flight = max_in_flight
+        self._batcher_options = (max_batch_size, max_latency, max_pending)
+        self.batcher = None
+        self._server = None
+        self._batcher_task = None
+
+    async def start(self) -> None:
+        """
+        서버를 시작하는 함수. port=0으로 시작하면 실제 포트가 self.port에 저장됩니다.
+        """
+        self.batcher = MicroBatcher(*self._batcher_options)
+        self._batcher_task = asyncio.create_task(self.batcher.run())
+        if self.path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path=self.path)
+        else:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port)
+            self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """
+        서버와 묶음 계산 루프를 종료하는 함수.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._batcher_task is not None:
+            self._batcher_task.cancel()
+            try:
+                await self._batcher_task
+            except asyncio.CancelledError:
+                pass
+
+    async def __aenter__(self) -> 'CalculatorServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        in_flight = asyncio.Queue(self.max_in_flight)
+        responder = asyncio.create_task(self._respond(in_flight, writer))
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                request_id, op, args, precision, error = _parse_request(line)
+                if error is not None:
+                    future = loop.create_future()
+                    future.set_result((False, error))
+                else:
+                    future = await self.batcher.submit(op, args, precision)
+                await in_flight.put((request_id, future))
+        finally:
+            await in_flight.put(None)
+            await responder
+            writer.close()
+
+    async def _respond(self, in_flight: asyncio.Queue, writer: asyncio.StreamWriter) -> None:
+        """
+        요청 순서대로 결과를 기다려 응답을 쓰는 함수. 기다리는 요청이 없을 때만 drain하여 쓰기를 모아서 보냅니다.
+        """
+        while True:
+            item = await in_flight.get()
+            if item is None:
+                break
+            request_id, future = item
+            ok, value = await future
+            try:
+                line = json.dumps({'id': request_id, 'result': encode_result(value)} if ok else
+                                  {'id': request_id, 'error': value})
+            except (ValueError, TypeError) as exc:  # 쓸 수 없는 결과(4300자리를 넘는 정수 등)는 에러 응답
+                line = json.dumps({'id': request_id, 'error': f"{type(exc).__name__}: {exc}"})
+            writer.write(line.encode() + b'\n')
+            if in_flight.empty():
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    break
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    명령행 진입점. 예: python -m calculator.server --port 8765 또는 --unix /tmp/calculator.sock
+    """
+    parser = argparse.ArgumentParser(prog='calculator.server', description="Line-delimited JSON calculator server.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', default=None, help="serve on this Unix socket path instead of TCP")
+    parser.add_argument('--max-batch-size', type=int, default=1024)
+    parser.add_argument('--max-latency', type=float, default=0.001, help="seconds to wait while filling a batch")
+    parser.add_argument('--max-pending', type=int, default=65536)
+    parser.add_argument('--max-in-flight', type=int, default=4096, help="unanswered requests per connection")
+    args = parser.parse_args(argv)
+    server = CalculatorServer(args.host, args.port, args.unix, args.max_batch_size, args.max_latency,
+                              args.max_pending, args.max_in_flight)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
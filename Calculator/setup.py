@@ -31,5 +31,11 @@ setup(
     
     install_requires=[
         # 'math'와 'cmath'는 내장 모듈로 install_requires에 명시할 필요가 없습니다.
-    ]
+    ],
+
+    # 선택적으로 설치할 수 있는 의존 패키지를 명시합니다.
+    # 배열(batch) 연산을 사용하려면 pip install .[numpy] 로 설치합니다.
+    extras_require={
+        'numpy': ['numpy'],
+    }
 )
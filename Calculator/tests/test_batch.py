@@ -0,0 +1,105 @@
+import pytest
+from calculator import Calculator, EngineeringCalculator
+
+np = pytest.importorskip("numpy")  # 배열 연산은 NumPy가 설치된 경우에만 테스트
+
+# 배열 덧셈/뺄셈 원소별 연산 테스트
+def test_add_subtract_array_elementwise():
+    """
+    테스트 설명:
+    - 여러 배열을 원소별로 더하고 빼는 결과가 스칼라 메서드와 같은지 확인합니다.
+    - 정수 입력은 정수 dtype을 유지하는지 확인합니다.
+    """
+    calc = Calculator()
+    a, b, c = [1, 2, 3], [4, 5, 6], [7, 8, 9]
+    added = calc.add_array(a, b, c)
+    assert added.tolist() == [calc.add(x, y, z) for x, y, z in zip(a, b, c)]
+    assert added.dtype.kind == 'i'  # 가능한 경우 int 유지
+    assert calc.subtract_array(c, b, a).tolist() == [calc.subtract(z, y, x) for x, y, z in zip(a, b, c)]
+
+# 배열 곱셈/나눗셈 행별(axis) 연산과 precision 테스트
+def test_multiply_divide_array_rowwise_with_precision():
+    """
+    테스트 설명:
+    - axis=1로 행별 곱셈/나눗셈을 수행합니다.
+    - precision이 round_result와 같은 방식으로 적용되는지 확인합니다.
+    """
+    calc = Calculator()
+    rows = [[100, 2, 5], [1, 3, 7]]
+    assert calc.multiply_array(rows, axis=1).tolist() == [1000, 21]
+    divided = calc.divide_array(rows, axis=1, precision=3)
+    assert divided.tolist() == [calc.divide(*row, precision=3) for row in rows]
+
+# 배열 나눗셈 0 나누기 테스트
+def test_divide_array_by_zero():
+    """
+    테스트 설명:
+    - 0으로 나누는 원소는 예외 없이 inf/nan이 되는지 확인합니다.
+    """
+    calc = Calculator()
+    result = calc.divide_array([1.0, 0.0, 4.0], [0.0, 0.0, 2.0])
+    assert np.isinf(result[0]) and np.isnan(result[1]) and result[2] == 2.0
+
+# 배열 나눗셈 에러 mask와 fill 값 테스트
+def test_divide_array_mask_and_fill():
+    """
+    테스트 설명:
+    - return_mask=True이면 0으로 나눈 위치가 boolean 배열로 함께 반환되는지 확인합니다 (연속 나눗셈, axis 나눗셈 포함).
+    - fill 값이 0으로 나눈 원소에만 들어가고, 나머지 원소는 스칼라 divide 결과와 같은지 확인합니다.
+    """
+    calc = Calculator()
+    a, b, c = [6.0, 1.0, 8.0, 0.0], [3.0, 0.0, 2.0, 5.0], [2.0, 4.0, 0.0, 1.0]
+    result, mask = calc.divide_array(a, b, c, fill=0.0, return_mask=True)
+    assert mask.tolist() == [isinstance(calc.divide(x, y, z), str) for x, y, z in zip(a, b, c)]
+    assert result.tolist() == [1.0, 0.0, 0.0, 0.0] and result.dtype == np.float64
+    rows = [[100, 2, 5], [1, 0, 7], [0, 3, 0]]
+    result, mask = calc.divide_array(rows, axis=1, precision=1, return_mask=True)
+    assert mask.tolist() == [False, True, True] and result[0] == 10.0 and not np.isfinite(result[1:]).any()
+    assert np.isnan(calc.divide_array([[1.0], [2.0]], [1.0, 0.0], fill=np.nan)[:, 1]).all()  # broadcast
+
+# 공학용 계산기 배열 삼각함수 테스트
+def test_engineering_trig_array_degree():
+    """
+    테스트 설명:
+    - degree 단위 배열의 sin/cos/tan 결과가 스칼라 메서드와 같은지 확인합니다.
+    - 인스턴스의 precision 설정이 배열 결과에도 적용되는지 확인합니다.
+    """
+    eng_calc = EngineeringCalculator(precision=6)
+    angles = [0, 30, 45, 60, 90.5]
+    for name in ('sin', 'cos', 'tan'):
+        scalar = getattr(eng_calc, name)
+        batch = getattr(eng_calc, name + '_array')
+        assert batch(angles, unit='degree').tolist() == [scalar(a, unit='degree') for a in angles]
+
+# 공학용 계산기 배열 로그/거듭제곱/제곱근 테스트
+def test_engineering_log_power_sqrt_array():
+    """
+    테스트 설명:
+    - log/power/square_root 배열 버전이 스칼라 메서드와 같은 값을 반환하는지 확인합니다.
+    - return_float=True일 때 결과가 float 배열인지 확인합니다.
+    """
+    eng_calc = EngineeringCalculator(precision=8, return_float=True)
+    values = [1, 2, 10, 100, 1000]
+    assert eng_calc.log_array(values).tolist() == [eng_calc.log(v) for v in values]
+    assert eng_calc.log_array(values, base=3).tolist() == pytest.approx([eng_calc.log(v, 3) for v in values])
+    assert eng_calc.power_array(values, 2).tolist() == [eng_calc.power(v, 2) for v in values]
+    assert eng_calc.square_root_array(values).tolist() == [eng_calc.square_root(v) for v in values]
+    assert eng_calc.square_root_array([16]).dtype == float
+
+# 배열 반올림과 스칼라 반올림 일치 테스트
+def test_round_array_matches_scalar_round():
+    """
+    테스트 설명:
+    - 십진수로 절반(예: 4.4555)인 값에서 round_array가 round_result(Python round)와 같은 결과를 내는지 확인합니다.
+    - *_array 메서드의 precision 결과가 스칼라 메서드 결과와 같은지 확인합니다 (배열끼리가 아니라 스칼라와 비교).
+    """
+    from calculator.utils import round_array, round_result
+    halves = [(k + 0.5) / 10 ** precision for precision in (1, 2, 3) for k in range(-3000, 3000, 7)]
+    for precision in (1, 2, 3):
+        assert round_array(np.array(halves), precision).tolist() == [round_result(x, precision) for x in halves]
+    assert round_array(4.4555, 3) == round_result(4.4555, 3) == 4.455
+    assert round_array(np.array([4.4555 + 4.4555j]), 3).tolist() == [4.455 + 4.455j]
+    assert round_array(np.array([1e308, np.inf]), 2).tolist() == [1e308, np.inf]
+    calc = Calculator()
+    values = [4.4555, 1.0005, 2.675, 0.125]
+    assert calc.add_array(values, [0.0] * 4, precision=3).tolist() == [calc.add(v, 0.0, precision=3) for v in values]
@@ -0,0 +1,109 @@
+import pytest
+from calculator import ComplexCalculator, EngineeringCalculator
+
+# 결과 캐시 적중/실패 테스트
+def test_result_cache_hits_and_misses():
+    """
+    테스트 설명:
+    - enable_cache 후 같은 인자로 호출하면 캐시에서 같은 결과를 반환하는지 확인합니다.
+    - unit이 다르면 다른 키로 취급되는지 확인합니다.
+    """
+    eng_calc = EngineeringCalculator()
+    assert eng_calc.cache_info() is None  # 기본값은 캐시 꺼짐
+    eng_calc.enable_cache(maxsize=8)
+    first = eng_calc.sin(30, unit='degree')
+    assert eng_calc.sin(30, unit='degree') == first
+    assert eng_calc.sin(30) != first  # 라디안 단위는 다른 결과
+    info = eng_calc.cache_info()
+    assert (info['hits'], info['misses'], info['size']) == (1, 2, 2)
+
+# precision 변경 시 캐시 무효화 테스트
+def test_result_cache_respects_precision():
+    """
+    테스트 설명:
+    - precision을 바꾼 뒤에는 이전 precision으로 계산된 결과가 반환되지 않는지 확인합니다.
+    """
+    eng_calc = EngineeringCalculator(precision=2)
+    eng_calc.enable_cache()
+    assert eng_calc.log(7) == 0.85
+    eng_calc.precision = 4
+    assert eng_calc.log(7) == 0.8451
+
+# 값이 같고 타입이 다른 인자의 캐시 키 테스트
+def test_result_cache_keys_include_argument_types():
+    """
+    테스트 설명:
+    - 2와 2.0처럼 값은 같지만 타입이 다른 인자는 다른 캐시 키가 되어, 캐시를 켜도 결과가 캐시 없이 호출한 것과 같은지 확인합니다.
+    """
+    eng_calc = EngineeringCalculator()
+    eng_calc.enable_cache(maxsize=128)
+    assert eng_calc.power(10, 400) == 10 ** 400 and isinstance(eng_calc.power(10, 400), int)
+    with pytest.raises(OverflowError):
+        eng_calc.power(10.0, 400)  # 정수 결과가 캐시되어 있어도 float 밑은 float 경로로 계산
+    assert eng_calc.square_root(10 ** 400) == 10 ** 200
+    assert eng_calc.cache_info()['size'] == 2  # power(10, 400), square_root(10 ** 400)
+    eng_calc.enable_cache(maxsize=128)
+    assert eng_calc.power(2.0, 3) == 8.0 and eng_calc.power(2, 3) == 8.0
+    assert eng_calc.cache_info()['misses'] == 2  # 타입이 다른 인자는 적중하지 않음
+
+# 복소수 계산기 결과 캐시의 인자 타입 구분 테스트
+def test_complex_cache_keys_include_argument_types():
+    """
+    테스트 설명:
+    - 1, 1.0, 1+0j처럼 값이 같은 인자도 캐시를 켜지 않은 경우와 같은 타입의 결과를 반환하는지 확인합니다.
+    """
+    plain, cached = ComplexCalculator(), ComplexCalculator()
+    cached.enable_cache(maxsize=128)
+    for args in ((1, 2), (1.0, 2.0), (1 + 0j, 2), (1, 2 + 0j)):
+        result = cached.divide(*args)
+        assert result == plain.divide(*args) and type(result) is type(plain.divide(*args))
+    assert cached.cache_info()['misses'] == 4
+
+# LRU 제거와 명시적 무효화 테스트
+def test_result_cache_eviction_and_clear():
+    """
+    테스트 설명:
+    - 최대 크기를 넘으면 가장 오래된 결과가 제거되고 evictions가 증가하는지 확인합니다.
+    - clear_cache로 특정 메서드 또는 전체 결과를 무효화할 수 있는지 확인합니다.
+    - disable_cache 후에는 클래스 메서드를 그대로 사용하는지 확인합니다.
+    """
+    eng_calc = EngineeringCalculator()
+    eng_calc.enable_cache(maxsize=2)
+    eng_calc.power(2, 10)
+    eng_calc.power(3, 10)
+    eng_calc.log(100)
+    assert eng_calc.cache_info()['evictions'] == 1
+    assert eng_calc.clear_cache('log') == 1
+    assert eng_calc.clear_cache() == 1
+    eng_calc.disable_cache()
+    assert 'power' not in vars(eng_calc) and eng_calc.power(2, 10) == 1024.0
+
+# 여러 스레드에서 LRU 캐시 사용 테스트
+def test_lru_cache_thread_safe():
+    """
+    테스트 설명:
+    - 여러 스레드가 같은 캐시에 get/put을 동시에 호출해도 예외 없이 통계가 정확하고 최대 크기가 지켜지는지 확인합니다.
+    """
+    import threading
+    from calculator.cache import LRUCache, MISSING
+
+    cache = LRUCache(maxsize=16)
+    errors = []
+
+    def worker(offset):
+        try:
+            for i in range(5000):
+                key = (offset + i) % 40
+                if cache.get(key) is MISSING:
+                    cache.put(key, key)
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    info = cache.info()
+    assert not errors and info['hits'] + info['misses'] == 40000 and info['size'] <= 16
+    assert cache.invalidate(lambda key: cache.get(key) is not MISSING) == info['size']
@@ -0,0 +1,62 @@
+import io
+import json
+import sys
+from calculator.cli import run, main
+
+# CSV 입력 대량 계산 테스트
+def test_cli_run_csv():
+    """
+    테스트 설명:
+    - CSV 행(op,arg1,...,precision)을 계산하여 (줄 번호, 결과)로 출력하는지 확인합니다.
+    - 0으로 나누기, 알 수 없는 연산 등 실패한 행은 실행을 멈추지 않고 에러 출력으로 보내는지 확인합니다.
+    - 작은 chunk_size로도 모든 행이 순서대로 처리되는지 확인합니다.
+    """
+    source = io.StringIO("add,1,2,3,\ndivide,1,0,\n# comment\ndivide,100,3,2\nsin,30,degree,3\nfoo,1,\nmagnitude,3+4j,\n")
+    output, errors = io.StringIO(), io.StringIO()
+    stats = run(source, output, errors, 'csv', chunk_size=2)
+    assert output.getvalue().splitlines() == ['1,6', '4,33.33', '5,0.5', '7,5.0']
+    assert [line.split(',')[0] for line in errors.getvalue().splitlines()] == ['2', '6']
+    assert (stats['rows'], stats['errors']) == (6, 2)
+
+# JSONL 입력과 파일 입출력 테스트
+def test_cli_main_jsonl(tmp_path):
+    """
+    테스트 설명:
+    - JSONL 파일을 읽어 JSONL 결과 파일과 에러 파일을 쓰는지 확인합니다.
+    """
+    source = tmp_path / 'ops.jsonl'
+    source.write_text('{"op": "power", "args": [2, 10]}\n{"op": "to_polar", "args": [1]}\nnot json\n')
+    result_path, error_path = tmp_path / 'out.jsonl', tmp_path / 'err.jsonl'
+    assert main([str(source), '-o', str(result_path), '-e', str(error_path), '-q']) == 0
+    results = [json.loads(line) for line in result_path.read_text().splitlines()]
+    assert results == [{'line': 1, 'result': 1024.0}, {'line': 2, 'result': [1.0, 0.0]}]
+    assert json.loads(error_path.read_text())['line'] == 3
+
+# nan/inf 결과의 JSON 출력 테스트
+def test_cli_jsonl_non_finite_results():
+    """
+    테스트 설명:
+    - nan/inf 결과를 표준 JSON이 아닌 NaN/Infinity 대신 문자열로 쓰는지 확인합니다.
+    """
+    def reject(constant):
+        raise ValueError(f"non-standard JSON constant: {constant}")
+
+    source = io.StringIO("add,inf,1,\nsubtract,inf,inf,\nmultiply,-1e308,10,\nadd,1.5,1,\n")
+    output, errors = io.StringIO(), io.StringIO()
+    run(source, output, errors, 'csv', output_format='jsonl')
+    results = [json.loads(line, parse_constant=reject)['result'] for line in output.getvalue().splitlines()]
+    assert results == ['inf', 'nan', '-inf', 2.5]
+
+# 출력할 수 없는 큰 정수 결과 테스트
+def test_cli_oversized_result_is_row_error():
+    """
+    테스트 설명:
+    - 문자열 변환 제한(4300자리)을 넘는 정수 결과나 너무 큰 power 결과는 그 행만 에러가 되고 나머지 행은 계속 출력되는지 확인합니다.
+    """
+    limited = hasattr(sys, 'get_int_max_str_digits')  # Python 3.11부터 정수 문자열 변환 자릿수 제한이 있음
+    for output_format in ('csv', 'jsonl'):
+        source = io.StringIO("power,10,5000,\nadd,1,2,\n" + ("int_power,10,5000,\n" if limited else ""))
+        output, errors = io.StringIO(), io.StringIO()
+        stats = run(source, output, errors, 'csv', output_format=output_format)
+        assert stats['errors'] == stats['rows'] - 1
+        assert output.getvalue().splitlines() == (['2,3'] if output_format == 'csv' else ['{"line": 2, "result": 3}'])
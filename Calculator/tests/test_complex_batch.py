@@ -0,0 +1,40 @@
+import cmath
+import pytest
+from calculator import ComplexCalculator
+
+np = pytest.importorskip("numpy")  # 배열 연산은 NumPy가 설치된 경우에만 테스트
+
+# 복소수 배열 사칙연산 테스트
+def test_complex_arithmetic_array():
+    """
+    테스트 설명:
+    - 복소수 배열의 덧셈/뺄셈/곱셈/나눗셈 결과가 스칼라 메서드와 같은지 확인합니다.
+    - 실수부/허수부 배열로 만든 complex_array를 입력으로 사용할 수 있는지 확인합니다.
+    """
+    complex_calc = ComplexCalculator()
+    a = complex_calc.complex_array([1, 3, -2], [2, 4, 0.5])
+    b = [complex(3, 4), complex(1, -1), complex(0, 2)]
+    for name in ('add', 'subtract', 'multiply', 'divide'):
+        scalar = getattr(complex_calc, name)
+        batch = getattr(complex_calc, name + '_array')
+        assert batch(a, b).tolist() == pytest.approx([scalar(x, y) for x, y in zip(a.tolist(), b)])
+    assert not np.isfinite(complex_calc.divide_array([1 + 1j], [0])).any()  # 0으로 나누면 예외 대신 inf/nan
+    result, mask = complex_calc.divide_array([2j, 1 + 1j], [2, 0], fill=0j, return_mask=True)
+    assert result.tolist() == [1j, 0j] and mask.tolist() == [False, True]
+
+# 복소수 배열 극좌표/직교좌표 변환 테스트
+def test_complex_polar_array_round_trip():
+    """
+    테스트 설명:
+    - to_polar_array 결과가 cmath.polar와 같은지 확인합니다.
+    - to_rectangular_array로 다시 변환하면 원래 값이 복원되는지 확인합니다.
+    """
+    complex_calc = ComplexCalculator()
+    values = [complex(3, 4), complex(-1, 1), complex(0, -2)]
+    r, theta = complex_calc.to_polar_array(values)
+    assert list(zip(r.tolist(), theta.tolist())) == pytest.approx([cmath.polar(v) for v in values])
+    r2, theta2 = complex_calc.from_parts_to_polar([3, -1, 0], [4, 1, -2])
+    assert r2.tolist() == pytest.approx(r.tolist()) and theta2.tolist() == pytest.approx(theta.tolist())
+    assert complex_calc.to_rectangular_array(r, theta).tolist() == pytest.approx(values)
+    assert complex_calc.magnitude_array(values).tolist() == pytest.approx([5.0, 2 ** 0.5, 2.0])
+    assert complex_calc.argument_array(values).tolist() == pytest.approx(theta.tolist())
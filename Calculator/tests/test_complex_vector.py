@@ -0,0 +1,64 @@
+import cmath
+import math
+import sys
+import pytest
+from calculator import ComplexCalculator, ComplexVector
+
+# 복소수 벡터 원소별 연산 테스트
+def test_complex_vector_matches_scalar():
+    """
+    테스트 설명:
+    - ComplexVector의 원소별 사칙연산, 절대값, 편각, 극좌표 변환 결과가 ComplexCalculator 스칼라 메서드와 같은지 확인합니다.
+    - 복소수 하나와의 연산(연산자 포함)과 0으로 나눈 원소가 nan이 되는지 확인합니다.
+    """
+    complex_calc = ComplexCalculator()
+    a_values = [complex(1, 2), complex(-3, 0.5), complex(0, -1), complex(1e200, 1e200)]
+    b_values = [complex(3, 4), complex(1, -1), complex(0, 2), complex(1e200, -1e200)]
+    a, b = ComplexVector.from_complex(a_values), ComplexVector.from_complex(b_values)
+    for name in ('add', 'subtract', 'divide'):
+        scalar = getattr(complex_calc, name)
+        assert getattr(a, name)(b).tolist() == [scalar(x, y) for x, y in zip(a_values, b_values)]
+    assert a[:3].multiply(b[:3]).tolist() == pytest.approx([x * y for x, y in zip(a_values[:3], b_values[:3])])
+    assert (a * 2j).tolist() == [x * 2j for x in a_values]
+    assert (1 + a - b).tolist() == [1 + x - y for x, y in zip(a_values, b_values)]
+    assert list(a.magnitude()) == [complex_calc.magnitude(x) for x in a_values]
+    assert list(a.argument()) == [complex_calc.argument(x) for x in a_values]
+    r, theta = a.to_polar()
+    assert ComplexVector.from_polar(r, theta).tolist() == pytest.approx([cmath.rect(*cmath.polar(x)) for x in a_values])
+    quotient = (a / ComplexVector([1, 0, 2, 0]))
+    assert quotient[0] == a_values[0] and quotient[2] == a_values[2] / 2 and math.isnan(quotient[1].real)
+    with pytest.raises(ValueError):
+        a + b[:2]
+
+# 복소수 벡터 메모리 및 버퍼 테스트
+def test_complex_vector_storage():
+    """
+    테스트 설명:
+    - 실수부/허수부 저장 공간이 원소당 16바이트인지, memoryview로 복사 없이 내보내지는지 확인합니다.
+    """
+    vector = ComplexVector(range(10_000), range(10_000))
+    payload = sys.getsizeof(vector.real) + sys.getsizeof(vector.imag)
+    assert payload < 16 * len(vector) + 256
+    real, imag = vector.buffers()
+    assert real.format == 'd' and real.nbytes == 8 * len(vector)
+    vector.real[5] = -1.0
+    assert real[5] == -1.0  # 같은 메모리를 가리킴
+    assert vector[5] == complex(-1, 5) and ComplexVector([1, 2]) == ComplexVector([1, 2], [0, 0])
+
+# 복소수 벡터 반사 연산자 테스트
+def test_complex_vector_reflected_operators():
+    """
+    테스트 설명:
+    - 숫자가 왼쪽에 있는 뺄셈(1 - v)과 나눗셈(2 / v)이 원소별 스칼라 연산과 같은 결과인지 확인합니다.
+    - 0인 원소로 나누면 divide와 같이 nan이 되고, 지원하지 않는 타입은 TypeError가 발생하는지 확인합니다.
+    """
+    values = [complex(1, 2), complex(-3, 0.5), complex(0, -1), 4.0]
+    vector = ComplexVector.from_complex(values)
+    assert (1 - vector).tolist() == [1 - x for x in values]
+    assert (2j - vector).tolist() == [2j - x for x in values]
+    assert (2 / vector).tolist() == [2 / x for x in values]
+    assert ((1 + 1j) / vector).tolist() == [(1 + 1j) / x for x in values]
+    quotient = 1 / ComplexVector([2, 0])
+    assert quotient[0] == 0.5 and math.isnan(quotient[1].real)
+    with pytest.raises(TypeError):
+        'a' - vector
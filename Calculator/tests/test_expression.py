@@ -0,0 +1,95 @@
+import math
+import pytest
+from calculator import ExpressionEngine, EngineeringCalculator
+
+# 수식 스칼라 평가 테스트
+def test_expression_scalar_evaluation():
+    """
+    테스트 설명:
+    - 수식 문자열의 결과가 EngineeringCalculator 메서드를 직접 호출한 결과와 같은지 확인합니다.
+    - 연산자 우선순위, 단항 음수, 거듭제곱의 오른쪽 결합을 확인합니다.
+    """
+    engine = ExpressionEngine()
+    eng_calc = EngineeringCalculator()
+    expected = eng_calc.sin(30, unit='degree') * eng_calc.log(100) + eng_calc.square_root(16)
+    assert engine.evaluate("sin(x, degree) * log(y) + sqrt(z)", x=30, y=100, z=16) == pytest.approx(expected)
+    assert engine.evaluate("1 + 2 * 3 - -4") == 11
+    assert engine.evaluate("2 ^ 3 ^ 2") == 2 ** 9
+    assert engine.evaluate("abs(3 + 4j) + ln(e)") == pytest.approx(6.0)
+
+# 수식 오류 처리 테스트
+def test_expression_errors():
+    """
+    테스트 설명:
+    - 잘못된 문법, 알 수 없는 함수, 누락된 변수, 0으로 나누기가 예외로 처리되는지 확인합니다.
+    """
+    engine = ExpressionEngine()
+    with pytest.raises(ValueError):
+        engine.compile("1 + (2")
+    with pytest.raises(ValueError):
+        engine.compile("foo(1)")
+    with pytest.raises(NameError):
+        engine.evaluate("x + 1")
+    with pytest.raises(ZeroDivisionError):
+        engine.evaluate("1 / (x - x)", x=3)
+
+# 컴파일 캐시 테스트
+def test_expression_cache():
+    """
+    테스트 설명:
+    - 같은 수식을 다시 컴파일하면 캐시에서 같은 객체를 반환하는지 확인합니다.
+    - 캐시 크기를 넘으면 가장 오래된 수식이 제거되는지 확인합니다.
+    """
+    engine = ExpressionEngine(cache_size=2)
+    first = engine.compile("x + 1")
+    assert engine.compile("x + 1") is first
+    engine.compile("x + 2")
+    engine.compile("x + 3")
+    assert engine.compile("x + 1") is not first
+    assert engine.cache_info()['hits'] == 1 and engine.cache_info()['size'] == 2
+
+# 수식 배열(batch) 평가 테스트
+def test_expression_batch_evaluation():
+    """
+    테스트 설명:
+    - 열 단위/행 단위 변수 묶음에 대한 배열 평가 결과가 스칼라 평가와 같은지 확인합니다.
+    """
+    pytest.importorskip("numpy")
+    engine = ExpressionEngine(EngineeringCalculator(precision=6))
+    compiled = engine.compile("sin(x, degree) * log(y) + sqrt(z)")
+    xs, ys, zs = [0, 30, 90], [10, 100, 1000], [1, 4, 9]
+    expected = [compiled(x=x, y=y, z=z) for x, y, z in zip(xs, ys, zs)]
+    assert compiled.evaluate_batch({'x': xs, 'y': ys, 'z': zs}).tolist() == pytest.approx(expected)
+    rows = [{'x': x, 'y': y, 'z': z} for x, y, z in zip(xs, ys, zs)]
+    assert compiled.evaluate_batch(rows).tolist() == pytest.approx(expected)
+
+# 수식 배열 평가의 0으로 나누기와 누락된 변수 테스트
+def test_expression_batch_errors_match_scalar():
+    """
+    테스트 설명:
+    - 0으로 나누는 원소가 있으면 배열 평가도 스칼라 평가처럼 ZeroDivisionError가 발생하는지 확인합니다.
+    - 행 단위 변수 묶음에 값이 없는 변수는 변수 이름을 담은 ValueError가 발생하는지 확인합니다.
+    - sqrt/log/ln의 정의역 밖 인자는 배열 평가에서도 ValueError가 발생하고, 상수 수식은 묶음 크기로 맞춰지는지 확인합니다.
+    """
+    pytest.importorskip("numpy")
+    compiled = ExpressionEngine().compile("x / y")
+    with pytest.raises(ZeroDivisionError):
+        compiled(x=1, y=0)
+    with pytest.raises(ZeroDivisionError):
+        compiled.evaluate_batch({'x': [1, 2], 'y': [2, 0]})
+    assert compiled.evaluate_batch({'x': [1, 3], 'y': [2, 4]}).tolist() == [0.5, 0.75]
+    with pytest.raises(ValueError, match="'y'.*row 1"):
+        compiled.evaluate_batch([{'x': 1, 'y': 2}, {'x': 3}])
+
+    # sqrt/log/ln의 정의역 밖 인자도 스칼라 평가와 같이 ValueError
+    engine = ExpressionEngine()
+    for source, value in (("sqrt(x)", -1), ("log(x)", 0), ("log(x, 2)", -4), ("ln(x)", -1)):
+        with pytest.raises(ValueError):
+            engine.evaluate(source, x=value)
+        with pytest.raises(ValueError):
+            engine.evaluate_batch(source, {'x': [4, value]})
+    assert engine.evaluate_batch("sqrt(x) + log(x)", {'x': [1, 100]}).tolist() == [1.0, 12.0]
+
+    # 변수를 쓰지 않는 수식도 묶음 크기의 배열을 반환
+    assert engine.evaluate_batch("2 * pi", {'x': [1, 2, 3]}).tolist() == [2 * math.pi] * 3
+    assert engine.evaluate_batch("sqrt(16) + 1", [{}, {}]).tolist() == [5.0, 5.0]
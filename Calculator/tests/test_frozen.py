@@ -0,0 +1,84 @@
+import math
+import pytest
+from calculator import Calculator, EngineeringCalculator, FrozenCalculator
+
+# 설정 고정 계산기 테스트
+@pytest.mark.parametrize("precision", [None, 0, 3])
+@pytest.mark.parametrize("unit", ['radian', 'degree'])
+def test_frozen_matches_generic(precision, unit):
+    """
+    테스트 설명:
+    - freeze로 만든 계산기의 결과가 같은 설정의 EngineeringCalculator, Calculator 결과와 같은지 확인합니다.
+    - degree 삼각함수 표를 켠 경우에도 같은 결과를 반환하는지 확인합니다.
+    """
+    values = [0, 0.5, 1, 2, 30, 30.1, 45, 90, 123.456, 180, 270, 720.5, -15]
+    for use_table in (False, True):
+        calc = EngineeringCalculator(precision=precision)
+        if use_table:
+            calc.enable_trig_table()
+        frozen = calc.freeze(unit)
+        for x in values:
+            for name in ('sin', 'cos', 'tan'):
+                assert getattr(frozen, name)(x) == getattr(calc, name)(x, unit=unit)
+            if x > 0:
+                assert frozen.square_root(x) == calc.square_root(x)
+                assert frozen.log(x) == calc.log(x) and frozen.log(x, 2) == calc.log(x, 2)
+                assert frozen.power(x, 1.5) == calc.power(x, 1.5)
+    basic = Calculator()
+    frozen = FrozenCalculator(precision)
+    for name in ('add', 'subtract', 'multiply', 'divide'):
+        assert getattr(frozen, name)(7, 2.5, 3) == getattr(basic, name)(7, 2.5, 3, precision=precision)
+    assert frozen.divide(1, 0) == basic.divide(1, 0)
+
+# 변경 불가능 및 설정 검사 테스트
+def test_frozen_is_immutable():
+    """
+    테스트 설명:
+    - 생성 후 속성을 바꿀 수 없고, __slots__로 인스턴스 딕셔너리가 없는지 확인합니다.
+    - 잘못된 설정은 예외가 발생하는지 확인합니다.
+    """
+    frozen = FrozenCalculator(precision=2, return_float=True)
+    with pytest.raises(AttributeError):
+        frozen.precision = 3
+    with pytest.raises(AttributeError):
+        frozen.sin = math.cos
+    assert not hasattr(frozen, '__dict__')
+    assert FrozenCalculator().sin is math.sin
+    with pytest.raises(ValueError):
+        FrozenCalculator(unit='grad')
+    with pytest.raises(TypeError):
+        FrozenCalculator(precision=1.5)
+
+# 사칙연산 결과 타입 일치 테스트
+@pytest.mark.parametrize("return_float", [False, True])
+@pytest.mark.parametrize("precision", [None, 2])
+def test_frozen_arithmetic_types_match_generic(precision, return_float):
+    """
+    테스트 설명:
+    - 정수/실수 인자 조합과 return_float 설정에 관계없이 사칙연산 결과의 값과 타입이 Calculator 메서드와 같은지 확인합니다.
+    """
+    calc = EngineeringCalculator(precision=precision, return_float=return_float)
+    frozen = calc.freeze()
+    for nums in ((7, 2), (7, 2.5), (7.5, 2), (1.25, 0.5, 3), (6, 3), (1, 0), (0.1, 0.2)):
+        for name in ('add', 'subtract', 'multiply', 'divide'):
+            expected = getattr(calc, name)(*nums, precision=precision)
+            result = getattr(frozen, name)(*nums)
+            assert result == expected and type(result) is type(expected)
+
+# 거듭제곱 modulus 인자 테스트
+@pytest.mark.parametrize("precision", [None, 2])
+def test_frozen_power_modulus(precision):
+    """
+    테스트 설명:
+    - FrozenCalculator.power가 EngineeringCalculator.power와 같이 modulus 인자를 받고, 같은 결과와 예외를 내는지 확인합니다.
+    """
+    calc = EngineeringCalculator(precision=precision)
+    frozen = calc.freeze()
+    for x, y, modulus in ((2, 10, 1000), (7, 10 ** 6, 1_000_000_007), (3, -1, 7), (1.5, 2, None)):
+        assert frozen.power(x, y, modulus) == calc.power(x, y, modulus)
+        assert frozen.power(x, y, modulus=modulus) == calc.power(x, y, modulus=modulus)
+    for args, error in (((2.0, 3, 5), TypeError), ((2, 3, 0), ValueError), ((2, -1, 4), ValueError)):
+        with pytest.raises(error):
+            calc.power(*args)
+        with pytest.raises(error):
+            frozen.power(*args)
@@ -0,0 +1,38 @@
+import pytest
+from calculator import Calculator, EngineeringCalculator, ComplexCalculator
+from calculator import instrumentation
+
+# 메서드별 호출/에러 계측 테스트
+def test_instrumentation_counts_and_restores():
+    """
+    테스트 설명:
+    - 계측을 켜도 결과가 바뀌지 않고, 호출 수와 에러 수(0으로 나누기, 예외)가 메서드별로 기록되는지 확인합니다.
+    - 계측을 끄면 클래스의 원래 메서드로 되돌아가는지 확인합니다.
+    """
+    original_add = Calculator.__dict__['add']
+    recorder = instrumentation.enable()
+    try:
+        calc, eng, comp = Calculator(), EngineeringCalculator(precision=3), ComplexCalculator()
+        assert calc.add(1, 2, 3) == 6
+        assert isinstance(calc.divide(10, 0), str)
+        assert calc.divide(10, 2) == 5
+        assert eng.sin(30, unit='degree') == 0.5
+        assert eng.add(1, 1) == 2  # 상속받은 메서드는 정의한 클래스 이름으로 집계
+        assert comp.magnitude(3 + 4j) == 5.0
+        with pytest.raises(ValueError):
+            eng.square_root(-1)
+        snapshot = instrumentation.snapshot()
+    finally:
+        instrumentation.disable()
+
+    assert Calculator.__dict__['add'] is original_add
+    assert not instrumentation.is_enabled() and instrumentation.snapshot() == {}
+    assert snapshot['Calculator.add']['calls'] == 2
+    assert snapshot['Calculator.divide']['calls'] == 2 and snapshot['Calculator.divide']['errors'] == 1
+    assert snapshot['EngineeringCalculator.square_root']['errors'] == 1
+    assert snapshot['ComplexCalculator.magnitude']['buckets'][-1] == (float('inf'), 1)
+
+    text = recorder.to_prometheus()
+    assert 'calculator_errors_total{method="Calculator.divide"} 1' in text
+    assert 'calculator_latency_seconds_bucket{method="Calculator.add",le="+Inf"} 2' in text
+    assert 'calculator_latency_seconds_count{method="Calculator.divide"} 2' in text
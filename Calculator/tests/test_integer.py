@@ -0,0 +1,65 @@
+import pytest
+from calculator import EngineeringCalculator, OperationRegistry
+from calculator import calculator_module
+
+# 정확한 정수 거듭제곱 테스트
+def test_int_power_exact_and_modular():
+    """
+    테스트 설명:
+    - int_power가 float 범위를 넘는 큰 정수도 정확히 계산하는지 확인합니다.
+    - modulus를 지정하면 (x ** y) % modulus를, 음수 지수이면 모듈러 역원을 계산하는지 확인합니다.
+    - 정수가 아닌 인자와 modulus 없는 음수 지수는 예외가 발생하는지 확인합니다.
+    """
+    calc = EngineeringCalculator(precision=2)
+    assert calc.int_power(3, 500) == 3 ** 500
+    assert calc.int_power(7, 10 ** 6, 1_000_000_007) == pow(7, 10 ** 6, 1_000_000_007)
+    assert calc.power(2, 10, 1000) == 24
+    assert calc.power(2, 0.5) == 1.41
+    assert calc.int_power(3, -1, 7) == 5  # 3 * 5 = 15 ≡ 1 (mod 7)
+    with pytest.raises(ValueError):
+        calc.int_power(2, -1)
+    with pytest.raises(TypeError):
+        calc.int_power(2.0, 3)
+    assert OperationRegistry(precision=2).evaluate('int_power', 2, 100) == 2 ** 100
+
+# 정확한 정수 제곱근 테스트
+def test_int_sqrt_and_perfect_square():
+    """
+    테스트 설명:
+    - int_sqrt가 큰 정수의 제곱근 내림값을 정확히 계산하고, exact=True이면 완전제곱수만 허용하는지 확인합니다.
+    - is_perfect_square 결과와, float 범위를 넘는 정수의 square_root가 overflow 없이 계산되는지 확인합니다.
+    """
+    calc = EngineeringCalculator()
+    big = (10 ** 50 + 3) ** 2
+    assert calc.int_sqrt(big) == 10 ** 50 + 3 and calc.int_sqrt(big + 1) == 10 ** 50 + 3
+    assert calc.int_sqrt(big, exact=True) == 10 ** 50 + 3
+    with pytest.raises(ValueError):
+        calc.int_sqrt(big + 1, exact=True)
+    assert [n for n in range(50) if calc.is_perfect_square(n)] == [0, 1, 4, 9, 16, 25, 36, 49]
+    assert calc.is_perfect_square(big) and not calc.is_perfect_square(big - 1) and not calc.is_perfect_square(-4)
+    assert calc.square_root(10 ** 400) == 10 ** 200 and calc.square_root(10 ** 400 + 1) == 1e200
+    assert calculator_module.EngineeringCalculator().square_root(10 ** 700) == 10 ** 350
+    frozen = calc.freeze()
+    assert frozen.square_root(10 ** 700) == 10 ** 350 and frozen.square_root(10 ** 400 + 1) == 1e200
+    with pytest.raises(OverflowError):
+        calc.square_root(10 ** 700 + 1)  # 제곱근도 float 범위를 넘음
+
+# 큰 정수 거듭제곱 테스트
+def test_power_bounded_exact_for_integers():
+    """
+    테스트 설명:
+    - power는 math.pow(float) 결과를 반환하고, float 범위를 넘는 정수 거듭제곱만 크기 제한 안에서 정확한 정수로 계산하는지 확인합니다.
+    - 제한(MAX_EXACT_POWER_BITS)을 넘는 결과는 긴 계산 없이 바로 OverflowError가 발생하고, FrozenCalculator도 같은 결과인지 확인합니다.
+    """
+    for calc in (EngineeringCalculator(), EngineeringCalculator(precision=2)):
+        frozen = calc.freeze()
+        for x, y in ((10 ** 400, 2), (10, 400), (3, 500), (2, 10), (-7, 3), (5, 0), (2, -1), (2, 0.5), (2.0, 3)):
+            assert frozen.power(x, y) == calc.power(x, y)
+            assert type(frozen.power(x, y)) is type(calc.power(x, y))
+        assert calc.power(10 ** 400, 2) == 10 ** 800 and calc.power(10, 400) == 10 ** 400
+        assert calc.power(2, 10) == 1024 and isinstance(calc.power(2, 10), float)
+        for x, y in ((10, 10 ** 7), (10, 5000), (10 ** 400, 30)):
+            with pytest.raises(OverflowError):
+                calc.power(x, y)
+            with pytest.raises(OverflowError):
+                frozen.power(x, y)
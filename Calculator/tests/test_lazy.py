@@ -0,0 +1,71 @@
+import math
+import pytest
+from calculator import EngineeringCalculator, LazyCalculator
+
+# 지연 계산 그래프 중복 제거 및 스칼라 평가 테스트
+def test_lazy_graph_dedup_and_scalar():
+    """
+    테스트 설명:
+    - 같은 부분식(sin(x, 'degree') 등)은 같은 노드로 만들어지고, degree 변환 노드를 sin/cos가 공유하는지 확인합니다.
+    - 스칼라 평가 결과가 EngineeringCalculator 결과와 같고, precision은 마지막에 한 번만 적용되는지 확인합니다.
+    """
+    lazy = EngineeringCalculator(precision=3).lazy()
+    x, y = lazy.var('x'), lazy.var('y')
+    s = lazy.sin(x, 'degree')
+    assert lazy.sin(x, 'degree') is s and lazy.var('x') is x
+    before = len(lazy)
+    c = lazy.cos(x, 'degree')
+    assert len(lazy) == before + 1  # 라디안 변환 노드는 공유
+    expr = s * s + c ** 2 + lazy.log(y) / 2 - 1
+    assert expr.variables == ('x', 'y')
+    assert expr.evaluate(x=30, y=100) == 1.0
+    calc = EngineeringCalculator()
+    exact = calc.sin(10, 'degree') * 3
+    assert (s * 3).evaluate(x=10) == round(exact, 3)  # 중간 반올림 없음
+    assert lazy.evaluate([s, c], {'x': 60}) == [round(math.sin(math.radians(60)), 3), 0.5]
+    assert (-(2 ** x)).evaluate(x=3) == -8.0 and lazy.add(1, x, 2).evaluate(x=3) == 6
+    with pytest.raises(ZeroDivisionError):
+        (1 / x).evaluate(x=0)
+    with pytest.raises(NameError):
+        expr.evaluate(x=1)
+    with pytest.raises(ValueError):
+        x + LazyCalculator().var('x')
+
+# 지연 계산 그래프 배열 평가 테스트
+def test_lazy_graph_batch():
+    """
+    테스트 설명:
+    - 배열 변수 값으로 평가한 결과가 *_array 메서드 결과와 같은지 확인합니다.
+    - 중간 배열을 재사용해도 변수 배열과 여러 결과가 서로 덮어써지지 않는지 확인합니다.
+    - 0으로 나누는 원소가 있으면 스칼라 평가와 같이 ZeroDivisionError가 발생하는지 확인합니다.
+    """
+    np = pytest.importorskip("numpy")
+    calc = EngineeringCalculator()
+    lazy = LazyCalculator(precision=6)
+    x = lazy.var('x')
+    s, c = lazy.sin(x, 'degree'), lazy.cos(x, 'degree')
+    angles = np.array([0.0, 30.0, 45.0, 90.0])
+    original = angles.copy()
+    total, ratio, shifted = lazy.evaluate([s * s + c * c, s / c, lazy.square_root(x + 1)], x=angles)
+    assert (angles == original).all()
+    np.testing.assert_allclose(total, np.ones(4))
+    np.testing.assert_allclose(ratio, np.round(calc.tan_array(angles, 'degree'), 6))
+    np.testing.assert_allclose(shifted, np.round(np.sqrt(angles + 1), 6))
+    with pytest.raises(ZeroDivisionError):
+        (1 / x).evaluate(x=[0.0, 1.0])  # 스칼라 평가와 같이 0으로 나누면 예외
+    assert (1 / x).evaluate(x=[4.0, 1.0]).tolist() == [0.25, 1.0]
+
+# 정수 거듭제곱 결과 일치 테스트
+def test_lazy_power_matches_engineering():
+    """
+    테스트 설명:
+    - 스칼라 평가의 거듭제곱이 EngineeringCalculator.power와 같은 값과 타입(float 범위를 넘는 정수는 정확한 int)인지 확인합니다.
+    """
+    calc = EngineeringCalculator()
+    lazy = LazyCalculator()
+    x, y = lazy.var('x'), lazy.var('y')
+    for base, exponent in ((2, 64), (10 ** 400, 2), (10, 400), (2.5, 3), (4, -1)):
+        result = (x ** y).evaluate(x=base, y=exponent)
+        assert result == calc.power(base, exponent) and type(result) is type(calc.power(base, exponent))
+    with pytest.raises(OverflowError):
+        (x ** y).evaluate(x=10, y=10 ** 7)
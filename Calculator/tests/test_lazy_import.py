@@ -0,0 +1,29 @@
+import subprocess
+import sys
+
+import pytest
+import calculator
+
+def _loaded_modules(statement):
+    code = f"import sys\n{statement}\nprint(' '.join(sorted(sys.modules)))"
+    output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout
+    return set(output.split())
+
+# 패키지 지연 로딩 테스트
+def test_lazy_submodule_loading():
+    """
+    테스트 설명:
+    - `from calculator import Calculator`가 basic 모듈만 가져오고 다른 계산기 모듈과 NumPy는 가져오지 않는지 확인합니다.
+    - 지연 로딩된 이름이 하위 모듈의 객체와 같고, 없는 이름은 AttributeError가 발생하는지 확인합니다.
+    """
+    modules = _loaded_modules("from calculator import Calculator")
+    assert 'calculator.basic' in modules
+    assert not modules & {'calculator.engineering', 'calculator.complex_cal', 'calculator.expression', 'numpy'}
+    modules = _loaded_modules("from calculator import EngineeringCalculator")
+    assert not modules & {'calculator.trig_table', 'calculator.cache', 'calculator.frozen', 'numpy'}
+
+    from calculator.engineering import EngineeringCalculator
+    assert calculator.EngineeringCalculator is EngineeringCalculator
+    assert set(calculator.__all__) <= set(dir(calculator))
+    with pytest.raises(AttributeError):
+        calculator.NoSuchCalculator
@@ -0,0 +1,48 @@
+import pytest
+from calculator import Calculator, EngineeringCalculator, ComplexCalculator
+from calculator.mmap_io import evaluate_file, main
+
+# 메모리 매핑 블록 단위 파일 계산 테스트
+def test_evaluate_file_blocks(tmp_path):
+    """
+    테스트 설명:
+    - 블록 크기로 나누어떨어지지 않는 길이의 파일을 블록 단위로 계산한 결과가 배열 메서드 결과와 같은지 확인합니다.
+    - 숫자 입력은 모든 원소에 같은 값으로 적용되는지 확인합니다.
+    """
+    np = pytest.importorskip("numpy")
+    angles = np.linspace(0, 720, 1001)
+    angles.tofile(tmp_path / 'angles.f64')
+    (angles + 1).tofile(tmp_path / 'divisors.f64')
+
+    count = evaluate_file('sin', [tmp_path / 'angles.f64'], tmp_path / 'sin.f64', block_size=64,
+                          precision=6, unit='degree')
+    assert count == 1001
+    expected = EngineeringCalculator(precision=6).sin_array(angles, unit='degree')
+    assert np.array_equal(np.fromfile(tmp_path / 'sin.f64'), expected)
+
+    evaluate_file('divide', [tmp_path / 'angles.f64', tmp_path / 'divisors.f64'], tmp_path / 'div.f64', block_size=100)
+    assert np.array_equal(np.fromfile(tmp_path / 'div.f64'), Calculator().divide_array(angles, angles + 1))
+
+    evaluate_file('power', [tmp_path / 'angles.f64', 2], tmp_path / 'sq.f64', block_size=100)
+    assert np.array_equal(np.fromfile(tmp_path / 'sq.f64'), EngineeringCalculator().power_array(angles, 2))
+
+# 복소수 파일 및 명령행 테스트
+def test_evaluate_file_complex_and_cli(tmp_path):
+    """
+    테스트 설명:
+    - complex128 파일의 크기(magnitude)가 float64 결과 파일로 쓰이는지 확인합니다.
+    - 파일 크기가 dtype 크기의 배수가 아니거나 원소 수가 다르면 ValueError가 발생하는지 확인합니다.
+    """
+    np = pytest.importorskip("numpy")
+    values = np.arange(10) + 1j * np.arange(10, 20)
+    values.tofile(tmp_path / 'values.c128')
+    assert main(['magnitude', str(tmp_path / 'values.c128'), '-o', str(tmp_path / 'abs.f64'),
+                 '--dtype', 'complex128', '--block-size', '3']) == 0
+    assert np.array_equal(np.fromfile(tmp_path / 'abs.f64'), ComplexCalculator().magnitude_array(values))
+
+    (tmp_path / 'odd.bin').write_bytes(b'\0' * 12)
+    with pytest.raises(ValueError):
+        evaluate_file('sqrt', [tmp_path / 'odd.bin'], tmp_path / 'out.f64')
+    np.zeros(3).tofile(tmp_path / 'short.f64')
+    with pytest.raises(ValueError):
+        evaluate_file('add', [tmp_path / 'abs.f64', tmp_path / 'short.f64'], tmp_path / 'out.f64')
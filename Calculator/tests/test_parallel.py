@@ -0,0 +1,34 @@
+import pytest
+from calculator import Calculator, EngineeringCalculator
+from calculator.parallel import ParallelEvaluator
+
+# 여러 프로세스 행 단위 계산 테스트
+def test_parallel_evaluate_rows_in_order():
+    """
+    테스트 설명:
+    - 여러 묶음으로 나누어 계산한 결과가 입력 순서대로 반환되는지 확인합니다.
+    - 실패한 행은 (False, 에러 메시지)로 반환되는지 확인합니다.
+    """
+    calc = Calculator()
+    rows = [('add', [i, i], None) for i in range(50)] + [('divide', [1, 0], None)]
+    with ParallelEvaluator(processes=2, chunk_size=7) as evaluator:
+        results = evaluator.evaluate(rows)
+    assert results[:50] == [(True, calc.add(i, i)) for i in range(50)]
+    assert results[50][0] is False
+
+# 공유 메모리 배열 계산 테스트
+def test_parallel_map_arrays_shared_memory():
+    """
+    테스트 설명:
+    - 공유 메모리로 나누어 계산한 배열 결과가 한 프로세스의 배열 메서드 결과와 같은지 확인합니다.
+    """
+    np = pytest.importorskip("numpy")
+    angles = np.linspace(0, 720, 1001)
+    with ParallelEvaluator(processes=2, chunk_size=100) as evaluator:
+        result = evaluator.map_arrays('sin', angles, precision=6, unit='degree')
+        divided = evaluator.map_arrays('divide', angles, angles + 1)
+    expected = EngineeringCalculator(precision=6).sin_array(angles, unit='degree')
+    assert np.array_equal(result, expected)
+    assert np.array_equal(divided, Calculator().divide_array(angles, angles + 1))
+    with pytest.raises(ValueError):
+        ParallelEvaluator(chunk_size=0)
@@ -0,0 +1,101 @@
+import multiprocessing
+
+import pytest
+from calculator import ComplexCalculator, EngineeringCalculator, PersistentCache
+from calculator.cache import MISSING
+
+
+def _worker(path, start):
+    # 다른 프로세스에서 같은 파일에 결과를 기록하고 읽음
+    calc = EngineeringCalculator()
+    calc.enable_cache(maxsize=10_000, path=path)
+    results = [calc.power(i % 50, 2) for i in range(start, start + 200)]
+    calc.disable_cache()
+    return results
+
+# 파일 결과 캐시 재시작 후 재사용 테스트
+def test_persistent_cache_survives_restart(tmp_path):
+    """
+    테스트 설명:
+    - 결과 캐시를 파일에 저장하면 새로 만든 계산기(다시 시작한 프로세스)가 결과를 미리 읽어 재사용하는지 확인합니다.
+    - precision이 다르면 다른 키로 취급되고, 계산기 클래스마다 namespace가 구분되는지 확인합니다.
+    - 파일에 저장할 수 없는 값은 프로세스 안에만 보관하고, 해시할 수 없는 키는 TypeError가 발생하는지 확인합니다.
+    """
+    path = tmp_path / 'results.sqlite'
+    calc = EngineeringCalculator(precision=3)
+    calc.enable_cache(path=path)
+    first = calc.log(7), calc.sin(30, unit='degree'), calc.power(2, 100)
+    assert calc.cache_info()['misses'] == 3
+    calc.disable_cache()
+
+    restarted = EngineeringCalculator(precision=3)
+    restarted.enable_cache(path=path)
+    assert restarted.cache_info()['preloaded'] == 3
+    assert (restarted.log(7), restarted.sin(30, unit='degree'), restarted.power(2, 100)) == first
+    restarted.precision = 5
+    assert restarted.log(7) == 0.84510
+    info = restarted.cache_info()
+    assert (info['hits'], info['misses'], info['size'], info['hit_rate']) == (3, 1, 4, 0.75)
+    restarted.disable_cache()
+
+    complex_calc = ComplexCalculator()
+    complex_calc.enable_cache(path=path)
+    assert complex_calc.cache_info()['preloaded'] == 0
+    assert complex_calc.to_polar(1j) == complex_calc.to_polar(1j) == (1.0, 1.5707963267948966)
+    assert complex_calc.divide(1, 0).startswith("Error")
+    assert complex_calc.cache_info()['hits'] == 1
+    complex_calc.disable_cache()
+
+    with PersistentCache(path, namespace='other') as cache:
+        cache.put(('value', 1), object())  # marshal로 저장할 수 없는 값
+        assert cache.get(('value', 1)) is not None
+        with pytest.raises(TypeError):
+            cache.get(('value', [1]))
+    with PersistentCache(path, namespace='other') as cache:
+        assert len(cache) == 6  # 파일 전체의 결과 수 (다른 namespace 포함)
+        assert cache.get(('value', 1)) is MISSING
+
+# 크기 제한 제거, 무효화, 여러 프로세스 동시 사용 테스트
+def test_persistent_cache_eviction_and_processes(tmp_path):
+    """
+    테스트 설명:
+    - 파일의 결과 수가 maxsize를 넘으면 가장 오래 사용되지 않은 결과부터 제거되는지 확인합니다.
+    - invalidate로 조건에 맞는 결과만 파일에서 삭제되는지 확인합니다.
+    - 여러 프로세스가 같은 파일을 동시에 읽고 써도 결과가 올바른지 확인합니다.
+    """
+    path = tmp_path / 'results.sqlite'
+    with PersistentCache(path, maxsize=10, write_batch=4) as cache:
+        for i in range(16):
+            cache.put(('square', i), i * i)
+        info = cache.info()
+        assert info['size'] == 10 and info['evictions'] == 6
+        assert cache.invalidate(lambda key: key[1] % 2 == 0) == 5
+        assert len(cache) == 5
+
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        pytest.skip("fork start method is not available")
+    with multiprocessing.get_context('fork').Pool(4) as pool:
+        results = pool.starmap(_worker, [(str(path), start) for start in range(0, 800, 200)])
+    assert all(values == [float((i % 50) ** 2) for i in range(start, start + 200)]
+               for values, start in zip(results, range(0, 800, 200)))
+    with PersistentCache(path, namespace='EngineeringCalculator') as cache:
+        assert cache.preload() == 50
+
+# 파일 결과 캐시의 인자 타입 구분 테스트
+def test_persistent_cache_distinguishes_argument_types(tmp_path):
+    """
+    테스트 설명:
+    - 파일 결과 캐시에서도 2와 2.0처럼 타입이 다른 인자는 다른 결과로 저장되어, 프로세스 안의 캐시와 다시 시작한 뒤 모두
+      캐시 없이 호출한 결과와 같은 타입을 반환하는지 확인합니다.
+    """
+    path = tmp_path / 'results.sqlite'
+    plain = EngineeringCalculator()
+    for _ in range(2):  # 두 번째는 다시 시작한 계산기 (미리 읽은 결과 사용)
+        calc = EngineeringCalculator()
+        calc.enable_cache(maxsize=128, path=path)
+        assert calc.power(10, 400) == 10 ** 400
+        with pytest.raises(OverflowError):
+            calc.power(10.0, 400)
+        for x in (16, 16.0, 10 ** 400):
+            assert type(calc.square_root(x)) is type(plain.square_root(x))
+        calc.disable_cache()
@@ -0,0 +1,52 @@
+import pytest
+from calculator import EngineeringCalculator, Polynomial
+
+# 다항식 스칼라 계산 테스트
+def test_polynomial_scalar():
+    """
+    테스트 설명:
+    - 정수 계수와 정수 입력은 정확한 정수로, 복소수 계수/입력은 복소수로 계산되는지 확인합니다.
+    - precision이 중간 계산이 아닌 마지막 결과에만 적용되는지 확인합니다 (복소수는 실수부/허수부 각각).
+    """
+    p = Polynomial([2, 0, -1])  # 2x² - 1
+    assert p.degree == 2
+    assert p(3) == 17 and isinstance(p(3), int)
+    assert Polynomial([1] * 40)(10) == int('1' * 40)
+    assert p(1j) == -3 + 0j
+    assert Polynomial([1j, 1])(2) == 1 + 2j
+    assert Polynomial([1 / 3, 1 / 3, 1 / 3])(1, precision=2) == 1.0
+    assert Polynomial([1 / 3, 1])(1j, precision=3) == complex(1, 0.333)
+    assert EngineeringCalculator(precision=1).polynomial([0.25, 0.25], 1) == 0.5
+    with pytest.raises(ValueError):
+        Polynomial([])
+    with pytest.raises(ValueError):
+        p(1, method='newton')
+
+# 다항식 배열 계산 테스트
+@pytest.mark.parametrize("method", ['auto', 'horner', 'estrin'])
+@pytest.mark.parametrize("degree", [0, 1, 5, 40])
+def test_polynomial_array(method, degree):
+    """
+    테스트 설명:
+    - Horner/Estrin 방식의 배열 결과가 numpy.polyval과 같은지 실수와 복소수 계수 모두 확인합니다.
+    - 입력 모양이 유지되는지, 작은 블록으로 나누어 계산해도 결과가 같은지 확인합니다.
+    """
+    np = pytest.importorskip("numpy")
+    import calculator.polynomial as polynomial
+
+    rng = np.random.default_rng(degree)
+    x = rng.uniform(-1.2, 1.2, (3, 50))
+    for coefficients in (rng.standard_normal(degree + 1),
+                         rng.standard_normal(degree + 1) + 1j * rng.standard_normal(degree + 1)):
+        expected = np.polyval(coefficients, x)
+        result = Polynomial(coefficients)(x, method=method)
+        assert result.shape == x.shape
+        np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(Polynomial(coefficients)(x, precision=3, method=method), np.round(result, 3))
+    block = polynomial.ESTRIN_BLOCK_ELEMENTS
+    polynomial.ESTRIN_BLOCK_ELEMENTS = 7
+    try:
+        np.testing.assert_allclose(Polynomial(coefficients)(x, method=method), np.polyval(coefficients, x),
+                                   rtol=1e-9, atol=1e-12)
+    finally:
+        polynomial.ESTRIN_BLOCK_ELEMENTS = block
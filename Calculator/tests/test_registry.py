@@ -0,0 +1,42 @@
+import pytest
+from calculator import Calculator, EngineeringCalculator, ComplexCalculator, OperationRegistry
+from calculator import calculator_module
+
+# 연산 레지스트리 테스트
+def test_registry_evaluate_matches_calculators():
+    """
+    테스트 설명:
+    - 레지스트리로 계산한 결과가 각 계산기 메서드를 직접 호출한 결과와 같은지 확인합니다.
+    - evaluate_many가 연산 하나 또는 연산 목록으로 입력 순서대로 계산하는지 확인합니다.
+    """
+    registry = OperationRegistry(precision=3)
+    assert registry.evaluate('add', 1, 2, 3) == Calculator().add(1, 2, 3, precision=3)
+    assert registry.evaluate('divide', 1, 3) == 0.333
+    assert registry.evaluate('sin', 30, 'degree') == EngineeringCalculator(precision=3).sin(30, unit='degree')
+    assert registry.evaluate('complex_multiply', 1 + 2j, 3 - 1j) == ComplexCalculator().multiply(1 + 2j, 3 - 1j)
+    assert registry.evaluate_many('sqrt', [(4,), (2,)]) == [2.0, 1.414]
+    assert registry.evaluate_many(['add', 'log', 'magnitude'], [(1, 2), (100,), (3 + 4j,)]) == [3, 2.0, 5.0]
+    with pytest.raises(ValueError):
+        registry.evaluate('unknown', 1)
+    with pytest.raises(ValueError):
+        registry.evaluate_many(['add', 'unknown'], [(1, 2), (3,)])
+
+# 연산 구성(schema) 및 이전 계층 테스트
+def test_registry_schema_and_legacy():
+    """
+    테스트 설명:
+    - 연산의 위치 인자 구성(이름, 최소/최대 인자 수)이 메서드 시그니처에서 구해지는지 확인합니다.
+    - legacy=True이면 calculator_module 계산기(angle_unit, **kwargs precision)를 같은 호출 방식으로 사용하는지 확인합니다.
+    """
+    registry = OperationRegistry()
+    add, log = registry.get('add'), registry.get('log')
+    assert add.params == ('*nums',) and add.min_args == 0 and add.max_args is None
+    assert log.params == ('x', 'base') and (log.min_args, log.max_args) == (1, 2)
+    with pytest.raises(TypeError):
+        registry.get('power').check((2,))
+
+    legacy = OperationRegistry(precision=3, legacy=True)
+    expected = calculator_module.EngineeringCalculator().sin(30, angle_unit='degree', precision=3)
+    assert legacy.evaluate('sin', 30, 'degree') == expected == 0.5
+    assert legacy.evaluate('ln', 10) == 2.303
+    assert 'ln' in legacy and 'ln' not in registry
@@ -0,0 +1,64 @@
+import math
+import pytest
+from calculator import EngineeringCalculator, RootFinder
+from calculator.roots import CONVERGED, FAILED, MAX_ITERATIONS
+
+# Newton/할선 방식 배열 근 찾기 테스트
+def test_root_finder_newton_and_secant():
+    """
+    테스트 설명:
+    - 원소마다 매개변수가 다른 방정식(x + log10(x) = c)을 Newton(도함수 지정/차분 근사)과 할선 방식으로 풀 수 있는지 확인합니다.
+    - 수렴하지 않는 원소는 MAX_ITERATIONS, 도함수가 0인 원소는 FAILED로 표시되고, 나머지 원소의 결과에 영향이 없는지 확인합니다.
+    - 입력 모양이 유지되고 precision은 근에만 적용되는지 확인합니다.
+    """
+    np = pytest.importorskip("numpy")
+    calc = EngineeringCalculator()
+    targets = np.linspace(1.0, 50.0, 1001)
+
+    def f(x, c):
+        return x + calc.log_array(x) - c
+
+    finder = RootFinder()
+    for roots, status, iterations in (finder.newton(f, targets, lambda x, c: 1 + 1 / (x * math.log(10)), (targets,)),
+                                      finder.newton(f, targets, args=(targets,)),
+                                      finder.secant(f, targets, args=(targets,))):
+        assert (status == CONVERGED).all() and iterations.max() <= 6
+        np.testing.assert_allclose(roots + np.log10(roots), targets, atol=1e-12)
+
+    # x² = a: a < 0은 수렴하지 않음, x = 0에서는 도함수가 0
+    roots, status, iterations = RootFinder(maxiter=20).newton(lambda x, a: x * x - a, [[1.0, 3.0], [0.0, 1.0]],
+                                                              lambda x, a: 2 * x, args=([2.0, -1.0],))
+    assert roots.shape == status.shape == (2, 2)
+    assert status.tolist() == [[CONVERGED, MAX_ITERATIONS], [FAILED, FAILED]]
+    assert roots[0, 0] == pytest.approx(math.sqrt(2)) and math.isnan(roots[1, 0])
+    assert iterations[0, 1] == 20 and iterations[1, 1] == 2
+    roots, status, _ = RootFinder(precision=3).secant(lambda x: x * x - 2, 1.0)
+    assert roots == 1.414 and status == CONVERGED
+
+# 이분법/Brent 방식 배열 근 찾기 테스트
+def test_root_finder_bracketing():
+    """
+    테스트 설명:
+    - 이분법과 Brent 방식이 구간 안의 근을 허용 오차 안으로 찾고, Brent가 더 적은 반복으로 수렴하는지 확인합니다.
+    - 구간 끝점이 근이면 반복 없이 끝나고, 양 끝의 부호가 같은 원소는 FAILED로 표시되는지 확인합니다.
+    """
+    np = pytest.importorskip("numpy")
+    calc = EngineeringCalculator()
+    targets = np.linspace(-0.9, 0.9, 501)
+
+    def f(x, c):
+        return calc.sin_array(x, 'degree') - c
+
+    finder = RootFinder(xtol=1e-10)
+    bisect = finder.bisect(f, -90.0, 90.0, args=(targets,))
+    brent = finder.brent(f, -90.0, 90.0, args=(targets,))
+    for roots, status, _ in (bisect, brent):
+        assert (status == CONVERGED).all()
+        np.testing.assert_allclose(roots, np.degrees(np.arcsin(targets)), atol=1e-9)
+    assert brent[2].mean() < bisect[2].mean() / 3
+
+    for method in (finder.bisect, finder.brent):
+        roots, status, iterations = method(lambda x: x * x - 4, [2.0, 3.0, 0.0], 5.0)
+        assert status.tolist() == [CONVERGED, FAILED, CONVERGED]
+        assert roots[0] == 2.0 and math.isnan(roots[1]) and roots[2] == pytest.approx(2.0)
+        assert iterations[0] == 0
@@ -0,0 +1,93 @@
+import asyncio
+import json
+import sys
+import pytest
+from calculator import Calculator, EngineeringCalculator
+from calculator.loadgen import run_load
+from calculator.server import CalculatorServer
+
+pytest.importorskip("numpy")  # 묶음 계산은 배열 경로를 사용
+
+async def _exchange(server: CalculatorServer, requests: list) -> list:
+    # 응답을 기다리지 않고 모든 요청을 한 번에 보낸 뒤(pipelining) 응답을 읽음
+    reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+    writer.write(b''.join(json.dumps(request).encode() + b'\n' for request in requests))
+    await writer.drain()
+    responses = [json.loads(await reader.readline()) for _ in requests]
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+# 파이프라인 요청과 묶음 계산 테스트
+def test_server_pipelined_micro_batches():
+    """
+    테스트 설명:
+    - 한 연결에서 연달아 보낸 요청의 응답이 요청 순서대로 돌아오는지 확인합니다.
+    - 묶음(배열) 경로의 결과가 스칼라 메서드와 같고, 0으로 나누기는 에러 응답이 되는지 확인합니다.
+    """
+    calc, eng_calc = Calculator(), EngineeringCalculator(precision=4)
+    requests = [{'id': i, 'op': 'sin', 'args': [i, 'degree'], 'precision': 4} for i in range(40)]
+    requests += [{'id': 100 + i, 'op': 'add', 'args': [i, 1]} for i in range(20)]
+    requests += [{'id': 200, 'op': 'divide', 'args': [1, 0]}, {'id': 201, 'op': 'magnitude', 'args': ['3+4j']},
+                 {'id': 202, 'oops': 1}]
+
+    async def scenario():
+        async with CalculatorServer(port=0, max_latency=0.01) as server:
+            responses = await _exchange(server, requests)
+            return responses, server.batcher.batches
+
+    responses, batches = asyncio.run(scenario())
+    assert [response['id'] for response in responses] == [request.get('id') for request in requests]
+    assert [r['result'] for r in responses[:40]] == [eng_calc.sin(i, unit='degree') for i in range(40)]
+    assert [r['result'] for r in responses[40:60]] == [calc.add(i, 1) for i in range(20)]
+    assert 'error' in responses[60] and responses[61]['result'] == 5.0 and 'error' in responses[62]
+    assert batches < len(requests)  # 요청들이 묶음으로 계산됨
+
+# 부하 생성기 테스트 (Unix 소켓)
+def test_loadgen_reports_latency(tmp_path):
+    """
+    테스트 설명:
+    - Unix 소켓 서버에 부하 생성기를 실행하여 처리량과 p50/p99 지연 시간을 보고하는지 확인합니다.
+    """
+    path = str(tmp_path / 'calculator.sock')
+
+    async def scenario():
+        async with CalculatorServer(path=path):
+            return await run_load(path=path, requests=200, connections=3, window=16)
+
+    stats = asyncio.run(scenario())
+    assert stats['requests'] == 600 and stats['errors'] == 0
+    assert 0 < stats['p50_ms'] <= stats['p99_ms'] <= stats['max_ms']
+
+# 묶음 계산과 개별 계산의 응답 일치 테스트
+def test_server_batched_matches_unbatched():
+    """
+    테스트 설명:
+    - 같은 요청들을 묶음 크기 1024와 1로 보냈을 때 응답이 완전히 같은지 확인합니다.
+    - 큰 정수 덧셈이 overflow 없이 정확한 int로, 반올림과 log 결과가 스칼라 메서드와 같게 계산되는지 확인합니다.
+    - 잘못된 인자(리스트 precision, 리스트 인자, 숫자가 아닌 op)와 너무 큰 결과는 에러 응답이 되고 이후 요청도 계속 처리되는지 확인합니다.
+    """
+    requests = []
+    for i in range(16):
+        requests += [{'id': len(requests), 'op': 'add', 'args': [2 ** 62, 2 ** 62 + i]},
+                     {'id': len(requests) + 1, 'op': 'add', 'args': [4.4555, 0.0], 'precision': 3},
+                     {'id': len(requests) + 2, 'op': 'log', 'args': [1000 + i]},
+                     {'id': len(requests) + 3, 'op': 'sqrt', 'args': [2.0 + i]},
+                     {'id': len(requests) + 4, 'op': 'divide', 'args': [1.0, float(i % 2)], 'precision': 2},
+                     {'id': len(requests) + 5, 'op': 'add', 'args': [-0.0, -0.0]}]
+    requests += [{'id': 'p', 'op': 'add', 'args': [1, 2], 'precision': [1]}, {'id': 'a', 'op': 'add', 'args': [[1], 2]},
+                 {'id': 'o', 'op': 1, 'args': [1]}, {'id': 'big', 'op': 'power', 'args': [10, 10 ** 7]},
+                 {'id': 'digits', 'op': 'int_power', 'args': [10, 5000]}, {'id': 'last', 'op': 'add', 'args': [1.5, 2.5]}]
+
+    async def scenario(max_batch_size):
+        async with CalculatorServer(port=0, max_latency=0.01, max_batch_size=max_batch_size) as server:
+            return await _exchange(server, requests)
+
+    batched, unbatched = asyncio.run(scenario(1024)), asyncio.run(scenario(1))
+    assert batched == unbatched
+    by_id = {response['id']: response for response in batched}
+    assert by_id[0]['result'] == 2 ** 63 and by_id[1]['result'] == 4.455
+    assert by_id[2]['result'] == EngineeringCalculator().log(1000) and str(by_id[5]['result']) == '0.0'
+    assert all('error' in by_id[key] for key in ('p', 'a', 'o', 'big')) and by_id['last']['result'] == 4.0
+    if hasattr(sys, 'get_int_max_str_digits'):  # 4300자리를 넘는 정수는 JSON으로 쓸 수 없어 에러 응답
+        assert 'error' in by_id['digits']
@@ -0,0 +1,70 @@
+import asyncio
+import math
+import threading
+import pytest
+from calculator import EngineeringCalculator
+
+# context별 설정 블록 테스트
+def test_settings_block_scoping():
+    """
+    테스트 설명:
+    - settings 블록 안에서만 precision/unit이 적용되고, 블록이 끝나면 인스턴스 설정으로 돌아오는지 확인합니다.
+    - 중첩 블록은 지정하지 않은 설정을 바깥 블록에서 물려받고, 결과 캐시와 freeze도 블록 설정을 따르는지 확인합니다.
+    """
+    calc = EngineeringCalculator(precision=2)
+    calc.enable_cache()
+    assert calc.sin(30) == round(math.sin(30), 2)
+    with calc.settings(precision=4, unit='degree') as same:
+        assert same is calc and calc.precision == 4
+        assert calc.sin(30) == 0.5 and calc.cos(60) == 0.5 and calc.sin(0.5, 'radian') == round(math.sin(0.5), 4)
+        with calc.settings(precision=None):
+            assert calc.sin(30) == math.sin(math.radians(30)) and calc.unit == 'degree'
+        assert calc.freeze().sin(30) == 0.5 and calc.log(2) == 0.301
+    assert calc.precision == 2 and calc.unit == 'radian'
+    assert calc.sin(30) == round(math.sin(30), 2)  # 캐시에 저장된 블록 안의 결과가 반환되지 않음
+    assert EngineeringCalculator().precision is None  # 다른 인스턴스에는 영향 없음
+    with pytest.raises(TypeError):
+        calc.settings(precision=1.5)
+    with pytest.raises(ValueError):
+        calc.settings(unit='gradian')
+
+# 여러 스레드/asyncio 작업의 동시 사용 테스트
+def test_settings_concurrent_threads_and_tasks():
+    """
+    테스트 설명:
+    - 여러 스레드가 인스턴스 하나를 공유하면서 각자 다른 precision/unit 블록으로 계산해도 서로의 설정이 섞이지 않는지 확인합니다.
+    - asyncio 작업이 await로 번갈아 실행되어도 작업마다 설정이 유지되는지 확인합니다.
+    """
+    calc = EngineeringCalculator()
+    errors = []
+    barrier = threading.Barrier(8)
+
+    def worker(precision: int) -> None:
+        unit = 'degree' if precision % 2 else 'radian'
+        expected = round(math.sin(math.radians(37) if unit == 'degree' else 37), precision)
+        barrier.wait()
+        for _ in range(2000):
+            with calc.settings(precision=precision, unit=unit):
+                if calc.sin(37) != expected or calc.precision != precision:
+                    errors.append(precision)
+
+    threads = [threading.Thread(target=worker, args=(precision,)) for precision in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+
+    async def task(precision: int) -> bool:
+        with calc.settings(precision=precision):
+            for _ in range(50):
+                await asyncio.sleep(0)
+                if calc.square_root(2) != round(math.sqrt(2), precision):
+                    return False
+        return True
+
+    async def main():
+        return await asyncio.gather(*(task(precision) for precision in range(10)))
+
+    assert all(asyncio.run(main()))
+    assert calc.precision is None
@@ -0,0 +1,65 @@
+import math
+import pytest
+from calculator import Calculator
+
+# 스트리밍 덧셈 보정 합산 테스트
+def test_add_stream_compensated():
+    """
+    테스트 설명:
+    - 제너레이터를 그대로 받아 합을 계산하는지 확인합니다.
+    - 보정 합산(neumaier/fsum)이 단순 합산보다 정확한지 확인합니다.
+    - 모든 값이 정수이면 정확한 int를 반환하는지 확인합니다.
+    """
+    calc = Calculator()
+    values = [1e16, 1.0, -1e16] * 1000
+    assert calc.add_stream(iter(values)) == 1000.0
+    assert calc.add_stream(iter(values), method='fsum') == math.fsum(values)
+    assert calc.add_stream(iter(values), method='naive') == sum(values)
+    assert calc.add_stream(x for x in range(10 ** 5)) == sum(range(10 ** 5))
+    assert calc.add_stream(iter([0.1] * 10), precision=3) == 1.0
+    with pytest.raises(ValueError):
+        calc.add_stream([1], method='unknown')
+
+# 스트리밍 뺄셈/곱셈/나눗셈 테스트
+def test_chained_streams_match_scalar_methods():
+    """
+    테스트 설명:
+    - subtract_stream/multiply_stream/divide_stream 결과가 가변 인자 메서드와 같은지 확인합니다.
+    - 0으로 나누면 divide와 같은 에러 메시지를 반환하는지 확인합니다.
+    """
+    calc = Calculator()
+    nums = [100, 2, 5, 0.5, 3]
+    assert calc.subtract_stream(iter(nums)) == calc.subtract(*nums)
+    assert calc.multiply_stream(iter(nums), precision=2) == calc.multiply(*nums, precision=2)
+    assert calc.divide_stream(iter(nums), precision=4) == calc.divide(*nums, precision=4)
+    assert calc.divide_stream(iter([1, 0])) == calc.divide(1, 0)
+    with pytest.raises(ValueError):
+        calc.multiply_stream(iter([]))
+
+# 묶음(chunk) 단위 스트리밍 테스트
+def test_streams_chunked():
+    """
+    테스트 설명:
+    - chunked=True일 때 list와 NumPy 배열 묶음을 펼쳐서 계산하는지 확인합니다.
+    """
+    calc = Calculator()
+    chunks = [[1, 2, 3], (4, 5), [6]]
+    assert calc.add_stream(iter(chunks), chunked=True) == 21
+    assert calc.multiply_stream(iter(chunks), chunked=True) == 720
+    np = pytest.importorskip("numpy")
+    arrays = (np.full(1000, 0.1) for _ in range(10))
+    assert calc.add_stream(arrays, chunked=True) == pytest.approx(1000.0, abs=1e-12)
+
+# 유한하지 않은 값의 스트리밍 덧셈 테스트
+def test_add_stream_non_finite():
+    """
+    테스트 설명:
+    - inf/nan이 포함되거나 합이 overflow되면 보정 합산도 add와 같은 결과(inf/nan)를 반환하는지 확인합니다.
+    """
+    calc = Calculator()
+    for values in ([1.0, math.inf], [1, -math.inf, 2.5], [1e308, 1e308], [-1e308, 3, -1e308], [math.nan, 1.0],
+                   [math.inf, -math.inf]):
+        expected = calc.add(*values)
+        result = calc.add_stream(iter(values))
+        assert result == expected or (math.isnan(result) and math.isnan(expected))
+    assert calc.add_stream(iter([1e308, 1e308, -1e308])) == math.inf
@@ -0,0 +1,73 @@
+import math
+import pytest
+from calculator import EngineeringCalculator, DegreeTrigTable
+
+# 격자 위 각도의 표 조회 테스트
+def test_trig_table_exact_grid():
+    """
+    테스트 설명:
+    - 격자 위 각도(0.1° 단위)는 math 계산 결과와 거의 같고, 특수각은 정확한 값을 반환하는지 확인합니다.
+    - 360° 이상 및 음수 각도도 범위를 줄여서 계산하는지 확인합니다.
+    """
+    table = DegreeTrigTable(step=0.1)
+    for angle in (0, 0.1, 12.3, 45, 89.9, 135.7, 271.4, 359.9, 720.5, -30.2):
+        assert table.sin(angle) == pytest.approx(math.sin(math.radians(angle % 360)), abs=1e-15)
+        assert table.cos(angle) == pytest.approx(math.cos(math.radians(angle % 360)), abs=1e-15)
+    assert (table.sin(180), table.cos(90), table.sin(30)) == (0.0, 0.0, pytest.approx(0.5))
+    assert table.tan(90) == math.inf and table.tan(270) == -math.inf
+
+# 격자 밖 각도의 정확/보간 모드 테스트
+def test_trig_table_off_grid_modes():
+    """
+    테스트 설명:
+    - 정확 모드는 격자 밖 각도를 math 함수로 계산하는지 확인합니다.
+    - 보간 모드의 오차가 문서화된 범위(step=1°일 때 약 1.6e-9) 이내인지 확인합니다.
+    """
+    exact = DegreeTrigTable(step=1)
+    interpolated = DegreeTrigTable(step=1, interpolate=True)
+    for angle in (0.37, 33.5, 100.123, 200.9, -17.25):
+        expected = math.sin(math.radians(angle))
+        assert exact.sin(angle) == pytest.approx(expected, abs=1e-15)
+        assert abs(interpolated.sin(angle) - expected) < 1.6e-9
+        assert abs(interpolated.cos(angle) - math.cos(math.radians(angle))) < 1.6e-9
+
+# 공학용 계산기 표 모드 테스트
+def test_engineering_trig_table_mode():
+    """
+    테스트 설명:
+    - enable_trig_table 후 degree 단위 호출은 표를 사용하고, radian 단위 호출은 그대로인지 확인합니다.
+    - 배열 버전도 스칼라 결과와 같은지 확인합니다.
+    """
+    eng_calc = EngineeringCalculator(precision=10)
+    eng_calc.enable_trig_table(step=0.5, interpolate=True)
+    assert eng_calc.sin(180, unit='degree') == 0.0
+    assert eng_calc.sin(1.0) == round(math.sin(1.0), 10)
+    pytest.importorskip("numpy")
+    angles = [0, 10.5, 33.3, 90, 181.25, -45]
+    for name in ('sin', 'cos', 'tan'):
+        scalar = getattr(eng_calc, name)
+        batch = getattr(eng_calc, name + '_array')
+        assert batch(angles, unit='degree').tolist() == [scalar(a, unit='degree') for a in angles]
+    eng_calc.disable_trig_table()
+    assert eng_calc.sin(180, unit='degree') == round(math.sin(math.pi), 10)
+
+# nan/inf와 매우 큰 각도의 표 조회 테스트
+def test_trig_table_non_finite_and_huge_angles():
+    """
+    테스트 설명:
+    - nan/inf 각도는 math/NumPy 함수와 같은 결과(nan 또는 ValueError)를 반환하는지 확인합니다.
+    - 1e20, ±1e308처럼 매우 큰 각도도 360°로 범위를 줄여 스칼라와 배열 버전이 같은 값을 반환하는지 확인합니다.
+    """
+    for table in (DegreeTrigTable(step=0.1), DegreeTrigTable(step=1, interpolate=True)):
+        assert math.isnan(table.sin(math.nan)) and math.isnan(table.cos(math.nan))
+        with pytest.raises(ValueError):
+            table.sin(math.inf)
+        assert table.sin(1e20) == table.sin(1e20 % 360) and table.cos(-1e20) == table.cos(-1e20 % 360)
+        for angle in (1e308, -1e308, 1.7976931348623157e308):  # angle * (1 / step)가 float 범위를 넘는 각도
+            assert table.sin(angle) == table.sin(angle % 360) and table.cos(angle) == table.cos(angle % 360)
+        np = pytest.importorskip("numpy")
+        angles = [math.nan, math.inf, -math.inf, 1e20, -1e20, 1e300, 1e308, -1e308, 30.0]
+        for name in ('sin', 'cos', 'tan'):
+            result = getattr(table, name + '_array')(angles)
+            assert np.isnan(result[:3]).all()
+            assert result[3:].tolist() == [getattr(table, name)(a) for a in angles[3:]]
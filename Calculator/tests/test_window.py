@@ -0,0 +1,83 @@
+import math
+import random
+import statistics
+import pytest
+from calculator import Calculator, SlidingWindow
+
+# 슬라이딩 윈도우 누적값 테스트
+@pytest.mark.parametrize("resum_interval", [None, 0, 7])
+def test_sliding_window_matches_recompute(resum_interval):
+    """
+    테스트 설명:
+    - 값을 넣고 뺄 때마다 합, 곱, 평균, 분산이 창의 값들로 처음부터 다시 계산한 결과와 같은지 확인합니다.
+    - 0이 창을 지나간 뒤에도 곱이 올바르게 돌아오는지, precision이 Calculator와 같이 적용되는지 확인합니다.
+    """
+    rng = random.Random(resum_interval)
+    calc = Calculator()
+    window = SlidingWindow(5, resum_interval=resum_interval)
+    for step in range(300):
+        window.push(0 if step % 17 == 0 else rng.uniform(0.5, 1.5))
+        if step % 11 == 0:
+            window.pop()
+        values = window.values()
+        assert len(window) == len(values) <= 5
+        if not values:
+            continue
+        assert window.sum() == pytest.approx(math.fsum(values), abs=1e-12)
+        assert window.product() == pytest.approx(calc.multiply(*values), rel=1e-12)
+        assert window.mean() == pytest.approx(statistics.fmean(values), abs=1e-12)
+        assert window.variance() == pytest.approx(statistics.pvariance(values), abs=1e-12)
+        if len(values) > 1:
+            assert window.variance(sample=True) == pytest.approx(statistics.variance(values), abs=1e-12)
+        assert window.sum(precision=2) == round(window.sum(), 2)
+
+# 링 버퍼 및 예외 테스트
+def test_sliding_window_ring_buffer():
+    """
+    테스트 설명:
+    - 가득 찬 창에 넣으면 가장 오래된 값이 밀려나고, 빈 창의 pop/mean은 예외가 발생하는지 확인합니다.
+    - 곱이 overflow된 뒤 큰 값이 창에서 빠지면 곱이 다시 유한한 값으로 계산되는지 확인합니다.
+    """
+    window = SlidingWindow(3, resum_interval=0)
+    assert [window.push(v) for v in (1, 2, 3, 4)] == [None, None, None, 1.0]
+    assert window.values() == [2.0, 3.0, 4.0] and window.is_full
+    assert window.sum() == 9.0 and window.product() == 24.0
+    assert window.pop() == 2.0 and window.values() == [3.0, 4.0]
+    window.clear()
+    with pytest.raises(IndexError):
+        window.pop()
+    with pytest.raises(ValueError):
+        window.mean()
+    assert window.sum() == 0.0 and window.product() == 1.0
+    window.extend([1e300, 1e300, 2.0])
+    assert window.product() == math.inf
+    window.extend([3.0, 4.0])
+    assert window.product() == 24.0
+    with pytest.raises(ValueError):
+        SlidingWindow(0)
+
+# inf/nan과 overflow가 창을 지나가는 경우 테스트
+@pytest.mark.parametrize("resum_interval", [0, 4])
+def test_sliding_window_non_finite_values(resum_interval):
+    """
+    테스트 설명:
+    - inf/nan이 창에 있는 동안 합과 평균은 Calculator.add와 같은 inf/nan, 분산은 nan인지 확인합니다.
+    - inf/nan이나 overflow를 일으킨 큰 값이 창에서 빠지면 합, 평균, 분산이 다시 유한한 값으로 돌아오는지 확인합니다.
+    """
+    calc = Calculator()
+    window = SlidingWindow(3, resum_interval=resum_interval)
+    window.extend([1.0, math.inf, 2.0])
+    assert window.sum() == math.inf and window.mean() == math.inf and math.isnan(window.variance())
+    window.push(-math.inf)
+    assert math.isnan(window.sum()) and math.isnan(calc.add(*window.values()))
+    window.push(math.nan)
+    assert math.isnan(window.sum()) and math.isnan(window.mean())
+    window.extend([1.0, 2.0, 3.0])
+    assert window.sum() == 6.0 and window.mean() == 2.0 and window.variance() == pytest.approx(2 / 3)
+
+    window.extend([1e308, 1e308])
+    assert window.sum() == calc.add(*window.values()) == math.inf
+    window.extend([4.0, 5.0])
+    assert window.sum() == 1e308 + 9.0
+    window.push(6.0)
+    assert window.sum() == 15.0
@@ -0,0 +1,191 @@
+# calculator/trig_table.py
+
+import math
+from typing import Sequence, Union
+
+from .utils import get_numpy
+
+class DegreeTrigTable:
+    """
+    degree 단위 삼각함수를 미리 계산된 표(lookup table)로 계산하는 클래스.
+
+    표는 0°~90° 구간만 math 함수로 계산하고, 나머지 구간은 대칭성(sin(180°-x) = sin(x), sin(-x) = -sin(x))으로
+    채운 한 바퀴(360°) 분량의 sin 값입니다. cos(x)는 sin(x + 90°)으로, tan(x)는 sin(x) / cos(x)로 계산합니다.
+    입력 각도는 360°로 나눈 나머지로 범위를 줄인 뒤 표에서 찾습니다.
+
+    - 격자 위의 각도(step의 정수배): 표의 값을 그대로 반환합니다. 대칭으로 채웠으므로 sin(180°) = 0.0,
+      cos(90°) = 0.0처럼 math.sin(math.radians(x))보다 정확한 값을 반환합니다.
+      0° 이상 360° 미만의 격자 각도는 딕셔너리 한 번 조회로 바로 찾습니다.
+    - 격자 밖의 각도:
+        * interpolate=False (정확 모드): math 함수로 직접 계산합니다.
+        * interpolate=True (보간 모드): 가장 가까운 격자 각도 a와 차이 d(라디안, |d| <= step/2)에 대해
+          sin(a + d) = sin(a)·cos(d) + cos(a)·sin(d)를 cos(d) ≈ 1 - d²/2, sin(d) ≈ d - d³/6으로 계산합니다.
+          절단 오차는 |d|⁴/24 이하이며, step=0.1°이면 약 2.4e-14, step=1°이면 약 1.6e-9입니다.
+    """
+
+    def __init__(self, step: float = 0.1, interpolate: bool = False):
+        """
+        클래스 초기화 함수.
+
+        Args:
+            step (float): 표의 격자 간격 (degree). 90을 나누어떨어지게 해야 합니다. 기본값은 0.1.
+            interpolate (bool): 격자 밖 각도를 보간으로 계산할지 여부. 기본값은 False (math 함수로 계산).
+
+        Raises:
+            ValueError: step이 양수가 아니거나 90을 나누어떨어지게 하지 않을 경우 발생.
+        """
+        if step <= 0:
+            raise ValueError("Table step must be positive.")
+        quarter = round(90 / step)
+        if abs(quarter * step - 90) > 1e-9:
+            raise ValueError("Table step must evenly divide 90 degrees.")
+        self.step = step
+        self.interpolate = interpolate
+        self._inverse_step = 1 / step
+        self._step_radians = math.radians(step)
+        self._quarter = quarter  # 90°에 해당하는 격자 칸 수
+        self._size = 4 * quarter  # 360°에 해당하는 격자 칸 수
+
+        # 0°~90° 구간: 45° 이하는 sin, 45° 초과는 cos(90° - x)로 계산하여 인자를 작게 유지
+        first = [
+            math.sin(math.radians(k * step)) if 2 * k <= quarter else math.cos(math.radians((quarter - k) * step))
+            for k in range(quarter + 1)
+        ]
+        first[0], first[quarter] = 0.0, 1.0
+        second = first[quarter - 1::-1]  # 90°~180°: sin(180° - x) = sin(x)
+        upper = first + second[:-1]  # 0°~180° (180°는 아래에서 0으로 채움)
+        self._table = upper + [0.0 - value for value in upper]  # 180°~360°: sin(x + 180°) = -sin(x) (-0.0 방지)
+        self._array = None  # NumPy 배열 버전의 표 (배열 연산 시 처음 한 번 생성)
+
+        # 스칼라 호출용 딕셔너리: 격자 각도 -> 값 (int 키와 float 키는 같은 해시이므로 30과 30.0 모두 적중)
+        # step이 1/n 꼴이면 k / n으로 키를 만들어 소스 코드의 리터럴(예: 30.1)과 같은 float이 되도록 합니다.
+        divisor = round(self._inverse_step)
+        if abs(divisor - self._inverse_step) < 1e-12:
+            angles = [k / divisor for k in range(self._size)]
+        else:
+            angles = [k * step for k in range(self._size)]
+        # EngineeringCalculator는 메서드 호출 비용을 줄이기 위해 이 딕셔너리들을 직접 조회합니다.
+        size, table = self._size, self._table
+        self.sin_values = dict(zip(angles, table))
+        self.cos_values = {angle: table[(k + quarter) % size] for k, angle in enumerate(angles)}
+        self.tan_values = {angle: self._divide(self.sin_values[angle], self.cos_values[angle]) for angle in angles}
+
+    @staticmethod
+    def _divide(s: float, c: float) -> float:
+        """
+        tan = sin / cos를 계산하는 내부 함수. cos 값이 0이면 sin의 부호를 따르는 inf를 반환합니다.
+        """
+        if c == 0:
+            return math.copysign(math.inf, s)
+        return s / c
+
+    def __repr__(self) -> str:
+        return f"DegreeTrigTable(step={self.step}, interpolate={self.interpolate})"
+
+    def _lookup(self, angle: Union[int, float], shift: int, fallback) -> float:
+        """
+        sin(angle + shift 칸)을 표에서 찾는 내부 함수. shift=0이면 sin, shift=quarter이면 cos입니다.
+        딕셔너리에 없는 각도(범위 밖 또는 격자 밖)에 사용됩니다. nan/inf는 fallback(math 함수)으로 계산합니다.
+        """
+        if not math.isfinite(angle):
+            return fallback(angle)
+        angle = math.fmod(angle, 360)  # 먼저 정확히 범위를 줄여 매우 큰 각도(1e308 등)에서도 scaled가 overflow되지 않게 함
+        scaled = angle * self._inverse_step
+        index = round(scaled)
+        if scaled == index:
+            return self._table[(index + shift) % self._size]
+        if not self.interpolate:
+            return fallback(math.radians(angle % 360))
+        table, size = self._table, self._size
+        i = index + shift
+        s = table[i % size]
+        c = table[(i + self._quarter) % size]
+        d = (scaled - index) * self._step_radians
+        d2 = d * d
+        return s * (1 - d2 / 2) + c * d * (1 - d2 / 6)
+
+    def sin(self, angle: Union[int, float]) -> float:
+        """
+        degree 단위 각도의 사인 값을 표에서 계산합니다.
+        """
+        value = self.sin_values.get(angle)
+        if value is None:
+            value = self._lookup(angle, 0, math.sin)
+        return value
+
+    def cos(self, angle: Union[int, float]) -> float:
+        """
+        degree 단위 각도의 코사인 값을 표에서 계산합니다.
+        """
+        value = self.cos_values.get(angle)
+        if value is None:
+            value = self._lookup(angle, self._quarter, math.cos)
+        return value
+
+    def tan(self, angle: Union[int, float]) -> float:
+        """
+        degree 단위 각도의 탄젠트 값을 표에서 계산합니다. cos 값이 0인 각도(90° 등)에서는 ±inf를 반환합니다.
+        """
+        value = self.tan_values.get(angle)
+        if value is None:
+            value = self._divide(self._lookup(angle, 0, math.sin), self._lookup(angle, self._quarter, math.cos))
+        return value
+
+    def _lookup_array(self, angles: Sequence, shift: int, fallback):
+        """
+        _lookup의 배열 버전. 격자 위 원소는 표에서 한 번에 가져오고(gather), 나머지는 정확/보간 모드로 계산합니다.
+        nan/inf 원소는 fallback(NumPy 함수)으로 계산합니다.
+        """
+        np = get_numpy()
+        if self._array is None:
+            self._array = np.array(self._table)
+        angles = np.asarray(angles, dtype=float)
+        finite = np.isfinite(angles)
+        all_finite = finite.all()
+        if not all_finite:
+            non_finite = angles[~finite]
+            angles = np.where(finite, angles, 0.0)
+        # 360° 범위 축소를 먼저 하여(fmod는 정확함) 매우 큰 각도(1e308 등)에서도 scaled가 overflow되지 않게 하고,
+        # 음수 격자 칸 번호는 intp로 바꾸기 전에 0 이상으로 맞춤
+        angles = np.fmod(angles, 360)
+        scaled = angles * self._inverse_step
+        index = np.rint(scaled)
+        position = np.mod(index, self._size).astype(np.intp)
+        if shift:
+            position += shift
+        result = self._array.take(position, mode='wrap')
+        off_grid = index != scaled
+        if off_grid.any():
+            if not self.interpolate:
+                result[off_grid] = fallback(np.radians(np.mod(angles[off_grid], 360)))
+            else:
+                d = (scaled[off_grid] - index[off_grid]) * self._step_radians
+                d2 = d * d
+                c = self._array.take(position[off_grid] + self._quarter, mode='wrap')
+                result[off_grid] = result[off_grid] * (1 - d2 / 2) + c * d * (1 - d2 / 6)
+        if not all_finite:
+            with np.errstate(invalid='ignore'):
+                result[~finite] = fallback(non_finite)
+        return result
+
+    def sin_array(self, angles: Sequence):
+        """
+        degree 단위 각도 배열의 사인 값을 표에서 계산합니다.
+        """
+        return self._lookup_array(angles, 0, get_numpy().sin)
+
+    def cos_array(self, angles: Sequence):
+        """
+        degree 단위 각도 배열의 코사인 값을 표에서 계산합니다.
+        """
+        return self._lookup_array(angles, self._quarter, get_numpy().cos)
+
+    def tan_array(self, angles: Sequence):
+        """
+        degree 단위 각도 배열의 탄젠트 값을 표에서 계산합니다. cos 값이 0인 원소는 ±inf가 됩니다.
+        """
+        np = get_numpy()
+        s = self.sin_array(angles)
+        c = self.cos_array(angles)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.divide(s, c, out=s)
@@ -1,7 +1,7 @@
 # calculator/utils.py
 
 import math
-from typing import Union
+from typing import Optional, Union
 
 def round_result(value: Union[int, float], precision: int = None) -> Union[int, float]:
     """
@@ -11,10 +11,97 @@ def round_result(value: Union[int, float], precision: int = None) -> Union[int,
         return round(value, precision)
     return value
 
+# power가 float 범위를 넘는 정수 거듭제곱을 정확한 정수로 계산하는 결과의 최대 비트 수 (약 3000자리).
+# 이보다 큰 결과는 계산 시간과 메모리가 커지고 문자열 변환 제한(4300자리)에 걸리므로 OverflowError로 처리합니다.
+MAX_EXACT_POWER_BITS = 10_000
+
+def power_result(x: Union[int, float], y: Union[int, float]) -> Union[int, float]:
+    """
+    math.pow로 거듭제곱을 계산하는 함수.
+    밑이 정수이고 지수가 0 이상의 정수인데 float 범위를 넘으면(OverflowError), 결과가 MAX_EXACT_POWER_BITS 이하인
+    경우에만 정확한 정수로 계산합니다 (예: power_result(10 ** 400, 2) = 10 ** 800).
+    """
+    try:
+        return math.pow(x, y)
+    except OverflowError:
+        if not (isinstance(x, int) and isinstance(y, int) and y >= 0 and abs(x).bit_length() * y <= MAX_EXACT_POWER_BITS):
+            raise
+        return x ** y
+
 def convert_to_radians(angle: Union[int, float], unit: str = 'radian') -> float:
     """
     각도를 라디안으로 변환하는 함수
     """
     if unit == 'degree':
         return math.radians(angle)
-    return angle
\ No newline at end of file
+    return angle
+
+def get_numpy():
+    """
+    NumPy 모듈을 처음 사용할 때 가져오는 함수.
+    배열(batch) 연산에서만 필요하므로 패키지 import 시점에는 불러오지 않습니다.
+
+    Raises:
+        ImportError: NumPy가 설치되어 있지 않을 경우 발생.
+    """
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError("Batch operations require NumPy. Install it with 'pip install numpy'.") from exc
+    return numpy
+
+def round_array(values, precision: Optional[int] = None):
+    """
+    배열 결과값을 지정된 정밀도로 한 번에 반올림하는 함수 (round_result의 배열 버전)
+    정수 배열은 round와 마찬가지로 정수 dtype을 유지합니다.
+
+    numpy.round는 값에 10**precision을 곱한 뒤 반올림하므로, 곱셈 오차 때문에 4.4555처럼 십진수로 딱 절반인 것처럼
+    보이는 값에서 round와 다른 결과를 낼 수 있습니다 (round는 float의 정확한 값으로 판단: round(4.4555, 3) == 4.455).
+    곱한 값이 절반에 매우 가깝거나 곱셈이 overflow된 원소만 round로 다시 계산하므로 결과는 round_result와 같습니다.
+    """
+    if precision is None:
+        return values
+    np = get_numpy()
+    array = np.asarray(values)
+    kind = array.dtype.kind
+    if array.ndim == 0 and kind in 'fc':  # 스칼라는 round로 바로 계산
+        value = array.item()
+        if kind == 'c':
+            return array.dtype.type(complex(round(value.real, precision), round(value.imag, precision)))
+        return array.dtype.type(round(value, precision))
+    with np.errstate(over='ignore'):
+        rounded = np.round(array, precision)
+    if kind == 'c':
+        _fix_round_ties(np, array.real, rounded.real, precision)
+        _fix_round_ties(np, array.imag, rounded.imag, precision)
+    elif kind == 'f':
+        _fix_round_ties(np, array, rounded, precision)
+    return rounded
+
+def _fix_round_ties(np, values, rounded, precision: int) -> None:
+    """
+    numpy.round 결과(rounded) 중 round와 다를 수 있는 원소를 round로 다시 계산하는 내부 함수.
+    x·10**precision이 절반(.5)에서 곱셈 오차(상대 오차 약 1e-16)보다 가까우면 곱셈 오차 때문에 반올림 방향이 바뀔 수 있습니다.
+    """
+    with np.errstate(all='ignore'):
+        scaled = values * 10.0 ** precision if precision >= 0 else values / 10.0 ** -precision
+        np.abs(scaled, out=scaled)
+        distance = scaled - np.floor(scaled)
+        distance -= 0.5
+        np.abs(distance, out=distance)
+        scaled *= 1e-15
+        suspect = distance <= scaled  # overflow(inf)된 원소는 distance가 nan이 되므로 아래에서 따로 처리
+        suspect |= np.isinf(scaled) & np.isfinite(values)
+    positions = np.flatnonzero(suspect)
+    if positions.size:
+        rounded.flat[positions] = [round(value, precision) for value in values.flat[positions].tolist()]
+
+def convert_to_radians_array(angles, unit: str = 'radian'):
+    """
+    각도 배열을 라디안 배열로 변환하는 함수 (convert_to_radians의 배열 버전)
+    항상 새로운 float 배열을 반환하므로 호출한 쪽에서 제자리(in-place) 연산에 재사용할 수 있습니다.
+    """
+    np = get_numpy()
+    if unit == 'degree':
+        return np.radians(angles)
+    return np.array(angles, dtype=float)
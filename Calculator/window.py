@@ -0,0 +1,318 @@
+# calculator/window.py
+
+import math
+from array import array
+from typing import Iterable, List, Optional, Union
+
+from .utils import round_result
+
+
+class SlidingWindow:
+    """
+    최근 capacity개 값의 합, 곱, 평균, 분산을 값 하나를 넣거나 뺄 때마다 O(1)로 갱신하는 누적기 클래스.
+
+    매 샘플마다 Calculator.add(*window), multiply(*window)를 다시 계산하는 대신 사용합니다.
+
+    - 값은 고정 크기 링 버퍼(array('d'), 값당 8바이트)에 float로 저장합니다. push는 창이 가득 차면 가장 오래된 값을
+      자동으로 빼고, pop은 가장 오래된 값을 뺍니다.
+    - 합: Neumaier 보정 합으로 넣은 값은 더하고 뺀 값은 뺍니다. inf/nan은 합에 더하지 않고 곱의 0처럼 개수만 세므로,
+      창을 지나가면 합이 다시 유한한 값으로 돌아옵니다. 유한한 값들의 합이 overflow되면 다음 조회 때 버퍼에서 다시 계산합니다.
+    - 곱: 0이 아닌 값들의 곱과 0의 개수를 따로 유지하므로 0이 창을 지나가도 곱이 0에 고정되지 않습니다.
+      0이 아닌 값의 곱이 overflow/underflow되면 다음 조회 때 버퍼에서 다시 계산합니다.
+    - 평균/분산: Welford 방식으로 유한한 값을 넣고 뺄 때 평균과 편차 제곱합을 갱신합니다.
+      창에 inf/nan이 있으면 평균은 합과 같은 inf/nan, 분산은 nan입니다.
+    - 넣고 빼는 연산을 반복하면 부동소수점 오차가 쌓이므로, resum_interval번 갱신할 때마다 버퍼 전체에서
+      값을 다시 계산합니다(resum). 이 비용은 갱신 한 번당 평균 O(capacity / resum_interval)입니다.
+
+    조회 메서드는 Calculator 메서드와 같이 precision 키워드로 결과를 반올림합니다.
+    """
+
+    def __init__(self, capacity: int, resum_interval: Optional[int] = None):
+        """
+        클래스 초기화 함수.
+
+        Args:
+            capacity (int): 창에 유지할 최대 값의 수.
+            resum_interval (Optional[int]): 몇 번 갱신(push/pop)할 때마다 버퍼 전체에서 다시 계산할지.
+                None이면 capacity, 0이면 자동으로 다시 계산하지 않습니다.
+
+        Raises:
+            TypeError: capacity나 resum_interval이 정수가 아닐 경우 발생.
+            ValueError: capacity가 1보다 작거나 resum_interval이 음수일 경우 발생.
+        """
+        if not isinstance(capacity, int) or (resum_interval is not None and not isinstance(resum_interval, int)):
+            raise TypeError("Capacity and resum_interval must be integers.")
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1.")
+        if resum_interval is not None and resum_interval < 0:
+            raise ValueError("Resum_interval must not be negative.")
+        self.capacity = capacity
+        self.resum_interval = capacity if resum_interval is None else resum_interval
+        self._buffer = array('d', bytes(8 * capacity))  # 0.0으로 채운 링 버퍼
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        창의 모든 값을 지우는 함수.
+        """
+        self._start = 0  # 가장 오래된 값의 위치
+        self._count = 0
+        self._reset_aggregates()
+
+    def _reset_aggregates(self) -> None:
+        self._total = 0.0  # 유한한 값들의 합
+        self._compensation = 0.0  # 합에서 잃어버린 하위 자릿수 (Neumaier)
+        self._total_stale = False  # 유한한 값들의 합이 overflow되어 버퍼에서 다시 계산해야 하는지 여부
+        self._positive_infs = 0  # inf의 개수
+        self._negative_infs = 0  # -inf의 개수
+        self._nans = 0  # nan의 개수
+        self._finite = 0  # 유한한 값의 개수 (평균/분산에 사용)
+        self._product = 1.0  # 0이 아닌 값들의 곱
+        self._zeros = 0  # 0의 개수
+        self._product_stale = False  # 0이 아닌 값의 곱을 버퍼에서 다시 계산해야 하는지 여부
+        self._mean = 0.0
+        self._m2 = 0.0  # 평균과의 편차 제곱합
+        self._updates = 0  # 마지막으로 다시 계산한 뒤의 갱신 횟수
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"SlidingWindow(capacity={self.capacity}, len={self._count})"
+
+    @property
+    def is_full(self) -> bool:
+        return self._count == self.capacity
+
+    def values(self) -> List[float]:
+        """
+        창의 값들을 오래된 순서대로 반환하는 함수.
+        """
+        end = self._start + self._count
+        if end <= self.capacity:
+            return self._buffer[self._start:end].tolist()
+        return self._buffer[self._start:].tolist() + self._buffer[:end - self.capacity].tolist()
+
+    def push(self, value: Union[int, float]) -> Optional[float]:
+        """
+        값 하나를 창에 넣는 함수. 창이 가득 차 있으면 가장 오래된 값을 먼저 뺍니다.
+
+        Args:
+            value (Union[int, float]): 넣을 값 (float로 저장됨).
+
+        Returns:
+            Optional[float]: 창에서 밀려난 값 (밀려난 값이 없으면 None).
+        """
+        evicted = self.pop() if self._count == self.capacity else None
+        value = float(value)
+        index = self._start + self._count
+        if index >= self.capacity:
+            index -= self.capacity
+        self._buffer[index] = value
+        self._count += 1
+
+        if not math.isfinite(value):
+            self._count_non_finite(value, 1)
+        else:
+            # 합 (Neumaier)
+            if not self._total_stale:
+                total = self._total
+                t = total + value
+                if not math.isfinite(t):
+                    self._total_stale = True
+                elif abs(total) >= abs(value):
+                    self._compensation += (total - t) + value
+                else:
+                    self._compensation += (value - t) + total
+                self._total = t
+
+            # 평균/분산 (Welford)
+            self._finite += 1
+            delta = value - self._mean
+            self._mean += delta / self._finite
+            self._m2 += delta * (value - self._mean)
+
+        # 곱 (0은 개수만 셈)
+        if value == 0.0:
+            self._zeros += 1
+        else:
+            product = self._product * value
+            self._product = product
+            if product == 0.0 or not math.isfinite(product):
+                self._product_stale = True
+
+        self._updates += 1
+        if self._updates == self.resum_interval:
+            self.resum()
+        return evicted
+
+    def _count_non_finite(self, value: float, step: int) -> None:
+        if value != value:
+            self._nans += step
+        elif value > 0:
+            self._positive_infs += step
+        else:
+            self._negative_infs += step
+
+    def _non_finite(self) -> int:
+        return self._count - self._finite
+
+    def extend(self, values: Iterable[Union[int, float]]) -> None:
+        """
+        여러 값을 차례대로 창에 넣는 함수.
+        """
+        push = self.push
+        for value in values:
+            push(value)
+
+    def pop(self) -> float:
+        """
+        가장 오래된 값을 창에서 빼는 함수.
+
+        Returns:
+            float: 뺀 값.
+
+        Raises:
+            IndexError: 창이 비어 있을 경우 발생.
+        """
+        if not self._count:
+            raise IndexError("pop from an empty window")
+        value = self._buffer[self._start]
+        self._start += 1
+        if self._start == self.capacity:
+            self._start = 0
+        self._count -= 1
+        if not self._count:
+            self._reset_aggregates()
+            return value
+
+        finite_value = math.isfinite(value)
+        if not finite_value:
+            self._count_non_finite(value, -1)
+        elif not self._total_stale:
+            total = self._total
+            t = total - value
+            if abs(total) >= abs(value):
+                self._compensation += (total - t) - value
+            else:
+                self._compensation += (-value - t) + total
+            self._total = t
+
+        if value == 0.0:
+            self._zeros -= 1
+        elif not self._product_stale:
+            product = self._product / value
+            self._product = product
+            if product == 0.0 or not math.isfinite(product):
+                self._product_stale = True
+
+        # Welford 역갱신: 평균에서 값을 빼고, 빼기 전후 평균과의 편차 곱을 제곱합에서 뺌
+        if finite_value:
+            self._finite -= 1
+            if self._finite:
+                delta = value - self._mean
+                self._mean -= delta / self._finite
+                self._m2 -= delta * (value - self._mean)
+            else:
+                self._mean = self._m2 = 0.0
+
+        self._updates += 1
+        if self._updates == self.resum_interval:
+            self.resum()
+        return value
+
+    def resum(self) -> None:
+        """
+        누적된 부동소수점 오차를 없애기 위해 버퍼의 값들로 합, 곱, 평균, 분산을 다시 계산하는 함수 (O(capacity)).
+        """
+        values = self.values()
+        self._reset_aggregates()
+        if not values:
+            return
+        nonzero = [value for value in values if value != 0.0]
+        self._zeros = len(values) - len(nonzero)
+        self._product = math.prod(nonzero)
+        self._product_stale = not (self._product != 0.0 and math.isfinite(self._product))
+        finite = [value for value in values if math.isfinite(value)]
+        for value in values:
+            if not math.isfinite(value):
+                self._count_non_finite(value, 1)
+        self._finite = len(finite)
+        if not finite:
+            return
+        self._resum_total(finite)
+        self._mean = math.fsum(value / len(finite) for value in finite)
+        self._m2 = math.fsum((value - self._mean) * (value - self._mean) for value in finite)  # overflow는 inf
+
+    def _resum_total(self, finite: List[float]) -> None:
+        # 유한한 값들의 합을 정확히 다시 계산 (합이 float 범위를 넘으면 보정 없는 합을 쓰고 다시 계산 대상으로 표시)
+        try:
+            total = math.fsum(finite)
+            # 반올림으로 잃은 부분을 보정값으로 유지하여, 큰 값이 빠진 뒤에도 작은 값들의 합이 정확하게 남도록 함
+            self._compensation = math.fsum(finite + [-total])
+            self._total, self._total_stale = total, False
+        except OverflowError:
+            self._total, self._total_stale, self._compensation = sum(finite), True, 0.0
+
+    def sum(self, precision: Optional[int] = None) -> float:
+        """
+        창의 값들의 합을 반환하는 함수 (Calculator.add(*window)와 같은 값). 창이 비어 있으면 0.0.
+        창에 inf/nan이 있거나 합이 float 범위를 넘으면 add와 같이 inf/nan을 반환합니다.
+        """
+        if self._non_finite():
+            return round_result(self._non_finite_sum(), precision)
+        if self._total_stale:
+            self._resum_total(self.values())
+            if self._total_stale:
+                return round_result(self._total, precision)
+        return round_result(self._total + self._compensation, precision)
+
+    def _non_finite_sum(self) -> float:
+        # inf/nan이 있는 창의 합: nan이 있거나 inf와 -inf가 함께 있으면 nan, 아니면 그 부호의 inf
+        if self._nans or (self._positive_infs and self._negative_infs):
+            return math.nan
+        return math.inf if self._positive_infs else -math.inf
+
+    def product(self, precision: Optional[int] = None) -> float:
+        """
+        창의 값들의 곱을 반환하는 함수 (Calculator.multiply(*window)와 같은 값). 창이 비어 있으면 1.0.
+        """
+        if self._zeros:
+            return round_result(0.0, precision)
+        if self._product_stale:
+            # overflow/underflow 이후에는 나눗셈으로 되돌릴 수 없으므로 버퍼에서 다시 계산
+            self._product = math.prod(value for value in self.values() if value != 0.0)
+            self._product_stale = not (self._product != 0.0 and math.isfinite(self._product))
+        return round_result(self._product, precision)
+
+    def mean(self, precision: Optional[int] = None) -> float:
+        """
+        창의 값들의 평균을 반환하는 함수.
+
+        Raises:
+            ValueError: 창이 비어 있을 경우 발생.
+        """
+        if not self._count:
+            raise ValueError("mean requires at least one value.")
+        if self._non_finite():
+            return round_result(self._non_finite_sum(), precision)
+        return round_result(self._mean, precision)
+
+    def variance(self, precision: Optional[int] = None, sample: bool = False) -> float:
+        """
+        창의 값들의 분산을 반환하는 함수.
+
+        Args:
+            precision (Optional[int]): 결과의 소수점 자릿수.
+            sample (bool): True이면 표본 분산(n - 1로 나눔), False이면 모분산(n으로 나눔). 기본값은 False.
+
+        Raises:
+            ValueError: 값이 부족할 경우 발생 (모분산은 1개, 표본 분산은 2개 이상 필요).
+        """
+        divisor = self._count - 1 if sample else self._count
+        if divisor < 1:
+            raise ValueError(f"variance requires at least {2 if sample else 1} value(s).")
+        if self._non_finite():
+            return math.nan
+        # 뺄셈 오차로 아주 작은 음수가 될 수 있으므로 0으로 자름
+        return round_result(max(self._m2, 0.0) / divisor, precision)